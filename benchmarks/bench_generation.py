@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Compare the per-value cost of Gen.generate() and Gen.generate_batch(n).
+
+The batch column uses NumPy if it is installed; the pure column shows
+the pure-Python engine for comparison.
+"""
+import timeit
+
+from papylon import engine
+from papylon.gen import choose, constant, frequency
+from papylon.arbitrary import arb_int, arb_float, arb_char, arb_date, arb_str, arb_array
+
+N = 10000
+
+
+def per_value_ns(func, number=5):
+    return min(timeit.repeat(func, number=1, repeat=number)) / N * 1e9
+
+
+def main():
+    cases = [
+        ("choose(int)", lambda: choose(-100, 100)),
+        ("choose(float)", lambda: choose(-1.0, 1.0)),
+        ("constant", lambda: constant(1)),
+        ("frequency(200)", lambda: frequency([(i + 1, constant(i)) for i in range(200)])),
+        ("arb_int", lambda: arb_int().gen),
+        ("arb_float", lambda: arb_float().gen),
+        ("arb_date", lambda: arb_date().gen),
+        ("arb_char", lambda: arb_char().gen),
+        ("arb_str", lambda: arb_str().gen),
+        ("arb_array(q)", lambda: arb_array('q', max_length=1000).gen),
+        ("arb_array(d)", lambda: arb_array('d', max_length=1000, min_value=0.0, max_value=1.0).gen),
+    ]
+    print("{0:<16}{1:>14}{2:>14}{3:>14}{4:>10}".format("gen", "generate", "pure", "batch", "speedup"))
+    for name, make in cases:
+        gen = make()
+        single = per_value_ns(lambda: [gen.generate() for _ in range(N)])
+        use_numpy, engine.USE_NUMPY = engine.USE_NUMPY, False
+        pure = per_value_ns(lambda: gen.generate_batch(N))
+        engine.USE_NUMPY = use_numpy
+        batch = per_value_ns(lambda: gen.generate_batch(N))
+        print("{0:<16}{1:>11.0f} ns{2:>11.0f} ns{3:>11.0f} ns{4:>9.1f}x".format(
+            name, single, pure, batch, single / batch))
+
+
+if __name__ == '__main__':
+    main()
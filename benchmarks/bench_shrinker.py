@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""Measure the cost of the first shrink candidates of large numbers."""
+import itertools
+import timeit
+
+from papylon.shrinker import IntShrinker, FloatShrinker
+
+
+def first_ns(shrinker, value, k, number=2000):
+    elapsed = timeit.timeit(lambda: list(itertools.islice(shrinker.shrink(value), k)), number=number)
+    return elapsed / number * 1e9
+
+
+def main():
+    cases = [
+        ("int 2**62", IntShrinker(), 2 ** 62),
+        ("int 2**1000", IntShrinker(), 2 ** 1000),
+        ("float 1e10", FloatShrinker(), 1e10),
+        ("float 1e308", FloatShrinker(), 1e308),
+    ]
+    print("{0:<14}{1:>14}{2:>14}{3:>14}".format("value", "first 1", "first 10", "all"))
+    for name, shrinker, value in cases:
+        print("{0:<14}{1:>11.0f} ns{2:>11.0f} ns{3:>11.0f} ns".format(
+            name, first_ns(shrinker, value, 1), first_ns(shrinker, value, 10),
+            first_ns(shrinker, value, None, number=200)))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,26 @@
 """Classes and functions to generate arbitrary arguments."""
 
 import sys
-import random
+import array
+import bisect
 import struct
 import datetime
+import itertools
+import unicodedata
 
-from papylon.gen import Gen, choose, frequency
+from papylon import engine
+from papylon.gen import Gen, choose
 from papylon.shrinker import (
     IntShrinker, FloatShrinker, CharShrinker,
-    DateShrinker, ListShrinker, StrShrinker)
+    DateShrinker, ListShrinker, StrShrinker, ArrayShrinker)
 
 
 class AbstractArbitrary:
     """An abstract class to make arbitrary arguments."""
 
+    # whether `arbitrary` and `arbitrary_batch` take the size of arguments
+    sized = False
+
     def arbitrary(self):
         """
         Make arbitrary arguments.
@@ -23,6 +30,19 @@ class AbstractArbitrary:
 
         raise NotImplementedError("AbstractArbitrary#arbitrary")
 
+    def arbitrary_batch(self, n):
+        """
+        Make `n` arbitrary arguments at once.
+
+        :param n: int
+            The number of arguments to make.
+
+        :return: list
+            The list of `n` arguments.
+        """
+
+        return [self.arbitrary() for _ in range(n)]
+
     def shrink(self, value):
         """
         Shrink arguments with a given value.
@@ -35,12 +55,27 @@ class AbstractArbitrary:
 
         raise NotImplementedError("AbstractArbitrary#shrink")
 
+    def set_random(self, rng):
+        """
+        Make arbitrary arguments with a given random source.
+
+        It does nothing if the arbitrary has no Gen, e.g. a subclass
+        which only implements `arbitrary` and `shrink`.
+
+        :param rng: random.Random | int
+            The random source or its seed.
+        """
+
+        gen = getattr(self, 'gen', None)
+        if gen is not None:
+            gen.set_random(rng)
+
 
 class ArbInteger(AbstractArbitrary):
     """An arbitrary integer."""
 
-    def __init__(self):
-        self.gen = choose(-1-sys.maxsize, sys.maxsize)
+    def __init__(self, rng=None):
+        self.gen = choose(-1-sys.maxsize, sys.maxsize, rng=rng)
         self.shrinker = IntShrinker()
 
     def arbitrary(self):
@@ -53,6 +88,19 @@ class ArbInteger(AbstractArbitrary):
 
         return self.gen.generate()
 
+    def arbitrary_batch(self, n):
+        """
+        Return a list of `n` generated int values.
+
+        :param n: int
+            The number of values to generate.
+
+        :return: list
+            The list of generated values.
+        """
+
+        return self.gen.generate_batch(n)
+
     def shrink(self, value):
         """
         Return an int iterator of shrunk result.
@@ -70,14 +118,18 @@ class ArbInteger(AbstractArbitrary):
 class ArbFloat(AbstractArbitrary):
     """An arbitrary floating point number."""
 
-    def __init__(self):
-        def gen():
+    def __init__(self, rng=None):
+        def gen(source):
             while True:
-                s = random.randint(0, 1)                # sign
-                e = random.randint(0, 0x7ff)            # exponent
-                f = random.randint(0, 0xfffffffffffff)  # fraction
+                s = source.randint(0, 1)                # sign
+                e = source.randint(0, 0x7ff)            # exponent
+                f = source.randint(0, 0xfffffffffffff)  # fraction
                 yield struct.unpack('d', struct.pack('Q', (s << 63) | (e << 52) | f))[0]
-        self.gen = Gen(gen)
+
+        def batch(source, n):
+            # sign, exponent and fraction are uniform, and so are all the 64 bits
+            return engine.float64s(source, n)
+        self.gen = Gen(gen, rng=rng, batch=batch)
         self.shrinker = FloatShrinker()
 
     def arbitrary(self):
@@ -90,6 +142,19 @@ class ArbFloat(AbstractArbitrary):
 
         return self.gen.generate()
 
+    def arbitrary_batch(self, n):
+        """
+        Return a list of `n` generated float values.
+
+        :param n: int
+            The number of values to generate.
+
+        :return: list
+            The list of generated values.
+        """
+
+        return self.gen.generate_batch(n)
+
     def shrink(self, value):
         """
         Return a float iterator of shrunk result.
@@ -104,12 +169,80 @@ class ArbFloat(AbstractArbitrary):
         return self.shrinker.shrink(value)
 
 
+_CODE_POINT_TABLES = {}
+
+
+def _in_categories(category, allowed):
+    return category in allowed or category[0] in allowed
+
+
+def code_point_table(categories=None, astral=False):
+    """
+    Return the sorted array of code points which characters are drawn
+    from, except surrogates.
+
+    The arrays are cached, so a table with `categories` is built by
+    looking up all the code points only once.
+
+    :param categories: list
+        The Unicode general categories of characters such as 'Lu', or
+        their major classes such as 'L'. Defaults to None, which means
+        all the characters including unassigned ones.
+    :param astral: bool
+        Whether to include characters out of the Basic Multilingual
+        Plane. Defaults to False.
+
+    :return: array.array
+        The array of code points whose type code is
+        `engine.CODE_POINT_TYPE`.
+    """
+
+    key = (None if categories is None else frozenset(categories), astral)
+    table = _CODE_POINT_TABLES.get(key)
+    if table is None:
+        code_points = itertools.chain(range(0xD800), range(0xDFFF+1, 0x10FFFF+1 if astral else 0xFFFF+1))
+        if categories is not None:
+            allowed = key[0]
+            code_points = (c for c in code_points if _in_categories(unicodedata.category(chr(c)), allowed))
+        table = array.array(engine.CODE_POINT_TYPE, code_points)
+        if not table:
+            raise ValueError("Argument `categories` should match at least 1 character.")
+        _CODE_POINT_TABLES[key] = table
+    return table
+
+
 class ArbChar(AbstractArbitrary):
     """An arbitrary character."""
 
-    def __init__(self):
-        self.gen = frequency([(0xD800, choose(0, 0xD800-1).map(chr)),
-                              (0xFFFF-0xDFFF, choose(0xdFFF+1, 0xFFFF).map(chr))])
+    def __init__(self, rng=None, categories=None, astral=False):
+        """
+        Initialize an ArbChar instance.
+
+        Every character is drawn from the table of `code_point_table`
+        uniformly.
+
+        :param rng: random.Random | int
+            The random source or its seed. Defaults to None.
+        :param categories: list
+            The Unicode general categories of characters or their major
+            classes. Defaults to None, which means all the characters.
+        :param astral: bool
+            Whether to draw characters out of the Basic Multilingual
+            Plane. Defaults to False.
+        """
+
+        code_points = code_point_table(categories, astral)
+
+        def gen(source):
+            size = len(code_points)
+            while True:
+                yield chr(code_points[int(source.random() * size)])
+
+        def batch(source, n):
+            return list(engine.text(source, code_points, n))
+
+        self.code_points = code_points
+        self.gen = Gen(gen, rng=rng, batch=batch)
         self.shrinker = CharShrinker()
 
     def arbitrary(self):
@@ -120,9 +253,21 @@ class ArbChar(AbstractArbitrary):
             A generated value.
         """
 
-        # self.gen generates a mapped Gen instance
         return self.gen.generate()
 
+    def arbitrary_batch(self, n):
+        """
+        Return a list of `n` generated char values.
+
+        :param n: int
+            The number of values to generate.
+
+        :return: list
+            The list of generated values.
+        """
+
+        return self.gen.generate_batch(n)
+
     def shrink(self, value):
         """
         Return a char iterator of shrunk result.
@@ -131,16 +276,21 @@ class ArbChar(AbstractArbitrary):
             The 1-length str value of counter-example.
 
         :return:
-            The char iterator which is shrunk with a given value.
+            The char iterator which is shrunk with a given value, and
+            its characters are in the table of the ArbChar.
         """
 
-        return self.shrinker.shrink(value)
+        return (c for c in self.shrinker.shrink(value) if self._contains(c))
+
+    def _contains(self, c):
+        i = bisect.bisect_left(self.code_points, ord(c))
+        return i < len(self.code_points) and self.code_points[i] == ord(c)
 
 
 class ArbDate(AbstractArbitrary):
     """An arbitrary datetime."""
 
-    def __init__(self):
+    def __init__(self, rng=None):
         days_to_month_366 = [0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366]
         days_to_month_365 = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365]
 
@@ -153,16 +303,31 @@ class ArbDate(AbstractArbitrary):
             days = days_to_month_366 if is_leap_year(year) else days_to_month_365
             return days[month] - days[month - 1]
 
-        def gen():
+        def gen(source):
             while True:
-                year = random.randint(1, 9999)
-                month = random.randint(1, 12)
-                day = random.randint(1, days_in_month(year, month))
-                hour = random.randint(0, 23)
-                minute = random.randint(0, 59)
-                second = random.randint(0, 59)
+                year = source.randint(1, 9999)
+                month = source.randint(1, 12)
+                day = source.randint(1, days_in_month(year, month))
+                hour = source.randint(0, 23)
+                minute = source.randint(0, 59)
+                second = source.randint(0, 59)
                 yield datetime.datetime(year, month, day, hour, minute, second)
-        self.gen = Gen(gen)
+
+        # every month has 28, 29, 30 or 31 days, which all divide it
+        days_lcm = 377580
+
+        def batch(source, n):
+            years = engine.integers(source, 1, 9999, n)
+            months = engine.integers(source, 1, 12, n)
+            days = engine.integers(source, 0, days_lcm - 1, n)
+            hours = engine.integers(source, 0, 23, n)
+            minutes = engine.integers(source, 0, 59, n)
+            seconds = engine.integers(source, 0, 59, n)
+            return [datetime.datetime(year, month, 1 + day * days_in_month(year, month) // days_lcm,
+                                      hour, minute, second)
+                    for year, month, day, hour, minute, second
+                    in zip(years, months, days, hours, minutes, seconds)]
+        self.gen = Gen(gen, rng=rng, batch=batch)
         self.shrinker = DateShrinker()
 
     def arbitrary(self):
@@ -175,6 +340,19 @@ class ArbDate(AbstractArbitrary):
 
         return self.gen.generate()
 
+    def arbitrary_batch(self, n):
+        """
+        Return a list of `n` generated datetime values.
+
+        :param n: int
+            The number of values to generate.
+
+        :return: list
+            The list of generated values.
+        """
+
+        return self.gen.generate_batch(n)
+
     def shrink(self, value):
         """
         Return a datetime iterator of shrunk result.
@@ -192,25 +370,76 @@ class ArbDate(AbstractArbitrary):
 class ArbList(AbstractArbitrary):
     """A arbitrary list."""
 
-    def __init__(self, arb_type, max_length):
-        def gen():
+    sized = True
+
+    def __init__(self, arb_type, max_length, rng=None):
+        def gen(source):
             min_length = 0
             while True:
-                length = random.randint(min_length, max_length)
-                yield [arb_type.arbitrary() for _ in range(length)]
-        self.gen = Gen(gen)
+                length = source.randint(min_length, self._max_length())
+                if self.size is not None and arb_type.sized:
+                    yield [arb_type.arbitrary(self.size) for _ in range(length)]
+                else:
+                    yield [arb_type.arbitrary() for _ in range(length)]
+        self.arb_type = arb_type
+        self.max_length = max_length
+        self.size = None
+        self.gen = Gen(gen, rng=rng)
         self.shrinker = ListShrinker()
+        if rng is not None:
+            self._set_element_random()
 
-    def arbitrary(self):
+    def _max_length(self):
+        return self.max_length if self.size is None else min(self.max_length, self.size)
+
+    def set_random(self, rng):
+        """
+        Make arbitrary lists and their elements with a given random source.
+
+        :param rng: random.Random | int
+            The random source or its seed.
+        """
+
+        self.gen.set_random(rng)
+        self._set_element_random()
+
+    def _set_element_random(self):
+        set_random = getattr(self.arb_type, 'set_random', None)
+        if set_random is not None:
+            set_random(self.gen.random)
+
+    def arbitrary(self, size=None):
         """
         Return a generated list value.
 
+        :param size: int
+            The maximum length of the list, which is also passed to
+            sized elements. Defaults to None, which means `max_length`.
+
         :return: list
             A generated value.
         """
 
+        self.size = size
         return self.gen.generate()
 
+    def arbitrary_batch(self, n, size=None):
+        """
+        Return a list of `n` generated list values.
+
+        :param n: int
+            The number of values to generate.
+        :param size: int
+            The maximum length of the lists, which is also passed to
+            sized elements. Defaults to None, which means `max_length`.
+
+        :return: list
+            The list of generated values.
+        """
+
+        self.size = size
+        return self.gen.generate_batch(n)
+
     def shrink(self, value):
         """
         Return a list iterator of shrunk result.
@@ -228,25 +457,96 @@ class ArbList(AbstractArbitrary):
 class ArbStr(AbstractArbitrary):
     """A arbitrary string."""
 
-    def __init__(self, max_length):
-        def gen():
-            min_length = 0
+    sized = True
+
+    def __init__(self, max_length, rng=None, alphabet=None, length=None, categories=None, astral=False):
+        """
+        Initialize an ArbStr instance.
+
+        All the characters of a batch of strings are drawn at once.
+
+        :param max_length: int
+            The maximum length of a string.
+        :param rng: random.Random | int
+            The random source or its seed. Defaults to None.
+        :param alphabet: str
+            The characters to draw. Defaults to None, which means the
+            characters of `categories` and `astral`.
+        :param length: function
+            The function which takes the random source and returns the
+            length of a string. Defaults to None, which means a length
+            between 0 and `max_length` uniformly.
+        :param categories: list
+            The Unicode general categories of characters or their major
+            classes, unless `alphabet` is given. Defaults to None.
+        :param astral: bool
+            Whether to draw characters out of the Basic Multilingual
+            Plane, unless `alphabet` is given. Defaults to False.
+        """
+
+        if alphabet is None:
+            code_points = code_point_table(categories, astral)
+        else:
+            code_points = array.array(engine.CODE_POINT_TYPE, sorted(set(map(ord, alphabet))))
+            if not code_points:
+                raise ValueError("Argument `alphabet` should have at least 1 character.")
+
+        def lengths(source, n):
+            if length is None:
+                return engine.integers(source, 0, max_length if self.size is None else min(max_length, self.size), n)
+            return [length(source) for _ in range(n)]
+
+        def gen(source):
             while True:
-                length = random.randint(min_length, max_length)
-                yield "".join(arb_char().arbitrary() for _ in range(length))
-        self.gen = Gen(gen)
+                yield engine.text(source, code_points, lengths(source, 1)[0])
+
+        def batch(source, n):
+            ls = lengths(source, n)
+            chars = engine.text(source, code_points, sum(ls))
+            strs = []
+            begin = 0
+            for l in ls:
+                strs.append(chars[begin:begin+l])
+                begin += l
+            return strs
+
+        self.code_points = code_points
+        self.size = None
+        self.gen = Gen(gen, rng=rng, batch=batch)
         self.shrinker = StrShrinker()
 
-    def arbitrary(self):
+    def arbitrary(self, size=None):
         """
         Return a generated str value.
 
+        :param size: int
+            The maximum length of the str, unless `length` is given.
+            Defaults to None, which means `max_length`.
+
         :return: str
             A generated value.
         """
 
+        self.size = size
         return self.gen.generate()
 
+    def arbitrary_batch(self, n, size=None):
+        """
+        Return a list of `n` generated str values.
+
+        :param n: int
+            The number of values to generate.
+        :param size: int
+            The maximum length of the strs, unless `length` is given.
+            Defaults to None, which means `max_length`.
+
+        :return: list
+            The list of generated values.
+        """
+
+        self.size = size
+        return self.gen.generate_batch(n)
+
     def shrink(self, value):
         """
         Return a str iterator of shrunk result.
@@ -261,51 +561,242 @@ class ArbStr(AbstractArbitrary):
         return self.shrinker.shrink(value)
 
 
-def arb_int():
+class ArbArray(AbstractArbitrary):
+    """A arbitrary array of numbers."""
+
+    sized = True
+
+    def __init__(self, typecode, max_length, rng=None, min_value=None, max_value=None):
+        """
+        Initialize an ArbArray instance.
+
+        All the numbers of a batch of arrays are drawn into one array at
+        once, which is sliced into the arrays, so no number is boxed as
+        a Python object unless bounds are given without NumPy.
+
+        :param typecode: str
+            The type code of `array.array`, which is one of
+            `engine.ARRAY_TYPECODES`.
+        :param max_length: int
+            The maximum length of an array.
+        :param rng: random.Random | int
+            The random source or its seed. Defaults to None.
+        :param min_value: int | float
+            The minimum number. Defaults to None, which means the
+            minimum of the type for ints, and any bits for floats.
+        :param max_value: int | float
+            The maximum number. Defaults to None, which means the
+            maximum of the type for ints, and any bits for floats.
+        """
+
+        if typecode not in engine.ARRAY_TYPECODES:
+            raise ValueError("Argument `typecode` should be one of '{0}'.".format(engine.ARRAY_TYPECODES))
+
+        def lengths(source, n):
+            return engine.integers(source, 0, self._max_length(), n)
+
+        def gen(source):
+            while True:
+                yield engine.arrays(source, typecode, lengths(source, 1)[0], min_value, max_value)
+
+        def batch(source, n):
+            ls = lengths(source, n)
+            numbers = engine.arrays(source, typecode, sum(ls), min_value, max_value)
+            arrays = []
+            begin = 0
+            for l in ls:
+                arrays.append(numbers[begin:begin+l])
+                begin += l
+            return arrays
+
+        self.typecode = typecode
+        self.max_length = max_length
+        self.size = None
+        self.gen = Gen(gen, rng=rng, batch=batch)
+        self.shrinker = ArrayShrinker(min_value, max_value)
+
+    def _max_length(self):
+        return self.max_length if self.size is None else min(self.max_length, self.size)
+
+    def arbitrary(self, size=None):
+        """
+        Return a generated array value.
+
+        :param size: int
+            The maximum length of the array. Defaults to None, which
+            means `max_length`.
+
+        :return: array.array
+            A generated value.
+        """
+
+        self.size = size
+        return self.gen.generate()
+
+    def arbitrary_batch(self, n, size=None):
+        """
+        Return a list of `n` generated array values.
+
+        :param n: int
+            The number of values to generate.
+        :param size: int
+            The maximum length of the arrays. Defaults to None, which
+            means `max_length`.
+
+        :return: list
+            The list of generated values.
+        """
+
+        self.size = size
+        return self.gen.generate_batch(n)
+
+    def shrink(self, value):
+        """
+        Return an array iterator of shrunk result.
+
+        :param value: array.array
+            The array value of counter-example.
+
+        :return:
+            The array iterator which is shrunk with a given value.
+        """
+
+        return self.shrinker.shrink(value)
+
+
+class ArbIntegrated(AbstractArbitrary):
+    """An arbitrary value shrunk along the tree its Gen generates."""
+
+    def __init__(self, gen):
+        self.gen = gen
+        self._trees = {}
+
+    def forget(self):
+        """
+        Drop the trees of the values generated so far.
+
+        The trees are kept across calls of `arbitrary` and
+        `arbitrary_batch`, so an instance used for several arguments
+        shrinks all of them. `PropExecutor` calls it before generating
+        each block of arguments.
+        """
+
+        self._trees.clear()
+
+    def _keep(self, tree):
+        # keyed by identity, since values may be unhashable; the trees
+        # keep their values alive, so the ids aren't reused meanwhile
+        self._trees[id(tree.value)] = tree
+        return tree.value
+
+    def arbitrary(self):
+        """
+        Return a generated value, keeping its tree to shrink it.
+
+        :return:
+            A generated value.
+        """
+
+        return self._keep(self.gen.generate_tree())
+
+    def arbitrary_batch(self, n):
+        """
+        Return a list of `n` generated values, keeping their trees to
+        shrink them.
+
+        :param n: int
+            The number of values to generate.
+
+        :return: list
+            The list of generated values.
+        """
+
+        return [self._keep(self.gen.generate_tree()) for _ in range(n)]
+
+    def shrink(self, value):
+        """
+        Return an iterator of the shrunk values in the tree of a value.
+
+        A value which wasn't generated by this instance since `forget`
+        was called last, e.g. one loaded from a database, is shrunk along
+        `self.gen.tree_of(value)`.
+
+        :param value:
+            The value of counter-example.
+
+        :return:
+            The iterator of the children of the value in its tree.
+        """
+
+        tree = self._trees.get(id(value))
+        if tree is None or tree.value is not value:
+            tree = self.gen.tree_of(value)
+        return (self._keep(child) for child in tree.children())
+
+
+def arb_int(rng=None):
     """
     Return an instance of ArbInteger.
 
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
+
     :return:
         An instance of ArbInteger.
     """
 
-    return ArbInteger()
+    return ArbInteger(rng)
 
 
-def arb_float():
+def arb_float(rng=None):
     """
     Return an instance of ArbFloat.
 
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
+
     :return:
         An instance of ArbFloat.
     """
 
-    return ArbFloat()
+    return ArbFloat(rng)
 
 
-def arb_char():
+def arb_char(rng=None, categories=None, astral=False):
     """
     Return an instance of ArbChar.
 
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
+    :param categories: list
+        The Unicode general categories of characters or their major
+        classes. Defaults to None, which means all the characters.
+    :param astral: bool
+        Whether to draw characters out of the Basic Multilingual Plane.
+        Defaults to False.
+
     :return: ArbChar
         An instance of ArbChar.
     """
 
-    return ArbChar()
+    return ArbChar(rng, categories, astral)
 
 
-def arb_date():
+def arb_date(rng=None):
     """
     Return an instance of ArbDate.
 
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
+
     :return:
         An instance of ArbDate.
     """
 
-    return ArbDate()
+    return ArbDate(rng)
 
 
-def arb_list(arb_type, max_length=100):
+def arb_list(arb_type, max_length=100, rng=None):
     """
     Return an instance of ArbList.
 
@@ -313,26 +804,71 @@ def arb_list(arb_type, max_length=100):
         The type of arbitrary.
     :param max_length: int
         The length of an arbitrary lists. Defaults to 100.
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
 
     :return: list
         An instance of ArbList.
     """
 
-    return ArbList(arb_type, max_length=max_length)
+    return ArbList(arb_type, max_length=max_length, rng=rng)
 
 
-def arb_str(max_length=20):
+def arb_str(max_length=20, rng=None, alphabet=None, length=None, categories=None, astral=False):
     """
     Return an instance of ArbStr.
 
     :param max_length: int
         The length of an arbitrary string. Defaults to 20.
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
+    :param alphabet: str
+        The characters to draw. Defaults to None, which means the
+        characters of `categories` and `astral`.
+    :param length: function
+        The function which takes the random source and returns the
+        length of a string. Defaults to None, which means a length
+        between 0 and `max_length` uniformly.
+    :param categories: list
+        The Unicode general categories of characters or their major
+        classes, unless `alphabet` is given. Defaults to None.
+    :param astral: bool
+        Whether to draw characters out of the Basic Multilingual Plane,
+        unless `alphabet` is given. Defaults to False.
 
     :return: str
         An instance of ArbStr.
     """
 
-    return ArbStr(max_length=max_length)
+    return ArbStr(max_length=max_length, rng=rng, alphabet=alphabet, length=length, categories=categories,
+                  astral=astral)
+
+
+def arb_array(typecode, max_length=100, rng=None, min_value=None, max_value=None):
+    """
+    Return an instance of ArbArray.
+
+    The length of arrays is capped by the size of arguments if
+    `PropChecker` is given `max_size`, which grows up to it over runs.
+
+    :param typecode: str
+        The type code of `array.array`, such as 'q' or 'd'.
+    :param max_length: int
+        The maximum length of an array. Defaults to 100.
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
+    :param min_value: int | float
+        The minimum number. Defaults to None, which means the minimum of
+        the type for ints, and any bits for floats.
+    :param max_value: int | float
+        The maximum number. Defaults to None, which means the maximum of
+        the type for ints, and any bits for floats.
+
+    :return: ArbArray
+        The instance of ArbArray.
+    """
+
+    return ArbArray(typecode, max_length, rng=rng, min_value=min_value, max_value=max_value)
 
 
 def from_gen(gen):
@@ -360,6 +896,33 @@ def from_gen(gen):
     return arb
 
 
+def from_gen_integrated(gen):
+    """
+    Return an instance of Arbitrary which shrinks values along the trees
+    a generator generates.
+
+    Unlike `from_gen`, values of a Gen with integrated shrinking, such
+    as `gen.choose`, are shrunk even after `map`, `such_that` and
+    `frequency`, and the shrunk values are always ones the Gen could
+    generate.
+
+    The trees are kept by the process which generated the values, so
+    `PropChecker` generates a run failed on a worker again before
+    shrinking it. A counter-example replayed from an `ExampleDatabase`
+    has no tree, and is shrunk along `gen.tree_of`, which can't shrink
+    mapped values; check the property with `for_all_choices` to save
+    and shrink the choices of the arguments instead.
+
+    :param gen: Gen
+        A generator.
+
+    :return: ArbIntegrated
+        The instance of ArbIntegrated.
+    """
+
+    return ArbIntegrated(gen)
+
+
 def from_gen_shrink(gen, shrinker):
     """
     Return an instance of Arbitrary from a generator and a shrinker.
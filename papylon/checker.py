@@ -1,8 +1,73 @@
 """Classes and functions to check properties and for checked results."""
 
+import os
 import sys
+import json
+import time
+import random
+import warnings
+import functools
+import traceback
 from papylon.gen import StopGeneration
-from papylon.utils import print_result, print_result_in_group, assert_result
+from papylon.prop import PropTimer
+from papylon.database import prop_key
+from papylon.profiler import CProfiler
+from papylon.utils import print_result, print_result_in_group, assert_result, multiprocessing_context
+
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[rank - 1]
+
+
+class CheckTiming:
+    """Times spent in the phases of checking a property."""
+
+    def __init__(self, total_ns, latencies_ns, generation_ns, property_ns, shrink_ns):
+        """
+        Initialize a CheckTiming instance.
+
+        :param total_ns: int
+            The nanoseconds to check the property in total.
+        :param latencies_ns: list
+            The nanoseconds of each run, including its shrinking.
+        :param generation_ns: int
+            The nanoseconds to generate arguments.
+        :param property_ns: int
+            The nanoseconds to execute the property, except shrinking.
+        :param shrink_ns: int
+            The nanoseconds to shrink arguments.
+        """
+
+        latencies_ns = sorted(latencies_ns)
+        self.total_ns = total_ns
+        self.run_count = len(latencies_ns)
+        self.p50_ns = _percentile(latencies_ns, 50)
+        self.p99_ns = _percentile(latencies_ns, 99)
+        self.generation_ns = generation_ns
+        self.property_ns = property_ns
+        self.shrink_ns = shrink_ns
+
+    @property
+    def tests_per_second(self):
+        """
+        Return the throughput of runs.
+
+        :return: float
+            The number of runs per second.
+        """
+
+        return self.run_count * 1e9 / self.total_ns if self.total_ns > 0 else 0.0
+
+
+class LowAcceptanceWarning(UserWarning):
+    """A warning that predicates of Gens rejected most generated values."""
+
+
+class DatabaseKeyWarning(UserWarning):
+    """A warning that a property has no key to keep it in a database."""
 
 
 class CheckResult:
@@ -17,6 +82,16 @@ class CheckResult:
     def __init__(self, status):
         self.status = status
         self.result = None
+        self.seed = None
+        self.run_seed = None
+        self.run_offset = None
+        self.run_size = None
+        self.cache_hits = 0
+        self.exhausted_budget = None
+        self.timing = None
+        self.choices = None
+        self.acceptance_rates = None
+        self.replayable = True
 
     @staticmethod
     def pass_all(count):
@@ -106,7 +181,7 @@ class CheckResult:
             The occured exception.
 
         :param ex_traceback: ex_traceback
-            The traceback object.
+            The traceback object, or the list of its formatted lines.
 
         :return: CheckResult
             The error result out of checking properties.
@@ -176,49 +251,608 @@ class CheckResult:
         return self.result
 
 
+def _derive_seed(seed, index):
+    """
+    Derive an independent 64-bit seed from `seed` and `index`.
+
+    This is the finalizer of SplitMix64, which spreads consecutive
+    indices over the whole seed space.
+    """
+
+    z = (seed + (index + 1) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return z ^ (z >> 31)
+
+
+def _to_check_result(run_count, prop_result):
+    if prop_result.has_finished():
+        _, inputs, is_valid, shrunk_number = prop_result.get()
+        if is_valid:
+            return None
+        result = CheckResult.falsify(run_count, inputs, shrunk_number)
+    else:
+        _, inputs, error = prop_result.get()
+
+        # failed to generate?
+        if type(error) == StopGeneration:
+            result = CheckResult.fail_to_generate(run_count, error.trial_to_generate)
+        else:
+            result = CheckResult.error(run_count, inputs, error)
+    result.cache_hits = prop_result.cache_hits
+    result.exhausted_budget = prop_result.exhausted_budget
+    result.choices = getattr(prop_result, 'choices', None)
+    return result
+
+
+def _use_random(prop, rng):
+    set_random = getattr(prop, 'set_random', None)
+    if set_random is not None:
+        set_random(rng)
+
+
+def _is_out_of_time(deadline, started, run_count):
+    """
+    Return whether the next run would end after `deadline`, estimating
+    its cost from the average of `run_count` runs since `started`.
+    """
+
+    now = time.monotonic()
+    cost = (now - started) / run_count if run_count > 0 else 0
+    return now + cost > deadline
+
+
+def _use_timer(prop, timer):
+    set_timer = getattr(prop, 'set_timer', None)
+    if set_timer is not None:
+        set_timer(timer)
+
+
+def _rejections(prop):
+    rejections = getattr(prop, 'rejections', None)
+    return None if rejections is None else rejections()
+
+
+def _arity(prop):
+    arbs = getattr(getattr(prop, 'executor', None), 'arbs', None)
+    return None if arbs is None else len(arbs)
+
+
+def _is_replayable(prop):
+    """
+    Return whether runs of a property can be made again from their
+    seeds, which they can't if the Gen of an argument is adaptive.
+    """
+
+    arbs = getattr(getattr(prop, 'executor', None), 'arbs', None) or []
+    return not any(getattr(getattr(arb, 'gen', None), 'adaptive', False) for arb in arbs)
+
+
+def _count_rejections(before, after):
+    """
+    Return the list of [draws, rejections] made between two counts of
+    `_rejections`, or None if the property doesn't count them.
+    """
+
+    if before is None or after is None:
+        return None
+    return [[a_draws - b_draws, a_rejections - b_rejections]
+            for (b_draws, b_rejections), (a_draws, a_rejections) in zip(before, after)]
+
+
+def _size_of(block_begin, block_end, count, max_size):
+    """
+    Return the size of arguments in the block from `block_begin` to
+    `block_end`, which grows up to `max_size` at the last block of
+    `count` runs, or cycles through the sizes if `count` is None.
+    """
+
+    if max_size is None:
+        return None
+    elif count is None:
+        return block_begin % (max_size + 1)
+    else:
+        return max_size * min(block_end, count) // count
+
+
+def _execute_runs(prop, rng, seed, begin, end, batch_size, shrink=True, stop_event=None, stride=1,
+                  deadline=None, min_count=0, latencies=None, max_size=None):
+    """
+    Execute a property for the runs from `begin` to `end` and stop at
+    the first failure.
+
+    The runs are split into blocks of `batch_size` runs whose arguments
+    are prefetched in bulk. `rng` is seeded before each block with a
+    seed derived from `seed` and the index of its first run, so any run
+    can be replayed on its own. Only every `stride`-th block from the
+    one at `begin` is executed, so that workers can share the blocks.
+
+    If `deadline` of `time.monotonic()` is given, no run is started
+    which is estimated to end after it, once `min_count` runs have been
+    executed. `end` may be None to run until the deadline.
+
+    If `latencies` is given, the nanoseconds of each run are appended
+    to it.
+
+    A vectorized property executes a whole block in a single call
+    unless `deadline` or `latencies` needs the runs one by one.
+
+    The size of arguments grows over the blocks up to `end`, and is
+    `max_size` at the last block, so the early runs are cheap.
+
+    :return: tuple
+        A tuple of the number of executed runs and a CheckResult, which
+        is None if all the runs passed or `stop_event` was set.
+    """
+
+    prefetch = getattr(prop, 'prefetch', None)
+    execute_block = None
+    if deadline is None and latencies is None and getattr(prop, 'vectorized', False):
+        execute_block = prop.execute_block
+    started = time.monotonic()
+    run_count = 0
+    block_begin = begin
+    while end is None or block_begin < end:
+        block_end = block_begin + batch_size if end is None else min(block_begin + batch_size, end)
+        block_seed = _derive_seed(seed, block_begin)
+        block_size = _size_of(block_begin, block_end, end, max_size)
+        rng.seed(block_seed)
+        if prefetch is not None:
+            prefetch(batch_size, 0, block_size)
+        if execute_block is not None:
+            if stop_event is not None and stop_event.is_set():
+                return run_count, None
+            passed, prop_result = execute_block(block_end - block_begin, shrink)
+            run_count += passed
+            if prop_result is not None:
+                run_count += 1
+                result = _to_check_result(run_count, prop_result)
+                if result is not None:
+                    result.run_seed = block_seed
+                    result.run_offset = passed
+                    result.run_size = block_size
+                    if stop_event is not None:
+                        stop_event.set()
+                    return run_count, result
+            block_begin += batch_size * stride
+            continue
+        for i in range(block_begin, block_end):
+            if stop_event is not None and stop_event.is_set():
+                return run_count, None
+            if deadline is not None and run_count >= min_count and _is_out_of_time(deadline, started, run_count):
+                return run_count, None
+            if latencies is None:
+                prop_result = prop.execute() if shrink else prop.execute(shrink=False)
+            else:
+                run_start = time.perf_counter_ns()
+                prop_result = prop.execute() if shrink else prop.execute(shrink=False)
+                latencies.append(time.perf_counter_ns() - run_start)
+            run_count += 1
+            result = _to_check_result(run_count, prop_result)
+            if result is not None:
+                result.run_seed = block_seed
+                result.run_offset = i - block_begin
+                result.run_size = block_size
+                if stop_event is not None:
+                    stop_event.set()
+                return run_count, result
+        block_begin += batch_size * stride
+    return run_count, None
+
+
+_worker_prop = None
+_worker_stop_event = None
+
+
+def _init_worker(prop, stop_event):
+    global _worker_prop, _worker_stop_event
+    _worker_prop = prop
+    _worker_stop_event = stop_event
+
+
+def _check_shard(seed, begin, end, batch_size, stride, deadline, min_count, timing, max_size):
+    rng = random.Random()
+    _use_random(_worker_prop, rng)
+    timer = PropTimer() if timing else None
+    latencies = [] if timing else None
+    _use_timer(_worker_prop, timer)
+    before = _rejections(_worker_prop)
+    run_count, result = _execute_runs(_worker_prop, rng, seed, begin, end, batch_size, False, _worker_stop_event,
+                                      stride, deadline, min_count, latencies, max_size)
+    return run_count, result, latencies, timer, _count_rejections(before, _rejections(_worker_prop))
+
+
 class PropChecker:
     """A checker of properties."""
 
-    def __init__(self, count):
-        if count < 1:
+    # no less than engine.NUMPY_THRESHOLD, so columns are drawn with NumPy
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_VECTORIZED_BATCH_SIZE = 10000
+    DEFAULT_MIN_ACCEPTANCE = 0.1
+
+    def __init__(self, count, workers=1, seed=None, batch_size=None, database=None, duration=None,
+                 min_count=1, timing=False, profiler=None, max_size=None,
+                 min_acceptance=DEFAULT_MIN_ACCEPTANCE):
+        """
+        Initialize a PropChecker instance.
+
+        :param count: int
+            The maximum number of runs. It may be None if `duration` is
+            given, which means no limit.
+
+        :param workers: int
+            The number of processes to check on. Default value is 1.
+
+        :param seed: int
+            The seed of random arguments. Default value is None, which
+            means a random seed.
+
+        :param batch_size: int
+            The number of runs whose arguments are made at once. Default
+            value is None, which means `DEFAULT_BATCH_SIZE`, or
+            `DEFAULT_VECTORIZED_BATCH_SIZE` for a vectorized property,
+            up to `count`.
+
+        :param database: ExampleDatabase
+            The database to replay and save counter-examples. Default
+            value is None.
+
+        :param duration: float
+            The seconds to keep checking for. Runs are stopped before
+            they are estimated to end after it. Default value is None,
+            which means `count` runs.
+
+        :param min_count: int
+            The minimum number of runs even if `duration` has passed.
+            Default value is 1.
+
+        :param timing: bool
+            Whether to measure the time of the phases of checking into
+            `CheckResult.timing`. Default value is False.
+
+        :param profiler: CProfiler | SamplingProfiler
+            The profiler to check each property with, which also turns
+            `timing` on. Only this process is profiled even if `workers`
+            is more than 1. Default value is None.
+
+        :param max_size: int
+            The size of arguments, such as the maximum length of lists,
+            at the last runs. It grows over runs, so the early runs are
+            cheap, and caps the own maximum sizes of arbitraries. Default
+            value is None, which means the own maximum sizes of
+            arbitraries at every run.
+
+        :param min_acceptance: float
+            The rate of generated values accepted by `such_that` under
+            which `LowAcceptanceWarning` is warned. Default value is
+            `DEFAULT_MIN_ACCEPTANCE`, and None means never to warn.
+        """
+
+        if count is None and duration is None:
+            raise ValueError("Argument `count` or `duration` should be given.")
+        if count is not None and count < 1:
             raise ValueError("Argument `count` should be a integer greater than or equal to 1.")
+        if duration is not None and duration <= 0:
+            raise ValueError("Argument `duration` should be a number greater than 0.")
+        if min_count < 0:
+            raise ValueError("Argument `min_count` should be a integer greater than or equal to 0.")
+        if workers < 1:
+            raise ValueError("Argument `workers` should be a integer greater than or equal to 1.")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("Argument `batch_size` should be a integer greater than or equal to 1.")
         self.count = count
-
-    def check(self, prop):
+        self.workers = workers
+        self.seed = seed
+        self.batch_size = batch_size
+        self.database = database
+        self.duration = duration
+        self.min_count = min_count
+        self.timing = timing
+        self.profiler = profiler
+        self.max_size = max_size
+        self.min_acceptance = min_acceptance
+
+    def check(self, prop, key=None):
         """
         Check the given property.
 
+        If the checker has a database, the counter-examples saved in it
+        are replayed before random runs, and a new counter-example is
+        saved in it, as the bytes of its choices if the property records
+        them.
+        `DatabaseKeyWarning` is warned if no `key` is given and none can
+        be made of the function of the property.
+
+        The rate of values accepted by the predicates of the Gen of each
+        argument is recorded into `CheckResult.acceptance_rates`, and
+        `LowAcceptanceWarning` is warned if it is less than
+        `self.min_acceptance`, unless no arguments could be generated at
+        all, which the result reports itself.
+
+        `CheckResult.replayable` is False if the Gen of an argument is
+        adaptive, since its runs can't be made again from their seeds.
+
         :param prop: Prop
             The property to check.
 
+        :param key: str
+            The key of the property in the database and the name of its
+            profile. Default value is None, which means the key made of
+            the function of the property.
+
         :return: CheckResult
             The result of checking the property.
         """
 
+        start = time.perf_counter_ns()
+        seed = random.getrandbits(64) if self.seed is None else self.seed
+        deadline = None if self.duration is None else time.monotonic() + self.duration
+        if key is None and (self.database is not None or self.profiler is not None):
+            key = prop_key(prop)
+            if key is None and self.database is not None:
+                warnings.warn("No key of the property in the database can be made, so its counter-examples "
+                              "are neither replayed nor saved; give `key` to check it.", DatabaseKeyWarning)
+        timing = self.timing or self.profiler is not None
+        timer = PropTimer() if timing else None
+        latencies = [] if timing else None
+        before = _rejections(prop)
+        rejections = None if before is None else [[0, 0] for _ in before]
+        _use_timer(prop, timer)
         try:
-            for i in range(self.count):
-                prop_result = prop.execute()
-
-                if prop_result.has_finished():
-                    _, inputs, is_valid, shrunk_number = prop_result.get()
-                    if not is_valid:
-                        return CheckResult.falsify(i+1, inputs, shrunk_number)
-                else:
-                    _, inputs, error = prop_result.get()
-
-                    # failed to generate?
-                    if type(error) == StopGeneration:
-                        return CheckResult.fail_to_generate(i+1, error.trial_to_generate)
-                    else:
-                        return CheckResult.error(i+1, inputs, error)
-
-            return CheckResult.pass_all(self.count)
+            if self.profiler is None:
+                result = self._check(prop, key, seed, deadline, timer, latencies, rejections)
+            else:
+                name = 'property' if key is None else key
+                result = self.profiler.profile(name, self._check, prop, key, seed, deadline, timer, latencies,
+                                               rejections)
         except Exception as error:
             _, _, ex_traceback = sys.exc_info()
-            return CheckResult.trouble(error, ex_traceback)
+            result = CheckResult.trouble(error, ex_traceback)
+        finally:
+            _use_timer(prop, None)
+        result.seed = seed
+        result.replayable = _is_replayable(prop)
+        if rejections is not None:
+            for counts, own in zip(rejections, _count_rejections(before, _rejections(prop))):
+                counts[0] += own[0]
+                counts[1] += own[1]
+            result.acceptance_rates = [None if draws == 0 else 1.0 - rejected / draws
+                                       for draws, rejected in rejections]
+            if not result.has_failed_to_generate():
+                self._warn_low_acceptance(result.acceptance_rates, key or prop_key(prop))
+        if timing:
+            result.timing = CheckTiming(time.perf_counter_ns() - start, latencies, timer.generation_ns,
+                                        timer.property_ns, timer.shrink_ns)
+        return result
+
+    def _warn_low_acceptance(self, acceptance_rates, name):
+        if self.min_acceptance is None:
+            return
+        for i, rate in enumerate(acceptance_rates):
+            if rate is not None and rate < self.min_acceptance:
+                warnings.warn("Only {0:.1%} of the values generated for argument {1} of {2} were accepted by "
+                              "`such_that`.".format(rate, i, name or 'the property'), LowAcceptanceWarning)
+
+    def _batch_size(self, prop):
+        """
+        Return the number of runs whose arguments of the given property
+        are made at once.
+        """
+
+        if self.batch_size is not None:
+            batch_size = self.batch_size
+        elif getattr(prop, 'vectorized', False):
+            batch_size = self.DEFAULT_VECTORIZED_BATCH_SIZE
+        else:
+            batch_size = self.DEFAULT_BATCH_SIZE
+        return batch_size if self.count is None else min(batch_size, self.count)
+
+    def _check(self, prop, key, seed, deadline, timer, latencies, rejections=None):
+        result = self._replay_examples(prop, key)
+        if result is None and self.workers > 1:
+            result = self._check_in_parallel(prop, seed, deadline, timer, latencies, rejections)
+        elif result is None:
+            rng = random.Random()
+            _use_random(prop, rng)
+            run_count, result = _execute_runs(prop, rng, seed, 0, self.count, self._batch_size(prop),
+                                              deadline=deadline, min_count=self.min_count, latencies=latencies,
+                                              max_size=self.max_size)
+            if result is None:
+                result = CheckResult.pass_all(run_count)
+        if result.has_falsified() and self.database is not None and key is not None:
+            _, inputs, _ = result.get()
+            self.database.save(key, inputs if result.choices is None else result.choices)
+        return result
+
+    def _replay_examples(self, prop, key):
+        """
+        Execute the given property with its counter-examples in the
+        database, and delete the ones which don't falsify it any more.
+
+        :return: CheckResult
+            The result of the first counter-example which still falsifies
+            the property, or None if there is no such one.
+        """
+
+        execute_with = getattr(prop, 'execute_with', None)
+        if self.database is None or key is None or execute_with is None:
+            return None
+        execute_choices = getattr(prop, 'execute_choices', None)
+        arity = _arity(prop)
+        for run_count, (blob, inputs) in enumerate(self.database.fetch_blobs(key), 1):
+            if isinstance(inputs, bytes):
+                if execute_choices is None:
+                    continue
+                result = _to_check_result(run_count, execute_choices(inputs))
+            elif arity is not None and len(inputs) != arity:
+                # saved for another property under the same key
+                result = None
+            else:
+                result = _to_check_result(run_count, execute_with(inputs))
+            if result is not None:
+                return result
+            self.database.delete_blob(key, blob)
+        return None
+
+    def replay(self, prop, run_seed, run_offset=0, run_size=None):
+        """
+        Replay a single run of the given property.
+
+        A run of a result which isn't `replayable` may be replayed with
+        other arguments, since adaptive Gens don't make them from the
+        seed alone.
+
+        :param prop: Prop
+            The property to check.
 
+        :param run_seed: int
+            The seed of the block of the run to replay, which is
+            recorded as `CheckResult.run_seed`.
 
-def check(prop, count=100, printer=print_result):
+        :param run_offset: int
+            The index of the run in the block, which is recorded as
+            `CheckResult.run_offset`. Default value is 0.
+
+        :param run_size: int
+            The size of arguments of the run, which is recorded as
+            `CheckResult.run_size`. Default value is None.
+
+        :return: CheckResult
+            The result of the replayed run.
+        """
+
+        try:
+            rng = random.Random(run_seed)
+            _use_random(prop, rng)
+            prefetch = getattr(prop, 'prefetch', None)
+            if prefetch is not None:
+                prefetch(self._batch_size(prop), run_offset, run_size)
+            result = _to_check_result(1, prop.execute())
+            if result is None:
+                result = CheckResult.pass_all(1)
+            result.run_seed = run_seed
+            result.run_offset = run_offset
+            result.run_size = run_size
+        except Exception as error:
+            _, _, ex_traceback = sys.exc_info()
+            result = CheckResult.trouble(error, ex_traceback)
+        return result
+
+    def _regenerate(self, prop, failure):
+        """
+        Execute the failed run of a worker again in this process, and
+        shrink its arguments.
+
+        :return: PropResult
+            The result of the run, or of shrinking the arguments of
+            `failure` if the run doesn't fail the same way again.
+        """
+
+        _use_random(prop, random.Random(failure.run_seed))
+        prop.prefetch(self._batch_size(prop), failure.run_offset, failure.run_size)
+        prop_result = prop.execute()
+        if prop_result.has_finished() and not prop_result.get()[2]:
+            return prop_result
+        _, inputs, _ = failure.get()
+        return prop.shrink(inputs)
+
+    def _check_in_parallel(self, prop, seed, deadline=None, timer=None, latencies=None, rejections=None):
+        """
+        Check the given property on a pool of `self.workers` processes.
+
+        The blocks of runs are dealt to the workers in turn, and each
+        block is seeded just as in the serial check. As soon as a worker
+        falsifies the property, the others stop at their next run. The
+        counter-example is shrunk in this process afterwards.
+
+        :param prop: Prop
+            The property to check.
+
+        :param seed: int
+            The seed from which the seed of each run is derived.
+
+        :param deadline: float
+            The time of `time.monotonic()` to stop runs at. Default
+            value is None.
+
+        :param timer: PropTimer
+            The timer to add the time of the phases to. Default value is
+            None, which means the time isn't measured.
+
+        :param latencies: list
+            The list to append the nanoseconds of each run to. Default
+            value is None.
+
+        :param rejections: list
+            The list of [draws, rejections] of each argument to add the
+            counts of the workers to. Default value is None.
+
+        :return: CheckResult
+            The result of checking the property.
+        """
+
+        batch_size = self._batch_size(prop)
+        workers = self.workers
+        if self.count is not None:
+            workers = min(workers, (self.count + batch_size - 1) // batch_size)
+        min_count = (self.min_count + workers - 1) // workers
+
+        context = multiprocessing_context()
+        stop_event = context.Event()
+        with context.Pool(workers, initializer=_init_worker, initargs=(prop, stop_event)) as pool:
+            pending = [pool.apply_async(_check_shard, (seed, k * batch_size, self.count, batch_size,
+                                                       workers, deadline, min_count, timer is not None,
+                                                       self.max_size))
+                       for k in range(workers)]
+            shard_results = [p.get() for p in pending]
+
+        if timer is not None:
+            for _, _, shard_latencies, shard_timer, _ in shard_results:
+                latencies.extend(shard_latencies)
+                timer.generation_ns += shard_timer.generation_ns
+                timer.property_ns += shard_timer.property_ns
+        if rejections is not None:
+            for _, _, _, _, shard_rejections in shard_results:
+                for counts, shard_counts in zip(rejections, shard_rejections or []):
+                    counts[0] += shard_counts[0]
+                    counts[1] += shard_counts[1]
+        run_count = sum(count for count, _, _, _, _ in shard_results)
+        failures = [result for _, result, _, _, _ in shard_results if result is not None]
+        if not failures:
+            return CheckResult.pass_all(run_count)
+
+        failure = failures[0]
+        if not failure.has_falsified():
+            failure.result = (run_count,) + failure.result[1:]
+            return failure
+
+        _, inputs, _ = failure.get()
+        if failure.choices is not None:
+            # made again from the choices, to shrink them rather than the arguments
+            shrink, arg = prop.execute_choices, failure.choices
+        elif getattr(prop, 'prefetch', None) is not None:
+            # made again from the seed of the run, so arbitraries keeping
+            # state of their values, e.g. the trees of ArbIntegrated, shrink them
+            shrink, arg = functools.partial(self._regenerate, prop), failure
+        else:
+            shrink, arg = prop.shrink, inputs
+        if timer is None:
+            shrunk = shrink(arg)
+        else:
+            shrunk = timer.time('shrink_ns', shrink, arg)
+        result = _to_check_result(run_count, shrunk)
+        if result is None:
+            result = CheckResult.falsify(run_count, inputs, 0)
+        result.run_seed = failure.run_seed
+        result.run_offset = failure.run_offset
+        result.run_size = failure.run_size
+        return result
+
+
+def check(prop, count=None, printer=print_result, workers=1, seed=None,
+          batch_size=None, database=None, duration=None, min_count=1,
+          timing=False, profile=False, profiler=None, max_size=None,
+          min_acceptance=PropChecker.DEFAULT_MIN_ACCEPTANCE, key=None):
     """
     Check the property in the count of times using the printer.
 
@@ -226,18 +860,69 @@ def check(prop, count=100, printer=print_result):
         The property to check.
 
     :param count: int
-        The number of times to check. Default value is 100.
+        The number of times to check. Default value is None, which means 100 times,
+        or no limit if `duration` is given.
 
     :param printer: function
         The function to print the checking result. Default value is print_result.
+
+    :param workers: int
+        The number of processes to check on. Default value is 1.
+
+    :param seed: int
+        The seed of random arguments. Default value is None, which means a random seed.
+
+    :param batch_size: int
+        The number of runs whose arguments are made at once. Default value is None, which means 100,
+        or 10000 for a vectorized property, up to `count`.
+
+    :param database: ExampleDatabase
+        The database to replay and save counter-examples. Default value is None.
+
+    :param duration: float
+        The seconds to keep checking for. Default value is None, which means `count` times.
+
+    :param min_count: int
+        The minimum number of times to check even if `duration` has passed. Default value is 1.
+
+    :param timing: bool
+        Whether to measure and print the time of the phases of checking. Default value is False.
+
+    :param profile: bool
+        Whether to profile checking with cProfile, dump it into a `.prof` file per property
+        and print the hottest functions. Default value is False.
+
+    :param profiler: CProfiler | SamplingProfiler
+        The profiler to use instead of the default one. Default value is None.
+
+    :param max_size: int
+        The size of arguments at the last runs, which grows over runs. Default value is None,
+        which means the own maximum sizes of arbitraries at every run.
+
+    :param min_acceptance: float
+        The rate of generated values accepted by `such_that` under which `LowAcceptanceWarning`
+        is warned. Default value is 0.1, and None means never to warn.
+
+    :param key: str
+        The key of the property in the database and the name of its profile. Default value is None,
+        which means the key made of the function of the property.
     """
 
-    checker = PropChecker(count=count)
-    result = checker.check(prop)
+    if count is None and duration is None:
+        count = 100
+    if profile and profiler is None:
+        profiler = CProfiler()
+    checker = PropChecker(count=count, workers=workers, seed=seed, batch_size=batch_size, database=database,
+                          duration=duration, min_count=min_count, timing=timing,
+                          profiler=profiler, max_size=max_size, min_acceptance=min_acceptance)
+    result = checker.check(prop, key)
     printer(result)
 
 
-def check_and_assert(prop, count=100, asserter=assert_result):
+def check_and_assert(prop, count=None, asserter=assert_result, workers=1, seed=None,
+                     batch_size=None, database=None, duration=None, min_count=1,
+                     timing=False, profile=False, profiler=None, max_size=None,
+                     min_acceptance=PropChecker.DEFAULT_MIN_ACCEPTANCE, key=None):
     """
     Check the property and assert it.
 
@@ -245,33 +930,236 @@ def check_and_assert(prop, count=100, asserter=assert_result):
         The property to check.
 
     :param count: int
-        The number of times to check. Default value is 100.
+        The number of times to check. Default value is None, which means 100 times,
+        or no limit if `duration` is given.
 
     :param asserter: function
         The function to assert the checking result. Default value is assert_result.
+
+    :param workers: int
+        The number of processes to check on. Default value is 1.
+
+    :param seed: int
+        The seed of random arguments. Default value is None, which means a random seed.
+
+    :param batch_size: int
+        The number of runs whose arguments are made at once. Default value is None, which means 100,
+        or 10000 for a vectorized property, up to `count`.
+
+    :param database: ExampleDatabase
+        The database to replay and save counter-examples. Default value is None.
+
+    :param duration: float
+        The seconds to keep checking for. Default value is None, which means `count` times.
+
+    :param min_count: int
+        The minimum number of times to check even if `duration` has passed. Default value is 1.
+
+    :param timing: bool
+        Whether to measure the time of the phases of checking. Default value is False.
+
+    :param profile: bool
+        Whether to profile checking with cProfile, dump it into a `.prof` file per property
+        and print the hottest functions. Default value is False.
+
+    :param profiler: CProfiler | SamplingProfiler
+        The profiler to use instead of the default one. Default value is None.
+
+    :param max_size: int
+        The size of arguments at the last runs, which grows over runs. Default value is None,
+        which means the own maximum sizes of arbitraries at every run.
+
+    :param min_acceptance: float
+        The rate of generated values accepted by `such_that` under which `LowAcceptanceWarning`
+        is warned. Default value is 0.1, and None means never to warn.
+
+    :param key: str
+        The key of the property in the database and the name of its profile. Default value is None,
+        which means the key made of the function of the property.
     """
 
-    checker = PropChecker(count=count)
-    result = checker.check(prop)
+    if count is None and duration is None:
+        count = 100
+    if profile and profiler is None:
+        profiler = CProfiler()
+    checker = PropChecker(count=count, workers=workers, seed=seed, batch_size=batch_size, database=database,
+                          duration=duration, min_count=min_count, timing=timing,
+                          profiler=profiler, max_size=max_size, min_acceptance=min_acceptance)
+    result = checker.check(prop, key)
     asserter(result)
 
 
-def check_all(properties, count=100, printer=print_result_in_group):
+def _load_durations(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_durations(path, durations):
+    updated = _load_durations(path)
+    updated.update(durations)
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as f:
+        json.dump(updated, f, indent=2, sort_keys=True)
+    os.replace(temporary, path)
+
+
+def _schedule(keys, durations):
+    """
+    Return the indices of `keys` in the descending order of their
+    `durations`, the ones not in `durations` first.
+    """
+
+    return sorted(range(len(keys)), key=lambda i: -durations.get(keys[i], float('inf')))
+
+
+_worker_checker = None
+_worker_props = None
+
+
+def _init_group_worker(checker, props):
+    global _worker_checker, _worker_props
+    _worker_checker = checker
+    _worker_props = props
+
+
+def _check_property(index):
+    key, prop = _worker_props[index]
+    start = time.perf_counter()
+    result = _worker_checker.check(prop, key)
+    if result.has_troubled():
+        # a traceback can't be pickled, so it is sent formatted
+        error, ex_traceback = result.get()
+        result.result = (error, traceback.format_tb(ex_traceback, limit=10))
+    return index, result, time.perf_counter() - start
+
+
+def _check_properties(checker, props, prop_workers, durations):
+    """
+    Check properties and yield their results as they are completed.
+
+    With `prop_workers` processes, the properties are started in the
+    descending order of their `durations` in the past, and the ones not
+    in `durations` first, so that the longest ones don't finish last.
+
+    :return: generator
+        A generator of the index of the property, its CheckResult and
+        seconds to check it.
+    """
+
+    if prop_workers <= 1 or len(props) <= 1:
+        for index, (key, prop) in enumerate(props):
+            start = time.perf_counter()
+            result = checker.check(prop, key)
+            yield index, result, time.perf_counter() - start
+        return
+
+    order = _schedule([key for key, _ in props], durations)
+    context = multiprocessing_context()
+    with context.Pool(min(prop_workers, len(props)), initializer=_init_group_worker,
+                      initargs=(checker, props)) as pool:
+        for completed in pool.imap_unordered(_check_property, order):
+            yield completed
+
+
+def check_all(properties, count=None, printer=print_result_in_group, workers=1, seed=None,
+              batch_size=None, database=None, duration=None, min_count=1,
+              timing=False, profile=False, profiler=None, prop_workers=1, durations=None, ordered=False,
+              max_size=None, min_acceptance=PropChecker.DEFAULT_MIN_ACCEPTANCE):
     """
     Check all the properties.
 
+    Each result is printed as soon as the property is checked.
+
     :param properties: Properties
         The properties that has a bunch of properties to check.
 
     :param count: int
-        The number of times to check. Default value is 100.
+        The number of times to check. Default value is None, which means 100 times,
+        or no limit if `duration` is given.
 
     :param printer: function
         The function to print the checking result. Default value is print_result.
+
+    :param workers: int
+        The number of processes to check on. Default value is 1.
+
+    :param seed: int
+        The seed of random arguments. Default value is None, which means a random seed.
+
+    :param batch_size: int
+        The number of runs whose arguments are made at once. Default value is None, which means 100,
+        or 10000 for a vectorized property, up to `count`.
+
+    :param database: ExampleDatabase
+        The database to replay and save counter-examples. Default value is None.
+
+    :param duration: float
+        The seconds to keep checking for. Default value is None, which means `count` times.
+
+    :param min_count: int
+        The minimum number of times to check even if `duration` has passed. Default value is 1.
+
+    :param timing: bool
+        Whether to measure and print the time of the phases of checking. Default value is False.
+
+    :param profile: bool
+        Whether to profile checking with cProfile, dump it into a `.prof` file per property
+        and print the hottest functions. Default value is False.
+
+    :param profiler: CProfiler | SamplingProfiler
+        The profiler to use instead of the default one. Default value is None.
+
+    :param prop_workers: int
+        The number of processes to check properties on at the same time. It can't be more than 1
+        with `workers`. Default value is 1.
+
+    :param durations: str
+        The path to a JSON file of the seconds each property took to check, which is updated and
+        used to start the longest properties first. Default value is None.
+
+    :param ordered: bool
+        Whether to print results in the order of registration instead of completion. Default value
+        is False.
+
+    :param max_size: int
+        The size of arguments at the last runs, which grows over runs. Default value is None,
+        which means the own maximum sizes of arbitraries at every run.
+
+    :param min_acceptance: float
+        The rate of generated values accepted by `such_that` under which `LowAcceptanceWarning`
+        is warned. Default value is 0.1, and None means never to warn.
     """
-    checker = PropChecker(count=count)
+    if prop_workers < 1:
+        raise ValueError("Argument `prop_workers` should be a integer greater than or equal to 1.")
+    if workers > 1 and prop_workers > 1:
+        raise ValueError("Arguments `workers` and `prop_workers` can't be both greater than 1.")
+    if count is None and duration is None:
+        count = 100
+    if profile and profiler is None:
+        profiler = CProfiler()
+    checker = PropChecker(count=count, workers=workers, seed=seed, batch_size=batch_size, database=database,
+                          duration=duration, min_count=min_count, timing=timing,
+                          profiler=profiler, max_size=max_size, min_acceptance=min_acceptance)
     group_name = properties.group_name
-    ps = properties.properties()
-    for prop_name, prop in ps:
-        result = checker.check(prop)
-        printer(result, group_name, prop_name)
+    names = [prop_name for prop_name, _ in properties.properties()]
+    props = [(group_name + '.' + prop_name, prop) for prop_name, prop in properties.properties()]
+    past_durations = {} if durations is None else _load_durations(durations)
+
+    checked_durations = {}
+    pending = {}
+    next_index = 0
+    for index, result, seconds in _check_properties(checker, props, prop_workers, past_durations):
+        checked_durations[props[index][0]] = seconds
+        if not ordered:
+            printer(result, group_name, names[index])
+            continue
+        pending[index] = result
+        while next_index in pending:
+            printer(pending.pop(next_index), group_name, names[next_index])
+            next_index += 1
+
+    if durations is not None:
+        _save_durations(durations, checked_durations)
@@ -0,0 +1,81 @@
+"""Classes to record and replay the random choices of generation."""
+
+import random
+
+
+class ChoiceSequence(random.Random):
+    """
+    A random source which records the bits it draws into bytes, or
+    replays them from bytes.
+
+    Every method of `random.Random` draws its bits through
+    `getrandbits`, and each call of it is recorded as the fewest bytes
+    which hold its bits, in big-endian order. Arguments made from a
+    `ChoiceSequence` are thus fully described by `self.record`, and are
+    made again by a `ChoiceSequence` replaying it, whatever the state of
+    the global random source is.
+
+    A replayed buffer is read as if it were followed by zeros, so any
+    bytes, e.g. a buffer with a chunk deleted or zeroed, can be replayed.
+    """
+
+    def __init__(self, seed=None, buffer=None):
+        """
+        Initialize a ChoiceSequence instance.
+
+        :param seed: int
+            The seed to draw bits from, if `buffer` is None. Defaults to
+            None, which means a seed from the operating system.
+        :param buffer: bytes
+            The bytes to replay. Defaults to None, which means the bits
+            are drawn from `seed`.
+        """
+
+        self.buffer = buffer
+        self.position = 0
+        self.record = bytearray()
+        super().__init__(seed)
+
+    def getrandbits(self, k):
+        """
+        Return an int with `k` random bits, and record them.
+
+        :param k: int
+            The number of bits.
+
+        :return: int
+            The int drawn from the seed or read from the buffer.
+        """
+
+        if k <= 0:
+            return super().getrandbits(k)
+        size = (k + 7) // 8
+        if self.buffer is None:
+            value = super().getrandbits(k)
+        else:
+            chunk = self.buffer[self.position:self.position + size]
+            value = int.from_bytes(chunk, 'big') << (8 * (size - len(chunk)))
+            value &= (1 << k) - 1
+            self.position += size
+        self.record += value.to_bytes(size, 'big')
+        return value
+
+    def random(self):
+        """
+        Return a float in [0.0, 1.0) made of 53 recorded bits.
+
+        :return: float
+            The float drawn from the seed or read from the buffer.
+        """
+
+        return self.getrandbits(53) * (1.0 / (1 << 53))
+
+    def choices_made(self):
+        """
+        Return the bytes of the choices made so far.
+
+        :return: bytes
+            The recorded bytes, which replay the same choices.
+        """
+
+        return bytes(self.record)
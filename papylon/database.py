@@ -0,0 +1,197 @@
+"""Classes and functions to keep counter-examples between checks."""
+
+import time
+import hashlib
+import pickle
+import sqlite3
+from contextlib import closing
+
+
+def _code_digest(code, digest):
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _code_digest(const, digest)
+        else:
+            digest.update(repr(const).encode())
+
+
+def prop_key(prop):
+    """
+    Return the key to identify a property in an ExampleDatabase.
+
+    The key is made of the module and the qualified name of the function
+    of the property, and a digest of its code and the values it closes
+    over, so lambdas in a module and properties made by a factory with
+    different values are told apart from each other, while editing
+    other lines of the module keeps the key.
+
+    :param prop: Prop
+        The property.
+
+    :return: str
+        The key of the property, or None if it has no function or it
+        closes over a value whose repr isn't stable between processes,
+        in which case a key should be given to the checker.
+    """
+
+    func = getattr(prop, 'func', None)
+    if func is None:
+        return None
+    digest = hashlib.sha1()
+    code = getattr(func, '__code__', None)
+    if code is not None:
+        _code_digest(code, digest)
+    for cell in getattr(func, '__closure__', None) or ():
+        try:
+            text = repr(cell.cell_contents)
+        except Exception:
+            return None
+        if ' at 0x' in text:
+            return None
+        digest.update(text.encode())
+    name = getattr(func, '__qualname__', func.__name__)
+    return "{0}.{1}:{2}".format(func.__module__, name, digest.hexdigest()[:16])
+
+
+class ExampleDatabase:
+    """A SQLite database of counter-examples of properties."""
+
+    DEFAULT_MAX_EXAMPLES = 10
+    DEFAULT_MAX_AGE = 60 * 60 * 24 * 30
+
+    def __init__(self, path, max_examples=DEFAULT_MAX_EXAMPLES, max_age=DEFAULT_MAX_AGE):
+        """
+        Initialize an ExampleDatabase instance.
+
+        :param path: str
+            The path to the database file. It is created if it doesn't
+            exist.
+        :param max_examples: int
+            The maximum number of counter-examples to keep per property.
+            The oldest ones are evicted first. Defaults to
+            `DEFAULT_MAX_EXAMPLES`.
+        :param max_age: float
+            The seconds to keep a counter-example since it was saved or
+            falsified a property last. Defaults to `DEFAULT_MAX_AGE`,
+            which is 30 days. None means no limit.
+        """
+
+        if max_examples < 1:
+            raise ValueError("Argument `max_examples` should be a integer greater than or equal to 1.")
+        self.path = path
+        self.max_examples = max_examples
+        self.max_age = max_age
+        with closing(self._connect()) as connection, connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS examples ("
+                               "key TEXT NOT NULL, inputs BLOB NOT NULL, saved_at REAL NOT NULL, "
+                               "PRIMARY KEY (key, inputs))")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def save(self, key, inputs):
+        """
+        Save a counter-example of a property.
+
+        Saving a counter-example already in the database renews it. The
+        stale and the oldest counter-examples beyond `self.max_examples`
+        are evicted. Arguments which can't be pickled are ignored.
+
+        :param key: str
+            The key of the property.
+        :param inputs: list | bytes
+            The list of arguments falsifying the property, or the bytes
+            of their choices recorded by a `ChoiceSequence`.
+        """
+
+        try:
+            blob = pickle.dumps(inputs)
+        except Exception:
+            return
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute("INSERT OR REPLACE INTO examples VALUES (?, ?, ?)", (key, blob, now))
+            connection.execute("DELETE FROM examples WHERE key = ? AND inputs NOT IN ("
+                               "SELECT inputs FROM examples WHERE key = ? ORDER BY saved_at DESC LIMIT ?)",
+                               (key, key, self.max_examples))
+            if self.max_age is not None:
+                connection.execute("DELETE FROM examples WHERE saved_at < ?", (now - self.max_age,))
+
+    def fetch(self, key):
+        """
+        Fetch the counter-examples of a property, the newest first.
+
+        Counter-examples which can't be unpickled any more, e.g. because
+        their classes were removed, are deleted.
+
+        :param key: str
+            The key of the property.
+
+        :return: list
+            The list of the saved arguments or bytes of choices.
+        """
+
+        return [example for _, example in self.fetch_blobs(key)]
+
+    def fetch_blobs(self, key):
+        """
+        Fetch the counter-examples of a property with their pickled
+        blobs, the newest first.
+
+        A blob is what identifies a counter-example in the database, so
+        it is deleted with `delete_blob` exactly, even if pickling its
+        arguments again would make other bytes.
+
+        :param key: str
+            The key of the property.
+
+        :return: list
+            The list of (blob, counter-example) tuples.
+        """
+
+        with closing(self._connect()) as connection, connection:
+            query = "SELECT inputs FROM examples WHERE key = ?"
+            params = (key,)
+            if self.max_age is not None:
+                query += " AND saved_at >= ?"
+                params += (time.time() - self.max_age,)
+            blobs = [blob for (blob,) in connection.execute(query + " ORDER BY saved_at DESC", params)]
+
+        examples = []
+        for blob in blobs:
+            try:
+                examples.append((blob, pickle.loads(blob)))
+            except Exception:
+                self.delete_blob(key, blob)
+        return examples
+
+    def delete(self, key, inputs):
+        """
+        Delete a counter-example of a property.
+
+        The counter-example is found by pickling it again, which may
+        make other bytes than the saved ones, e.g. for sets; delete one
+        fetched with `fetch_blobs` by its blob with `delete_blob`.
+
+        :param key: str
+            The key of the property.
+        :param inputs: list | bytes
+            The list of arguments or the bytes of choices to delete.
+        """
+
+        self.delete_blob(key, pickle.dumps(inputs))
+
+    def delete_blob(self, key, blob):
+        """
+        Delete a counter-example of a property by its pickled blob.
+
+        :param key: str
+            The key of the property.
+        :param blob: bytes
+            The blob of the counter-example, as `fetch_blobs` returns.
+        """
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM examples WHERE key = ? AND inputs = ?", (key, blob))
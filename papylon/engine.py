@@ -0,0 +1,252 @@
+"""Functions to draw random numbers in bulk and to make arrays of them.
+
+The numbers are drawn with NumPy if it is importable and `USE_NUMPY`
+is True, otherwise with the pure-Python `random` module. Both draw them
+from the same distributions, and NumPy is seeded from the given random
+source, so the values are reproducible with either engine.
+"""
+
+import sys
+import array
+import struct
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from papylon.choice import ChoiceSequence
+
+
+USE_NUMPY = numpy is not None
+
+# Drawing fewer numbers than this is faster without NumPy, which needs
+# to seed a new bit generator for every draw. `PropChecker` prefetches
+# blocks of `DEFAULT_BATCH_SIZE` runs, which is no less than it.
+NUMPY_THRESHOLD = 64
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_UNSIGNED_CODES = {8: 'B', 16: 'H', 32: 'I', 64: 'Q'}
+
+# the type code of arrays of code points, whose items are 4 bytes long
+CODE_POINT_TYPE = 'I' if array.array('I').itemsize == 4 else 'L'
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+# the type codes of `array.array` which `arrays` draws
+ARRAY_TYPECODES = 'bBhHiIlLqQfd'
+
+
+def _numpy_generator(source, n):
+    """
+    Return a NumPy generator seeded from `source` to draw `n` numbers,
+    or None if the pure-Python engine should draw them.
+
+    Numbers drawn from a `ChoiceSequence` are always drawn without
+    NumPy, so each of them is recorded as its own choice rather than
+    hidden behind a seed.
+    """
+
+    if not USE_NUMPY or numpy is None or n < NUMPY_THRESHOLD or isinstance(source, ChoiceSequence):
+        return None
+    return numpy.random.Generator(numpy.random.PCG64(source.getrandbits(64)))
+
+
+def integers(source, min_value, max_value, n):
+    """
+    Draw `n` int values between `min_value` and `max_value` uniformly.
+
+    :param source: random.Random
+        The random source.
+    :param min_value: int
+        The minimum value to draw.
+    :param max_value: int
+        The maximum value to draw.
+    :param n: int
+        The number of values to draw.
+
+    :return: list
+        The list of drawn int values.
+    """
+
+    if _INT64_MIN <= min_value and max_value <= _INT64_MAX:
+        generator = _numpy_generator(source, n)
+        if generator is not None:
+            return generator.integers(min_value, max_value, size=n, dtype=numpy.int64, endpoint=True).tolist()
+
+    width = max_value - min_value + 1
+    code = _UNSIGNED_CODES.get(width.bit_length() - 1) if width & (width - 1) == 0 else None
+    if code is not None and n > 0:
+        # the range is 2 ** (8, 16, 32 or 64) wide, so draw all the bits at once
+        size = struct.calcsize(code)
+        block = source.getrandbits(8 * size * n).to_bytes(size * n, 'little')
+        return [min_value + v for v in struct.unpack('<{0}{1}'.format(n, code), block)]
+    draw = source.randint
+    return [draw(min_value, max_value) for _ in range(n)]
+
+
+def uniforms(source, min_value, max_value, n):
+    """
+    Draw `n` float values between `min_value` and `max_value` uniformly.
+
+    :param source: random.Random
+        The random source.
+    :param min_value: int | float
+        The minimum value to draw.
+    :param max_value: int | float
+        The maximum value to draw.
+    :param n: int
+        The number of values to draw.
+
+    :return: list
+        The list of drawn float values.
+    """
+
+    generator = _numpy_generator(source, n)
+    if generator is not None:
+        return generator.uniform(min_value, max_value, n).tolist()
+
+    width = max_value - min_value
+    draw = source.random
+    return [min_value + width * draw() for _ in range(n)]
+
+
+def float64s(source, n):
+    """
+    Draw `n` float values whose 64 bits of IEEE 754 are uniform.
+
+    :param source: random.Random
+        The random source.
+    :param n: int
+        The number of values to draw.
+
+    :return: list
+        The list of drawn float values, which include infinities and NaN.
+    """
+
+    if n == 0:
+        return []
+    generator = _numpy_generator(source, n)
+    if generator is not None:
+        return numpy.frombuffer(generator.bytes(8 * n), dtype='<f8').tolist()
+    return list(struct.unpack('<{0}d'.format(n), source.getrandbits(64 * n).to_bytes(8 * n, 'little')))
+
+
+def _integer_bounds(typecode, itemsize):
+    bits = 8 * itemsize
+    if typecode.isupper():
+        return 0, (1 << bits) - 1
+    return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+
+
+def arrays(source, typecode, n, min_value=None, max_value=None):
+    """
+    Draw an array of `n` numbers uniformly in bulk.
+
+    Without bounds, the bytes of the whole array are drawn at once, so
+    no number is boxed as a Python object. Floats are then uniform over
+    their bits, which include infinities and NaN.
+
+    :param source: random.Random
+        The random source.
+    :param typecode: str
+        The type code of `array.array`, which is one of
+        `ARRAY_TYPECODES`.
+    :param n: int
+        The number of numbers to draw.
+    :param min_value: int | float
+        The minimum number to draw. Defaults to None, which means the
+        minimum of the type for ints. Floats take both bounds or none.
+    :param max_value: int | float
+        The maximum number to draw. Defaults to None, which means the
+        maximum of the type for ints. Floats take both bounds or none.
+
+    :return: array.array
+        The array of drawn numbers.
+    """
+
+    if typecode not in ARRAY_TYPECODES:
+        raise ValueError("Argument `typecode` should be one of '{0}'.".format(ARRAY_TYPECODES))
+    result = array.array(typecode)
+    itemsize = result.itemsize
+    is_float = typecode in 'fd'
+    if is_float:
+        if (min_value is None) != (max_value is None):
+            raise ValueError("Arguments `min_value` and `max_value` should be both given or not for floats.")
+        raw = min_value is None
+    else:
+        lowest, highest = _integer_bounds(typecode, itemsize)
+        min_value = lowest if min_value is None else min_value
+        max_value = highest if max_value is None else max_value
+        raw = min_value == lowest and max_value == highest
+    if n == 0:
+        return result
+
+    generator = _numpy_generator(source, n)
+    if raw:
+        if generator is not None:
+            result.frombytes(generator.bytes(itemsize * n))
+        else:
+            result.frombytes(source.getrandbits(8 * itemsize * n).to_bytes(itemsize * n, 'little'))
+    elif generator is not None:
+        dtype = numpy.dtype(typecode)
+        if is_float:
+            result.frombytes(generator.uniform(min_value, max_value, n).astype(dtype).tobytes())
+        else:
+            result.frombytes(generator.integers(min_value, max_value, size=n, dtype=dtype, endpoint=True).tobytes())
+    elif is_float:
+        result.fromlist(uniforms(source, min_value, max_value, n))
+    else:
+        result.fromlist(integers(source, min_value, max_value, n))
+    return result
+
+
+def text(source, code_points, n):
+    """
+    Draw a str of `n` characters from `code_points` uniformly.
+
+    :param source: random.Random
+        The random source.
+    :param code_points: array.array
+        The array of code points to draw, whose type code is
+        `CODE_POINT_TYPE`. It mustn't contain surrogates.
+    :param n: int
+        The number of characters to draw.
+
+    :return: str
+        The str of drawn characters.
+    """
+
+    if n == 0:
+        return ''
+    generator = _numpy_generator(source, n)
+    if generator is not None:
+        table = numpy.frombuffer(code_points, dtype=numpy.uint32)
+        return table[generator.integers(0, len(table), size=n)].tobytes().decode(_UTF32)
+    return array.array(CODE_POINT_TYPE, source.choices(code_points, k=n)).tobytes().decode(_UTF32)
+
+
+def as_array(values):
+    """
+    Convert a list of values into an array for vectorized functions.
+
+    :param values: list
+        The list of values.
+
+    :return: numpy.ndarray | list
+        The NumPy array of the values if NumPy is installed, otherwise
+        the list itself. Values other than numbers are stored in an
+        array of objects as they are.
+    """
+
+    if numpy is None:
+        return values
+    if all(type(value) in (int, float, bool) for value in values):
+        try:
+            return numpy.asarray(values)
+        except OverflowError:
+            pass
+    array = numpy.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
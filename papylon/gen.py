@@ -1,8 +1,13 @@
 """Classes and functions to deal with generators."""
 
 import random
+import inspect
 import itertools
-import bisect
+
+from papylon import engine
+from papylon.rose import Rose
+from papylon.choice import ChoiceSequence
+from papylon.shrinker import IntShrinker, FloatShrinker
 
 
 class StopGeneration(StopIteration):
@@ -12,22 +17,214 @@ class StopGeneration(StopIteration):
         self.trial_to_generate = trial_to_generate
 
 
+def to_random(rng):
+    """
+    Return a random source from `rng`.
+
+    :param rng: random.Random | int | None
+        A `random.Random` instance, a seed of a new instance, or None
+        to share the global random state of the `random` module.
+
+    :return: random.Random
+        The random source.
+    """
+
+    if rng is None:
+        return random
+    elif isinstance(rng, int):
+        return random.Random(rng)
+    else:
+        return rng
+
+
+class _AliasTable:
+    """
+    A table of Walker's alias method to choose an index in proportion
+    to its weight in O(1).
+    """
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = sum(weights)
+        if n == 0 or total <= 0 or any(w < 0 for w in weights):
+            raise ValueError("Weights should be non-negative and have a positive sum.")
+        scaled = [w * n / total for w in weights]
+        self.probabilities = [1.0] * n
+        self.aliases = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.probabilities[s] = scaled[s]
+            self.aliases[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def sample(self, source):
+        """Return an index drawn from `source`."""
+
+        i = int(source.random() * len(self.probabilities))
+        return i if source.random() < self.probabilities[i] else self.aliases[i]
+
+    def sample_batch(self, source, n):
+        """Return a list of `n` indices drawn from `source`."""
+
+        columns = engine.integers(source, 0, len(self.probabilities) - 1, n)
+        coins = engine.uniforms(source, 0.0, 1.0, n)
+        probabilities, aliases = self.probabilities, self.aliases
+        return [i if coin < probabilities[i] else aliases[i] for i, coin in zip(columns, coins)]
+
+
+_MAP = 'map'
+_FILTER = 'filter'
+
+# returned by a fused pipeline for a value one of its predicates rejects
+_REJECTED = object()
+
+
+def _id(x):
+    return x
+
+
+def _true(_):
+    return True
+
+
+def _fuse(stages):
+    """
+    Make a pair of functions which run a pipeline of map and filter
+    stages.
+
+    The first one takes a value and returns it mapped, or `_REJECTED`
+    if it is filtered out. The second one takes a list of values and
+    returns the list of the mapped values which aren't filtered out.
+    Both loop over the stages themselves, so a value goes through a
+    whole pipeline in a single call rather than a call per stage.
+    """
+
+    steps = tuple((kind == _MAP, f) for kind, f in stages)
+
+    def fused(value):
+        for is_map, f in steps:
+            if is_map:
+                value = f(value)
+            elif not f(value):
+                return _REJECTED
+        return value
+
+    def fused_batch(values):
+        result = []
+        append = result.append
+        for value in values:
+            for is_map, f in steps:
+                if is_map:
+                    value = f(value)
+                elif not f(value):
+                    break
+            else:
+                append(value)
+        return result
+
+    return fused, fused_batch
+
+
+class _LearnedRange:
+    """
+    The range of numbers a predicate accepted, which is learned to draw
+    numbers for `Gen.such_that(adaptive=True)`.
+    """
+
+    WARMUP = 100
+    MIN_ACCEPTED = 10
+    NARROWING_RATE = 0.5
+    EXPLORATION = 0.1
+
+    def __init__(self, bounds, predicate):
+        self.min_value, self.max_value = bounds
+        self.predicate = predicate
+        self.low = None
+        self.high = None
+        self.tested = 0
+        self.accepted = 0
+        self.narrowed = False
+
+    def accept(self, value):
+        """Return whether the predicate accepts `value`, learning it."""
+
+        self.tested += 1
+        accepted = bool(self.predicate(value))
+        if accepted:
+            self.accepted += 1
+            if self.low is None or value < self.low:
+                self.low = value
+            if self.high is None or value > self.high:
+                self.high = value
+        if (not self.narrowed and self.tested >= self.WARMUP and
+                self.MIN_ACCEPTED <= self.accepted < self.tested * self.NARROWING_RATE):
+            self.narrowed = True
+        return accepted
+
+    def _range(self):
+        # widen the accepted range by its average gap on both sides, as
+        # the true range likely goes a little beyond the extremes seen
+        margin = (self.high - self.low) / (self.accepted - 1)
+        if not isinstance(self.min_value, float):
+            margin = int(margin) + 1
+        return max(self.min_value, self.low - margin), min(self.max_value, self.high + margin)
+
+    def _draw(self, source, low, high, n):
+        if isinstance(self.min_value, float):
+            return engine.uniforms(source, low, high, n)
+        return engine.integers(source, low, high, n)
+
+    def gen(self, source):
+        """Yield numbers from the learned range, or from the bounds."""
+
+        while True:
+            if self.narrowed and source.random() >= self.EXPLORATION:
+                low, high = self._range()
+            else:
+                low, high = self.min_value, self.max_value
+            if isinstance(self.min_value, float):
+                yield source.uniform(low, high)
+            else:
+                yield source.randint(low, high)
+
+    def batch(self, source, n):
+        """Return a list of `n` numbers `self.gen` could yield."""
+
+        if not self.narrowed:
+            return self._draw(source, self.min_value, self.max_value, n)
+        low, high = self._range()
+        values = self._draw(source, low, high, n)
+        explored = [i for i, coin in enumerate(engine.uniforms(source, 0.0, 1.0, n)) if coin < self.EXPLORATION]
+        for i, value in zip(explored, self._draw(source, self.min_value, self.max_value, len(explored))):
+            values[i] = value
+        return values
+
+
 class Gen:
     """Generator of a random value."""
 
     DEFAULT_TRIAL = 100
 
-    def __init__(self, gen, mapper=None, predicate=None, trial=DEFAULT_TRIAL):
+    def __init__(self, gen, mapper=None, predicate=None, trial=DEFAULT_TRIAL, rng=None, batch=None, shrink=None,
+                 tree=None, stages=(), bounds=None, adaptive=False):
         """
         Initialize a Gen instance.
 
-        `self.mapper` is assigned an identity function if the argument
-        `mapper` isn't set or is set None. `self.predicate` is also a
-        function always returns True if the argument `predicate` isn't
-        set or is set None.
+        Generated values go through the pipeline `self.stages`, which is
+        `stages` followed by `mapper` and `predicate` if they are set.
+        The pipeline is fused into a single function once, so a chain
+        of `map` and `such_that` costs a call per value rather than a
+        call per stage.
+
+        `self.draws` and `self.rejections` count the values drawn and
+        rejected by the predicates of the pipeline, if there are any.
 
         :param gen: function
-            The generator function to yield a value.
+            The generator function to yield a value. If it takes an
+            argument, it is called with the random source of the Gen.
         :param mapper: function
             The function to apply a generated value. Defaults to None.
         :param predicate: function
@@ -35,41 +232,323 @@ class Gen:
         :param trial: int
             The trial number to generate values. Defaults to
             `DEFAULT_TRIAL`.
+        :param rng: random.Random | int
+            The random source or its seed. Defaults to None, which
+            means the global random state.
+        :param batch: function
+            The function which takes the random source and a number n,
+            and returns a list of n values `gen` could yield. Defaults
+            to None, which means values are drawn from `gen` one by one.
+        :param shrink: function
+            The function which takes a value `gen` yields and returns an
+            iterable of its shrunk values, the most shrunk first. It
+            makes `generate_tree()` return trees to shrink values along.
+            Defaults to None, which means values aren't shrunk.
+        :param tree: function
+            The function which takes the random source and returns a
+            Rose of a value `gen` could yield, for Gens composed of
+            other Gens. Defaults to None, which means trees are unfolded
+            from values of `gen` with `shrink`.
+        :param stages: tuple
+            The pipeline of ('map', function) and ('filter', function)
+            stages to apply to a generated value in order. Defaults to
+            an empty tuple.
+        :param bounds: tuple
+            The minimum and maximum of the numbers `gen` yields
+            uniformly, which lets `such_that` narrow them adaptively.
+            Defaults to None.
+        :param adaptive: bool
+            Whether `gen` draws from a range learned from earlier
+            values, which makes values depend on all the values drawn
+            before. Defaults to False.
         """
 
-        def _id(x):
-            return x
-
-        def _true(_):
-            return True
+        stages = tuple(stages)
+        if mapper is not None:
+            stages += ((_MAP, mapper),)
+        if predicate is not None:
+            stages += ((_FILTER, predicate),)
 
-        self.gen = gen()
-        self.mapper = _id if mapper is None else mapper
-        self.predicate = _true if predicate is None else predicate
+        self.source = gen
+        self.random = to_random(rng)
+        self.gen = self._start()
         self.trial = trial
+        self.batch = batch
+        self.shrink = shrink
+        self.tree = tree
+        self.stages = stages
+        self.bounds = bounds
+        self.adaptive = adaptive
+        self.draws = 0
+        self.rejections = 0
+        self._maps = any(kind == _MAP for kind, _ in stages)
+        self._filters = any(kind == _FILTER for kind, _ in stages)
+        self._step, self._step_batch = _fuse(stages) if stages else (None, None)
+
+    def _start(self):
+        if inspect.signature(self.source).parameters:
+            return self.source(self.random)
+        else:
+            return self.source()
+
+    def set_random(self, rng):
+        """
+        Make the Gen draw values from a given random source.
+
+        :param rng: random.Random | int
+            The random source or its seed.
+        """
+
+        self.random = to_random(rng)
+        self.gen = self._start()
+
+    def _with_random(self, rng):
+        """Return a copy of the Gen which draws values from `rng`."""
+
+        return self._derive(self.stages, self.trial, rng)
+
+    def _derive(self, stages, trial, rng):
+        return Gen(self.source, trial=trial, rng=rng, batch=self.batch, shrink=self.shrink, tree=self.tree,
+                   stages=stages, bounds=self.bounds, adaptive=self.adaptive)
+
+    @property
+    def mapper(self):
+        """
+        The function of the map stage at the end of the pipeline, which
+        only `self.predicate` may follow, or an identity function if
+        there is no such stage. `self.stages` is the whole pipeline.
+        """
+
+        stages = self.stages
+        if stages and stages[-1][0] == _FILTER:
+            stages = stages[:-1]
+        return stages[-1][1] if stages and stages[-1][0] == _MAP else _id
+
+    @property
+    def predicate(self):
+        """
+        The function of the filter stage at the end of the pipeline, or
+        a function which always returns True if there is no such stage.
+        `self.stages` is the whole pipeline.
+        """
+
+        stages = self.stages
+        return stages[-1][1] if stages and stages[-1][0] == _FILTER else _true
+
+    @property
+    def acceptance_rate(self):
+        """
+        The rate of drawn values which the predicates accepted, or None
+        if no value has been drawn through a predicate.
+        """
+
+        if self.draws == 0:
+            return None
+        return 1.0 - self.rejections / self.draws
+
+    def _pipe_tree(self, tree):
+        """
+        Return `tree` through the pipeline, or None if its root is
+        filtered out.
+        """
+
+        for kind, f in self.stages:
+            if kind == _MAP:
+                tree = tree.map(f)
+            elif f(tree.value):
+                tree = tree.filter(f)
+            else:
+                return None
+        return tree
+
+    def _draw_tree(self):
+        if self.tree is not None:
+            return self.tree(self.random)
+        return Rose.unfold(next(self.gen), self.shrink)
+
+    def generate_tree(self):
+        """
+        Generate a random value with the tree of its shrunk values.
+
+        The tree is mapped and pruned with the stages of the pipeline
+        lazily, so every shrunk value in it is one `self.generate()`
+        could return. If values don't satisfy the predicates and the
+        number of trial is no less than `self.trial`, raise
+        `StopGeneration`.
+
+        :return: Rose
+            The tree whose root is a random value.
+        """
+
+        for i in itertools.count():
+            tree = self._pipe_tree(self._draw_tree())
+            if tree is not None:
+                self._count(i + 1, i)
+                return tree
+
+            if i >= self.trial:
+                self._count(i + 1, i + 1)
+                raise StopGeneration(i)
+
+    def _count(self, draws, rejections):
+        if self._filters:
+            self.draws += draws
+            self.rejections += rejections
+
+    def tree_of(self, value):
+        """
+        Return the tree of a given value to shrink it along.
+
+        A value can be unfolded only if the Gen neither maps values nor
+        is composed of other Gens, since its shrunk values can't be
+        told from a mapped value. Otherwise the tree has no children;
+        use the trees `generate_tree()` returns instead.
+
+        :param value:
+            The value to shrink.
+
+        :return: Rose
+            The tree whose root is `value`.
+        """
+
+        if self._maps or self.tree is not None:
+            return Rose(value)
+        tree = Rose.unfold(value, self.shrink)
+        for _, predicate in self.stages:
+            tree = tree.filter(predicate)
+        return tree
 
     def generate(self):
         """
         Generate a random value.
 
-        Return a mapped value with `self.mapper` if the value satisfies
-        `self.predicate`. If values don't satisfy the predicate and the
+        Return a value through the pipeline `self.stages` if none of its
+        predicates rejects the value. If values are rejected and the
         number of trial is no less than `self.trial`, raise
         `StopGeneration`.
 
         :return:
-            A random value which `self.gen` generates, `self.mapper`
-            maps and `self.predicate` filters.
+            A random value which `self.gen` generates and the pipeline
+            maps and filters.
         """
 
+        step = self._step
         for i, value in enumerate(self.gen):
-            mapped = self.mapper(value)
-            if self.predicate(mapped):
-                return mapped
+            if step is None:
+                return value
+            value = step(value)
+            if value is not _REJECTED:
+                self._count(i + 1, i)
+                return value
 
             if i >= self.trial:
+                self._count(i + 1, i + 1)
                 raise StopGeneration(i)
 
+    def generate_batch(self, n):
+        """
+        Generate `n` random values at once.
+
+        Values are drawn in bulk with `self.batch` if it is given,
+        otherwise from `self.gen`, and then go through the pipeline list
+        by list. If no value of a draw passes the predicates and more
+        than `self.trial` values are rejected in a row, raise
+        `StopGeneration`.
+
+        :param n: int
+            The number of values to generate.
+
+        :return: list
+            The list of `n` values which `self.generate()` could return.
+        """
+
+        result = []
+        rejected = 0
+        while len(result) < n:
+            rest = n - len(result)
+            if self.batch is not None:
+                values = self.batch(self.random, rest)
+            else:
+                values = list(itertools.islice(self.gen, rest))
+            if self._step_batch is not None:
+                accepted = self._step_batch(values)
+                self._count(len(values), len(values) - len(accepted))
+                if not self._filters or accepted:
+                    rejected = 0
+                else:
+                    rejected += len(values)
+                    if rejected >= self.trial:
+                        raise StopGeneration(self.trial)
+                values = accepted
+            result.extend(values)
+        return result
+
+    @staticmethod
+    def one_of(gens, rng=None):
+        """
+        Return a Gen which draws a value from one of `gens` equally
+        likely, chosen again for every value.
+
+        :param gens: list
+            The list of `Gen` instance.
+        :param rng: random.Random | int
+            The random source or its seed. Defaults to None.
+
+        :return: Gen
+            The `Gen` instance which draws from `gens`.
+        """
+
+        return Gen.frequency([(1, gen) for gen in gens], rng=rng)
+
+    @staticmethod
+    def frequency(weighted_gens, rng=None):
+        """
+        Return a Gen which draws a value from one of Gens in proportion
+        to their weights, chosen again for every value.
+
+        The Gen is chosen in O(1) with an alias table built at once. The
+        chosen Gens draw values from the random source of the returned
+        Gen, so it is reproducible with a seed.
+
+        :param weighted_gens: list
+            The list of (int | float, Gen) sequence.
+        :param rng: random.Random | int
+            The random source or its seed. Defaults to None.
+
+        :return: Gen
+            The `Gen` instance which draws from the Gens.
+        """
+
+        weights, gens = zip(*weighted_gens)
+        table = _AliasTable(weights)
+        bound = {}
+
+        def bind(source):
+            if bound.get('source') is not source:
+                bound['source'] = source
+                bound['gens'] = [gen._with_random(source) for gen in gens]
+            return bound['gens']
+
+        def gen(source):
+            branches = bind(source)
+            while True:
+                yield branches[table.sample(source)].generate()
+
+        def batch(source, n):
+            branches = bind(source)
+            positions = {}
+            for position, i in enumerate(table.sample_batch(source, n)):
+                positions.setdefault(i, []).append(position)
+            values = [None] * n
+            for i, ps in positions.items():
+                for position, value in zip(ps, branches[i].generate_batch(len(ps))):
+                    values[position] = value
+            return values
+
+        def tree(source):
+            return bind(source)[table.sample(source)].generate_tree()
+        return Gen(gen, rng=rng, batch=batch, tree=tree)
+
     def map(self, f):
         """
         Return a Gen instance that applies f to every generated value.
@@ -78,45 +557,105 @@ class Gen:
             The function to apply a generated value.
 
         :return: Gen
-            The `Gen` instance derived from `self` and `self.mapper` is
-            `f`.
+            The `Gen` instance derived from `self`, whose pipeline is
+            `self.stages` followed by mapping with `f`.
         """
 
-        return Gen(lambda: self.gen, f)
+        return self._derive(self.stages + ((_MAP, f),), self.trial, self.random)
 
-    def such_that(self, predicate, trial=DEFAULT_TRIAL):
+    def such_that(self, predicate, trial=DEFAULT_TRIAL, adaptive=False):
         """
         Return a Gen which generates values filtered with predicate.
 
+        If `adaptive` is True and `self` draws numbers uniformly from
+        `self.bounds` without mapping them, such as `choose`, the range
+        of the numbers `predicate` accepted is learned from the first
+        draws. If few of them were accepted, later numbers are drawn
+        from that range mostly, and from the whole bounds sometimes to
+        keep widening it. Otherwise `adaptive` is ignored.
+
+        The learned range depends on every value drawn before, not only
+        on the random source, so values of an adaptive Gen can't be made
+        again from a seed, and `PropChecker.replay` may run a property
+        with other arguments. `self.adaptive` of the returned Gen is
+        True then.
+
         :param predicate: function
             The function to filter a generated value.
         :param trial: int
             The trial number to generate values. Defaults to
             `DEFAULT_TRIAL`.
+        :param adaptive: bool
+            Whether to narrow the range of drawn numbers to the accepted
+            ones. Defaults to False.
 
         :return: Gen
-            The `Gen` instance derived from `self`, `self.mapper` is
-            `predicate` and `self.trial` is `trial`.
+            The `Gen` instance derived from `self`, whose pipeline is
+            `self.stages` followed by filtering with `predicate` and
+            `self.trial` is `trial`.
         """
 
-        return Gen(lambda: self.gen, predicate=predicate, trial=trial)
+        if adaptive and self.bounds is not None and not self._maps and self.tree is None:
+            learned = _LearnedRange(self.bounds, predicate)
+            return Gen(learned.gen, trial=trial, rng=self.random, batch=learned.batch, shrink=self.shrink,
+                       stages=self.stages + ((_FILTER, learned.accept),), bounds=self.bounds, adaptive=True)
+        return self._derive(self.stages + ((_FILTER, predicate),), trial, self.random)
 
 
-def one_of(gens):
+def one_of(gens, rng=None):
     """
     Return a Gen instance from `gens` sequence.
 
     :param gens: list
         The list of `Gen` instance.
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
 
     :return: Gen
-        The `Gen` instance from `gens` sequence.
+        The `Gen` instance which draws a value from one of `gens`,
+        which is `Gen.one_of`.
+    """
+
+    return Gen.one_of(gens, rng=rng)
+
+
+def _shrink_within(shrinker, min_value, max_value):
+    """
+    Return a function to shrink a number between `min_value` and
+    `max_value` towards the one of them closest to 0.
     """
 
-    return random.choice(gens)
+    target = min(max(min_value, 0), max_value)
+
+    def shrink(value):
+        return (target + shrunk for shrunk in shrinker.shrink(value - target)
+                if min_value <= target + shrunk <= max_value)
+    return shrink
+
 
+def _randint_towards(source, min_value, max_value, target):
+    """
+    Draw an int between `min_value` and `max_value` uniformly, so that
+    the smaller the index drawn from `source` is, the closer the int is
+    to `target`, alternately above and below it.
 
-def choose(min_value, max_value):
+    Zeroed choices of a `ChoiceSequence` are thus made into `target`,
+    and shrinking the choices shrinks the int towards it.
+    """
+
+    index = source.randint(0, max_value - min_value)
+    above = max_value - target
+    below = target - min_value
+    both = min(above, below)
+    if index <= 2 * both:
+        return target + (index + 1) // 2 if index % 2 == 1 else target - index // 2
+    elif above > below:
+        return target + index - both
+    else:
+        return target - index + both
+
+
+def choose(min_value, max_value, rng=None):
     """
     Return a Gen which generates between `min_value` and `max_value`.
 
@@ -124,6 +663,8 @@ def choose(min_value, max_value):
         The minimum value to generate.
     :param max_value: int | float
         The maximum value to generate.
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
 
     :return: Gen
         The `Gen` instance which generates a number between `min_value`
@@ -141,36 +682,47 @@ def choose(min_value, max_value):
                          " such as `min_value` < `max_value`.")
 
     if float in [min_value_type, max_value_type]:
-        def gen():
+        def gen(source):
             while True:
-                yield random.uniform(min_value, max_value)
-        return Gen(gen)
+                yield source.uniform(min_value, max_value)
+
+        def batch(source, n):
+            return engine.uniforms(source, min_value, max_value, n)
+        shrink = _shrink_within(FloatShrinker(), float(min_value), float(max_value))
+        return Gen(gen, rng=rng, batch=batch, shrink=shrink, bounds=(float(min_value), float(max_value)))
     else:
-        def gen():
+        target = min(max(min_value, 0), max_value)
+
+        def gen(source):
             while True:
-                yield random.randint(min_value, max_value)
-        return Gen(gen)
+                if isinstance(source, ChoiceSequence):
+                    yield _randint_towards(source, min_value, max_value, target)
+                else:
+                    yield source.randint(min_value, max_value)
 
+        def batch(source, n):
+            if isinstance(source, ChoiceSequence):
+                return [_randint_towards(source, min_value, max_value, target) for _ in range(n)]
+            return engine.integers(source, min_value, max_value, n)
+        shrink = _shrink_within(IntShrinker(), min_value, max_value)
+        return Gen(gen, rng=rng, batch=batch, shrink=shrink, bounds=(min_value, max_value))
 
-def frequency(weighted_gens):
+
+def frequency(weighted_gens, rng=None):
     """
     Return a Gen instance from weighted Gen sequence `weighted_gens`.
 
-    :ref:
-        https://docs.python.org/3.4/library/random.html#examples-and-recipes
-
     :param weighted_gens: list
         The list of (int, Gen) sequence.
+    :param rng: random.Random | int
+        The random source or its seed. Defaults to None.
 
     :return: Gen
-        The `Gen` instance from `weighted_gens` sequence, which is
-        selected by.
+        The `Gen` instance which draws a value from one of the Gens in
+        proportion to their weights, which is `Gen.frequency`.
     """
 
-    weights, gens = zip(*weighted_gens)
-    cumdist = list(itertools.accumulate(weights))
-    x = random.random() * cumdist[-1]
-    return gens[bisect.bisect(cumdist, x)]
+    return Gen.frequency(weighted_gens, rng=rng)
 
 
 def constant(value):
@@ -187,4 +739,7 @@ def constant(value):
     def gen():
         while True:
             yield value
-    return Gen(gen)
+
+    def batch(_, n):
+        return [value] * n
+    return Gen(gen, batch=batch)
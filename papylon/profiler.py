@@ -0,0 +1,113 @@
+"""Classes to profile checking properties."""
+
+import os
+import re
+import sys
+import pstats
+import cProfile
+import threading
+
+
+def _file_name(name):
+    return re.sub(r'[^\w.-]', '_', name) + '.prof'
+
+
+class CProfiler:
+    """A profiler of checking properties with cProfile."""
+
+    DEFAULT_TOP = 10
+
+    def __init__(self, directory='.', top=DEFAULT_TOP, file=None):
+        """
+        Initialize a CProfiler instance.
+
+        :param directory: str
+            The directory to dump a `.prof` file per property into.
+            Defaults to the current directory.
+        :param top: int
+            The number of the hottest functions to print. Defaults to
+            `DEFAULT_TOP`, and 0 means not to print them.
+        :param file: file
+            The file to print the hottest functions to. Defaults to
+            None, which means `sys.stdout`.
+        """
+
+        self.directory = directory
+        self.top = top
+        self.file = file
+
+    def profile(self, name, f, *args):
+        """
+        Call a function with cProfile, dump the profile into a file
+        named after the property and print the hottest functions.
+
+        :param name: str
+            The name of the property.
+        :param f: function
+            The function to check the property.
+
+        :return:
+            The value `f` returns.
+        """
+
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(f, *args)
+        finally:
+            path = os.path.join(self.directory, _file_name(name))
+            profile.dump_stats(path)
+            if self.top > 0:
+                file = sys.stdout if self.file is None else self.file
+                print("Profile of {0} is dumped into {1}.".format(name, path), file=file)
+                pstats.Stats(profile, stream=file).sort_stats('tottime').print_stats(self.top)
+
+
+class SamplingProfiler:
+    """A profiler which passes frames sampled periodically to a callback."""
+
+    DEFAULT_INTERVAL = 0.001
+
+    def __init__(self, callback, interval=DEFAULT_INTERVAL):
+        """
+        Initialize a SamplingProfiler instance.
+
+        :param callback: function
+            The function which takes the name of the property and the
+            frame running at each sample.
+        :param interval: float
+            The seconds between samples. Defaults to `DEFAULT_INTERVAL`.
+        """
+
+        self.callback = callback
+        self.interval = interval
+
+    def profile(self, name, f, *args):
+        """
+        Call a function while sampling the frame it runs in on another
+        thread.
+
+        :param name: str
+            The name of the property.
+        :param f: function
+            The function to check the property.
+
+        :return:
+            The value `f` returns.
+        """
+
+        thread_id = threading.get_ident()
+        stopped = threading.Event()
+
+        def sample():
+            while not stopped.wait(self.interval):
+                frame = sys._current_frames().get(thread_id)
+                if frame is not None:
+                    self.callback(name, frame)
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        try:
+            return f(*args)
+        finally:
+            stopped.set()
+            sampler.join()
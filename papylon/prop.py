@@ -1,6 +1,17 @@
 """Classes and functions to represent properties"""
 
+import time
+import array
+import itertools
+import concurrent.futures
 from collections import OrderedDict
+from collections.abc import Hashable
+
+from papylon import engine
+from papylon.gen import to_random
+from papylon.choice import ChoiceSequence
+from papylon.shrinker import ChoiceShrinker
+from papylon.utils import multiprocessing_context
 
 
 class PropResult:
@@ -9,9 +20,16 @@ class PropResult:
     FINISHED = 0
     STOPPED = 1
 
+    SHRINKS_BUDGET = "max_shrinks"
+    EVALUATIONS_BUDGET = "max_evaluations"
+    TIME_BUDGET = "shrink_timeout"
+
     def __init__(self, status):
         self.status = status
         self.result = None
+        self.cache_hits = 0
+        self.exhausted_budget = None
+        self.choices = None
 
     @staticmethod
     def finish(func_name, inputs, is_valid, shrunk_number):
@@ -86,15 +104,248 @@ class PropResult:
         return self.result
 
 
+def _freeze(value):
+    """
+    Return a hashable key which identifies `value` with its type.
+
+    Lists, tuples, sets and dicts are frozen recursively, and arrays
+    by their bytes. Raise TypeError if `value` contains any other
+    unhashable value.
+    """
+
+    value_type = type(value)
+    if value_type in (list, tuple):
+        return value_type, tuple(_freeze(v) for v in value)
+    elif value_type in (set, frozenset):
+        return value_type, frozenset(_freeze(v) for v in value)
+    elif value_type is dict:
+        return value_type, frozenset((_freeze(k), _freeze(v)) for k, v in value.items())
+    elif value_type is float:
+        # repr tells -0.0 from 0.0
+        return value_type, repr(value)
+    elif value_type is array.array:
+        return value_type, (value.typecode, value.tobytes())
+    elif isinstance(value, Hashable):
+        hash(value)
+        return value_type, value
+    else:
+        raise TypeError("unhashable type: '{0}'".format(value_type.__name__))
+
+
+class _EvaluationCache:
+    """A bounded LRU cache of the outcomes of a property by arguments."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self._outcomes = OrderedDict()
+
+    def key(self, inputs):
+        """
+        Return the key of `inputs`, or None if it can't be cached.
+        """
+
+        if self.max_size <= 0:
+            return None
+        try:
+            return _freeze(inputs)
+        except TypeError:
+            return None
+
+    def get(self, key):
+        """
+        Return the cached outcome of `key`, or None if it isn't cached.
+        """
+
+        if key is None or key not in self._outcomes:
+            return None
+        self._outcomes.move_to_end(key)
+        self.hits += 1
+        return self._outcomes[key]
+
+    def put(self, key, outcome):
+        """
+        Cache the outcome of `key`, evicting the least recently used.
+        """
+
+        if key is None:
+            return
+        self._outcomes[key] = outcome
+        self._outcomes.move_to_end(key)
+        if len(self._outcomes) > self.max_size:
+            self._outcomes.popitem(last=False)
+
+
+class _BudgetExhausted(Exception):
+    """Signal that a budget of shrinking has run out."""
+    def __init__(self, budget):
+        Exception.__init__(self, budget)
+        self.budget = budget
+
+
+class PropTimer:
+    """Nanoseconds spent in the phases of executing a property."""
+
+    def __init__(self):
+        self.generation_ns = 0
+        self.property_ns = 0
+        self.shrink_ns = 0
+
+    def time(self, phase, f, *args):
+        """
+        Call a function and add the time it takes to a phase.
+
+        :param phase: str
+            The name of the attribute for the phase, such as
+            'generation_ns'.
+        :param f: function
+            The function to call.
+
+        :return:
+            The value `f` returns.
+        """
+
+        start = time.perf_counter_ns()
+        try:
+            return f(*args)
+        finally:
+            setattr(self, phase, getattr(self, phase) + time.perf_counter_ns() - start)
+
+
 class PropExecutor:
     """A class which executes a property."""
 
-    def __init__(self, arbs, func, max_shrinks):
+    THREAD_POOL = "thread"
+    PROCESS_POOL = "process"
+
+    def __init__(self, arbs, func, max_shrinks, max_evaluations=None, shrink_timeout=None,
+                 shrink_workers=1, shrink_pool=THREAD_POOL):
+        """
+        Initialize a PropExecutor instance.
+
+        :param arbs: list
+            The Arbitrary list for arguments.
+        :param func: function
+            The function representing a property.
+        :param max_shrinks: int
+            The maximum number of times to shrink arguments.
+        :param max_evaluations: int
+            The maximum number of times to execute the property while
+            shrinking. Defaults to None, which means no limit.
+        :param shrink_timeout: float
+            The maximum seconds to spend shrinking. Defaults to None,
+            which means no limit.
+        :param shrink_workers: int
+            The number of shrunk arguments to execute the property with
+            at the same time. Defaults to 1.
+        :param shrink_pool: str
+            The pool to execute the property on while shrinking, which
+            is `THREAD_POOL` or `PROCESS_POOL`. Defaults to `THREAD_POOL`.
+        """
+
+        if shrink_pool not in [PropExecutor.THREAD_POOL, PropExecutor.PROCESS_POOL]:
+            raise ValueError("Argument `shrink_pool` should be 'thread' or 'process'.")
         self.arbs = arbs
         self.func = func
         self.max_shrinks = max_shrinks
+        self.max_evaluations = max_evaluations
+        self.shrink_timeout = shrink_timeout
+        self.shrink_workers = shrink_workers
+        self.shrink_pool = shrink_pool
+        self._prefetched = []
+        self._to_prefetch = (0, 0)
+        self._size = None
+        self.timer = None
+
+    def _call(self, inputs):
+        if self.timer is None:
+            return self.func(*inputs)
+        return self.timer.time('property_ns', self.func, *inputs)
+
+    def _shrink(self, inputs):
+        if self.timer is None:
+            return self.execute_shrinker(inputs)
+        return self.timer.time('shrink_ns', self.execute_shrinker, inputs)
+
+    def set_random(self, rng):
+        """
+        Make arguments with a given random source.
 
-    def execute(self):
+        :param rng: random.Random | int
+            The random source or its seed.
+        """
+
+        for arb in self.arbs:
+            arb.set_random(rng)
+
+    def rejections(self):
+        """
+        Return the numbers of values drawn and rejected by predicates of
+        the Gen of each arbitrary.
+
+        :return: list
+            The list of (draws, rejections) tuples, which are (0, 0) for
+            arbitraries without such a Gen.
+        """
+
+        counts = []
+        for arb in self.arbs:
+            gen = getattr(arb, 'gen', None)
+            counts.append((getattr(gen, 'draws', 0), getattr(gen, 'rejections', 0)))
+        return counts
+
+    def prefetch(self, n, start=0, size=None):
+        """
+        Make arguments for the next executions in bulk.
+
+        A block of `n` arguments is made with `arbitrary_batch` when the
+        next execution needs them, and handed out one execution at a
+        time from the `start`-th ones.
+
+        :param n: int
+            The number of arguments in the block.
+        :param start: int
+            The index of the first arguments to hand out. Defaults to 0.
+        :param size: int
+            The size of arguments, which is passed to sized arbitraries.
+            Defaults to None, which means their own maximum sizes.
+        """
+
+        self._prefetched = []
+        self._to_prefetch = (n, start)
+        self._size = size
+
+    def _forget(self):
+        # arbitraries keeping state of the values they generated, such as
+        # ArbIntegrated, drop it once per generation, not once per call, so
+        # an arbitrary used for several arguments keeps all of them
+        for arb in self.arbs:
+            forget = getattr(arb, 'forget', None)
+            if forget is not None:
+                forget()
+
+    def _generate_columns(self, n):
+        self._forget()
+        size = self._size
+        return [arb.arbitrary_batch(n, size) if size is not None and getattr(arb, 'sized', False)
+                else arb.arbitrary_batch(n) for arb in self.arbs]
+
+    def _next_inputs(self):
+        n, start = self._to_prefetch
+        if not self._prefetched and n > 0:
+            self._to_prefetch = (0, 0)
+            columns = self._generate_columns(n)
+            rows = [list(row) for row in zip(*columns)] if columns else [[] for _ in range(n)]
+            self._prefetched = rows[start:]
+            self._prefetched.reverse()
+        if self._prefetched:
+            return self._prefetched.pop()
+        self._forget()
+        size = self._size
+        return [arb.arbitrary(size) if size is not None and getattr(arb, 'sized', False) else arb.arbitrary()
+                for arb in self.arbs]
+
+    def execute(self, shrink=True):
         """
         Execute the property.
 
@@ -102,6 +353,10 @@ class PropExecutor:
         the result if the execution is succeeded; otherwise, return
         the result of another execution with shrinking.
 
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
         :return: PropResult
             The result for the execution of a property.
         """
@@ -109,17 +364,75 @@ class PropExecutor:
         inputs = None
         try:
             inputs = []
-            for arb in self.arbs:
-                inputs.append(arb.arbitrary())
-            is_valid = self.func(*inputs)
+            if self.timer is None:
+                inputs = self._next_inputs()
+            else:
+                inputs = self.timer.time('generation_ns', self._next_inputs)
+            is_valid = self._call(inputs)
+
+            if is_valid or not shrink:
+                return PropResult.finish(self.func.__name__, inputs, is_valid, 0)
+            else:
+                return self._shrink(inputs)
+
+        except Exception as error:
+            return PropResult.stop(self.func.__name__, inputs, error)
+
+    def execute_with(self, inputs, shrink=True):
+        """
+        Execute the property with given arguments.
+
+        :param inputs: list
+            The list of arguments to execute the property with.
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
+        :return: PropResult
+            The result for the execution of a property.
+        """
 
-            if is_valid:
+        try:
+            is_valid = self._call(inputs)
+
+            if is_valid or not shrink:
                 return PropResult.finish(self.func.__name__, inputs, is_valid, 0)
             else:
-                return self.execute_shrinker(inputs)
+                return self._shrink(inputs)
+
+        except Exception as error:
+            return PropResult.stop(self.func.__name__, inputs, error)
+
+    def _draw(self, choices):
+        for arb in self.arbs:
+            arb.set_random(choices)
+        self._forget()
+        return [arb.arbitrary() for arb in self.arbs]
+
+    def execute_choices(self, choices, shrink=True):
+        """
+        Execute the property with arguments made from recorded choices.
+
+        The arbitraries draw from a `ChoiceSequence` replaying `choices`,
+        and keep drawing from it afterwards until `set_random` is called.
 
+        :param choices: bytes
+            The bytes of choices recorded by a `ChoiceSequence`.
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
+        :return: PropResult
+            The result for the execution of a property.
+        """
+
+        inputs = None
+        try:
+            inputs = []
+            inputs = self._draw(ChoiceSequence(buffer=choices))
         except Exception as error:
             return PropResult.stop(self.func.__name__, inputs, error)
+        return self.execute_with(inputs, shrink)
 
     def execute_shrinker(self, inputs):
         """
@@ -138,21 +451,173 @@ class PropExecutor:
         raise NotImplementedError("PropExecutor#execute_shrinker")
 
 
+_worker_func = None
+
+
+def _init_worker(func):
+    global _worker_func
+    _worker_func = func
+
+
+def _call_worker_func(inputs):
+    return bool(_worker_func(*inputs))
+
+
 class PropExecutorWithShrink(PropExecutor):
     """
     A class which executes a property, and executes it with shrinking
     if fails.
     """
 
-    def __init__(self, arbs, func, max_shrinks):
-        super().__init__(arbs, func, max_shrinks)
+    DEFAULT_CACHE_SIZE = 1024
+
+    def __init__(self, arbs, func, max_shrinks, max_evaluations=None, shrink_timeout=None,
+                 shrink_workers=1, shrink_pool=PropExecutor.THREAD_POOL, cache_size=DEFAULT_CACHE_SIZE):
+        super().__init__(arbs, func, max_shrinks, max_evaluations, shrink_timeout, shrink_workers, shrink_pool)
+        self.cache_size = cache_size
+        self._pool = None
+
+    def _exhausted_budget(self):
+        if self.max_evaluations is not None and self._evaluations >= self.max_evaluations:
+            return PropResult.EVALUATIONS_BUDGET
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return PropResult.TIME_BUDGET
+        return None
+
+    def _evaluate(self, inputs, cache):
+        key = cache.key(inputs)
+        is_valid = cache.get(key)
+        if is_valid is None:
+            budget = self._exhausted_budget()
+            if budget is not None:
+                raise _BudgetExhausted(budget)
+            self._evaluations += 1
+            is_valid = bool(self.func(*inputs))
+            cache.put(key, is_valid)
+        return is_valid
+
+    def _open_pool(self):
+        if self.shrink_workers <= 1:
+            return None
+        elif self.shrink_pool == PropExecutor.PROCESS_POOL:
+            return concurrent.futures.ProcessPoolExecutor(
+                self.shrink_workers, mp_context=multiprocessing_context(),
+                initializer=_init_worker, initargs=(self.func,))
+        else:
+            return concurrent.futures.ThreadPoolExecutor(self.shrink_workers)
+
+    def _submit(self, inputs):
+        if self.shrink_pool == PropExecutor.PROCESS_POOL:
+            return self._pool.submit(_call_worker_func, inputs)
+        else:
+            return self._pool.submit(self.func, *inputs)
+
+    def _first_falsifying(self, candidates, cache):
+        """
+        Return the index of the first arguments in `candidates` which
+        falsify the property, or None if all of them satisfy it.
+
+        With a pool, the property is executed with all the candidates at
+        the same time, but the result is the first one in their order
+        and the executions after it are cancelled.
+        """
+
+        if self._pool is None:
+            for j, inputs in enumerate(candidates):
+                self._last_tried = inputs
+                if not self._evaluate(inputs, cache):
+                    return j
+            return None
+
+        keys = [cache.key(inputs) for inputs in candidates]
+        outcomes = [cache.get(key) for key in keys]
+        budget = None
+        for j, inputs in enumerate(candidates):
+            if outcomes[j] is None:
+                budget = self._exhausted_budget()
+                if budget is not None:
+                    break
+                self._evaluations += 1
+                outcomes[j] = self._submit(inputs)
+        try:
+            for j, inputs in enumerate(candidates):
+                is_valid = outcomes[j]
+                if is_valid is None:
+                    raise _BudgetExhausted(budget)
+                if isinstance(is_valid, concurrent.futures.Future):
+                    self._last_tried = inputs
+                    is_valid = bool(is_valid.result())
+                    cache.put(keys[j], is_valid)
+                if not is_valid:
+                    return j
+            return None
+        finally:
+            for outcome in outcomes:
+                if isinstance(outcome, concurrent.futures.Future):
+                    outcome.cancel()
+
+    def _shrink_argument(self, inputs, i, cache):
+        """
+        Return arguments falsifying the property, which are `inputs`
+        whose `i`-th argument is replaced with its first shrunk value
+        falsifying the property, or None if there is no such value.
+        """
+
+        try:
+            shrinking = iter(self.arbs[i].shrink(inputs[i]))
+        except TypeError:
+            return None
+
+        def shrunk_inputs():
+            for value in shrinking:
+                if value == inputs[i]:
+                    continue
+                new_inputs = inputs.copy()
+                new_inputs[i] = value
+                yield new_inputs
+
+        candidates = shrunk_inputs()
+        while True:
+            chunk = list(itertools.islice(candidates, max(self.shrink_workers, 1)))
+            if not chunk:
+                return None
+            j = self._first_falsifying(chunk, cache)
+            if j is not None:
+                return chunk[j]
+
+    def _shrinks(self, inputs, cache):
+        """
+        Yield arguments falsifying the property, each of which is shrunk
+        from the last one, until none of the arguments can be shrunk.
+        """
+
+        shrinkable = True
+        while shrinkable:
+            shrinkable = False
+            for i in range(len(self.arbs)):
+                while True:
+                    new_inputs = self._shrink_argument(inputs, i, cache)
+                    if new_inputs is None:
+                        break
+                    inputs = new_inputs
+                    shrinkable = True
+                    yield inputs
 
     def execute_shrinker(self, inputs):
         """
         Execute the property with shrinking.
 
-        Execute the property repeatedly with shrinking arguments, and
-        return the result.
+        Shrink one argument at a time while the others are fixed, until
+        none of the arguments can be shrunk any more or a budget runs
+        out, and return the result with the smallest arguments found.
+        If `self.shrink_workers` is more than 1, the property is executed
+        with that many shrunk arguments at the same time on a pool, and
+        the first of them in the order of shrinkers is taken.
+        The budgets are `self.max_shrinks` shrinks, `self.max_evaluations`
+        executions of the property and `self.shrink_timeout` seconds. The
+        outcomes of the last `self.cache_size` distinct arguments are
+        cached, so the property isn't executed again for arguments that
+        shrinkers offer more than once.
 
         :param inputs: list
             The list of arguments in the last execution.
@@ -162,44 +627,39 @@ class PropExecutorWithShrink(PropExecutor):
         """
 
         shrunk_number = 0
-        last_inputs = inputs.copy()
-        new_inputs = []
+        last_inputs = list(inputs[:len(self.arbs)])
+        self._last_tried = last_inputs
+        self._evaluations = 0
+        self._deadline = None if self.shrink_timeout is None else time.monotonic() + self.shrink_timeout
+        cache = _EvaluationCache(self.cache_size)
+        cache.put(cache.key(last_inputs), False)
+        exhausted_budget = None
+        self._pool = self._open_pool()
         try:
-            shrinkings = []
-            for _ in range(self.max_shrinks):
-                zipped = zip(self.arbs, last_inputs)
-                shrinkings.clear()
-                for arb, v in zipped:
-                    shrinkings.append(arb.shrink(v))
-                stop_shrinking = False
-                while True:
-                    new_inputs.clear()
-                    try:
-                        for shrinking in shrinkings:
-                            new_inputs.append(next(shrinking))
-                    except TypeError:
-                        break
-                    except StopIteration:
-                        break
-
-                    if len(new_inputs) != len(self.arbs):
-                        break
-
-                    if new_inputs == last_inputs:
-                        stop_shrinking = True
-                        break
-
-                    is_valid = self.func(*new_inputs)
-                    if not is_valid:
-                        last_inputs = new_inputs.copy()
-                        shrunk_number += 1
-                        break
-
-                if stop_shrinking:
+            shrinks = self._shrinks(last_inputs, cache)
+            while True:
+                new_inputs = next(shrinks, None)
+                if new_inputs is None:
                     break
-            return PropResult.finish(self.func.__name__, last_inputs, False, shrunk_number)
+                if shrunk_number >= self.max_shrinks:
+                    # a further shrink is pending, beyond the budget
+                    raise _BudgetExhausted(PropResult.SHRINKS_BUDGET)
+                last_inputs = new_inputs
+                shrunk_number += 1
+        except _BudgetExhausted as exhausted:
+            exhausted_budget = exhausted.budget
         except Exception as error:
-            return PropResult.stop(self.func.__name__, new_inputs, error)
+            result = PropResult.stop(self.func.__name__, self._last_tried, error)
+            result.cache_hits = cache.hits
+            return result
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+        result = PropResult.finish(self.func.__name__, last_inputs, False, shrunk_number)
+        result.cache_hits = cache.hits
+        result.exhausted_budget = exhausted_budget
+        return result
 
 
 class PropExecutorWithoutShrink(PropExecutor):
@@ -208,8 +668,9 @@ class PropExecutorWithoutShrink(PropExecutor):
     result if fails.
     """
 
-    def __init__(self, arbs, func, max_shrinks):
-        super().__init__(arbs, func, max_shrinks)
+    def __init__(self, arbs, func, max_shrinks, max_evaluations=None, shrink_timeout=None,
+                 shrink_workers=1, shrink_pool=PropExecutor.THREAD_POOL):
+        super().__init__(arbs, func, max_shrinks, max_evaluations, shrink_timeout, shrink_workers, shrink_pool)
 
     def execute_shrinker(self, inputs):
         """
@@ -225,24 +686,491 @@ class PropExecutorWithoutShrink(PropExecutor):
         return PropResult.finish(self.func.__name__, inputs, False, 0)
 
 
+class PropExecutorVectorized(PropExecutorWithShrink):
+    """
+    A class which executes a vectorized property on a block of
+    arguments at once, and executes it with shrinking if fails.
+
+    The vectorized property takes columns of arguments, which are NumPy
+    arrays if NumPy is installed, and returns a boolean mask. A
+    counter-example is shrunk by calling it with 1-length columns.
+    """
+
+    def __init__(self, arbs, func, max_shrinks, max_evaluations=None, shrink_timeout=None,
+                 shrink_workers=1, shrink_pool=PropExecutor.THREAD_POOL):
+        def scalar_func(*inputs):
+            mask = func(*[engine.as_array([value]) for value in inputs])
+            return bool(mask[0])
+        scalar_func.__name__ = func.__name__
+
+        super().__init__(arbs, scalar_func, max_shrinks, max_evaluations, shrink_timeout,
+                         shrink_workers, shrink_pool)
+        self.vectorized_func = func
+        self._columns = []
+        self._mask = []
+        self._index = 0
+
+    def prefetch(self, n, start=0, size=None):
+        """
+        Make arguments for the next executions in bulk.
+
+        The vectorized property is executed on the whole block of `n`
+        arguments when the next execution needs them, and its results
+        are handed out one execution at a time from the `start`-th one.
+
+        :param n: int
+            The number of arguments in the block.
+        :param start: int
+            The index of the first arguments to hand out. Defaults to 0.
+        :param size: int
+            The size of arguments, which is passed to sized arbitraries.
+            Defaults to None.
+        """
+
+        super().prefetch(n, start, size)
+        self._mask = []
+
+    def _execute_block(self):
+        n, start = self._to_prefetch
+        self._to_prefetch = (0, 0)
+        n = max(n, 1)
+        if self.timer is None:
+            self._columns = self._generate_columns(n)
+        else:
+            self._columns = self.timer.time('generation_ns', self._generate_columns, n)
+        arrays = [engine.as_array(column) for column in self._columns]
+        if self.timer is None:
+            mask = self.vectorized_func(*arrays)
+        else:
+            mask = self.timer.time('property_ns', self.vectorized_func, *arrays)
+        self._mask = mask.tolist() if hasattr(mask, 'tolist') else list(mask)
+        self._index = start
+
+    def execute(self, shrink=True):
+        """
+        Execute the property.
+
+        Execute the vectorized property on a block of arguments if the
+        results of the last block have run out, and return the result
+        of the next arguments in the block, or the result of another
+        execution with shrinking if they falsify the property.
+
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
+        :return: PropResult
+            The result for the execution of a property.
+        """
+
+        inputs = None
+        try:
+            if self._index >= len(self._mask):
+                inputs = []
+                self._execute_block()
+            i = self._index
+            self._index += 1
+            inputs = [column[i] for column in self._columns]
+            is_valid = bool(self._mask[i])
+
+            if is_valid or not shrink:
+                return PropResult.finish(self.func.__name__, inputs, is_valid, 0)
+            else:
+                return self._shrink(inputs)
+
+        except Exception as error:
+            return PropResult.stop(self.func.__name__, inputs, error)
+
+    def execute_block(self, n, shrink=True):
+        """
+        Execute the property for the next `n` arguments at once.
+
+        The results of the block are scanned for the first falsifying
+        arguments without a PropResult for each of the others, so a
+        block costs a single call of the vectorized property.
+
+        :param n: int
+            The number of arguments to execute the property with.
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
+        :return: tuple
+            A tuple of the number of arguments which satisfied the
+            property before the first which didn't, and the PropResult
+            of that one, which is None if all of them satisfied it.
+        """
+
+        inputs = None
+        try:
+            if self._index >= len(self._mask):
+                inputs = []
+                self._execute_block()
+            begin = self._index
+            end = min(begin + n, len(self._mask))
+            try:
+                i = self._mask.index(False, begin, end)
+            except ValueError:
+                self._index = end
+                return end - begin, None
+            self._index = i + 1
+            inputs = [column[i] for column in self._columns]
+            if shrink:
+                return i - begin, self._shrink(inputs)
+            return i - begin, PropResult.finish(self.func.__name__, inputs, False, 0)
+
+        except Exception as error:
+            return 0, PropResult.stop(self.func.__name__, inputs, error)
+
+
+class PropExecutorWithChoices(PropExecutorWithShrink):
+    """
+    A class which executes a property with arguments made from recorded
+    choices, and executes it with shrinking the choices if fails.
+
+    Each execution draws its arguments from a new `ChoiceSequence`, so
+    they are fully described by the bytes it records, which are kept
+    as `choices` of a failed result. A counter-example is shrunk by
+    shrinking its bytes with `ChoiceShrinker` and making the arguments
+    again from them, so arguments of any arbitrary are shrunk, even the
+    ones without a shrinker. Arguments aren't prefetched in bulk, and
+    their size isn't passed to sized arbitraries, so that the bytes
+    alone describe them.
+    """
+
+    def __init__(self, arbs, func, max_shrinks, max_evaluations=None, shrink_timeout=None,
+                 shrink_workers=1, shrink_pool=PropExecutor.THREAD_POOL,
+                 cache_size=PropExecutorWithShrink.DEFAULT_CACHE_SIZE):
+        super().__init__(arbs, func, max_shrinks, max_evaluations, shrink_timeout, shrink_workers, shrink_pool,
+                         cache_size)
+        self.shrinker = ChoiceShrinker()
+        self.random = to_random(None)
+        self.choices = None
+        self._inputs = None
+        self._shrinking_choices = None
+
+    def set_random(self, rng):
+        """
+        Draw the seed of the choices of each execution from a given
+        random source.
+
+        :param rng: random.Random | int
+            The random source or its seed.
+        """
+
+        self.random = to_random(rng)
+
+    def prefetch(self, n, start=0, size=None):
+        """
+        Skip to the `start`-th execution of a block of `n` executions.
+
+        :param n: int
+            The number of executions in the block.
+        :param start: int
+            The index of the next execution. Defaults to 0.
+        :param size: int
+            The size of arguments, which is ignored. Defaults to None.
+        """
+
+        for _ in range(start):
+            self.random.getrandbits(64)
+
+    def _replay(self, choices):
+        sequence = ChoiceSequence(buffer=choices)
+        inputs = self._draw(sequence)
+        return inputs, sequence.choices_made()
+
+    def _next_inputs(self):
+        sequence = ChoiceSequence(self.random.getrandbits(64))
+        self._inputs = None
+        inputs = self._draw(sequence)
+        self._inputs, self.choices = inputs, sequence.choices_made()
+        return inputs
+
+    def _with_choices(self, result):
+        if result.choices is None and self._inputs is not None and result.get()[1] is self._inputs:
+            result.choices = self.choices
+        return result
+
+    def execute(self, shrink=True):
+        """
+        Execute the property.
+
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
+        :return: PropResult
+            The result for the execution of a property, whose `choices`
+            are the bytes of its arguments if it fails.
+        """
+
+        return self._with_choices(super().execute(shrink))
+
+    def execute_choices(self, choices, shrink=True):
+        """
+        Execute the property with arguments made from recorded choices.
+
+        :param choices: bytes
+            The bytes of choices recorded by a `ChoiceSequence`.
+        :param shrink: bool
+            Whether to shrink the choices if the property fails. Defaults
+            to True.
+
+        :return: PropResult
+            The result for the execution of a property.
+        """
+
+        inputs = None
+        try:
+            inputs = []
+            self._inputs = None
+            inputs, self.choices = self._replay(choices)
+            self._inputs = inputs
+        except Exception as error:
+            return PropResult.stop(self.func.__name__, inputs, error)
+        return self._with_choices(self.execute_with(inputs, shrink))
+
+    def _shrink_choices(self, choices, cache):
+        """
+        Return a tuple of arguments falsifying the property and their
+        choices, which are made from the first shrunk choices of
+        `choices` falsifying the property, or None if there is no such
+        choices. Shrunk choices which fail to make arguments are skipped.
+        """
+
+        def shrunk_inputs():
+            for candidate in self.shrinker.shrink(choices):
+                try:
+                    inputs, made = self._replay(candidate)
+                except Exception:
+                    continue
+                if (len(made), made) < (len(choices), choices):
+                    yield inputs, made
+
+        candidates = shrunk_inputs()
+        while True:
+            chunk = list(itertools.islice(candidates, max(self.shrink_workers, 1)))
+            if not chunk:
+                return None
+            j = self._first_falsifying([inputs for inputs, _ in chunk], cache)
+            if j is not None:
+                return chunk[j]
+
+    def _shrinks(self, inputs, cache):
+        if self._shrinking_choices is None:
+            yield from super()._shrinks(inputs, cache)
+            return
+        while True:
+            shrunk = self._shrink_choices(self._shrinking_choices, cache)
+            if shrunk is None:
+                return
+            inputs, self._shrinking_choices = shrunk
+            yield inputs
+
+    def execute_shrinker(self, inputs):
+        """
+        Execute the property with shrinking.
+
+        If `inputs` are the arguments of the last execution, their
+        choices are shrunk until no shrunk choices falsify the property
+        or a budget runs out. Otherwise, e.g. for arguments given to
+        `execute_with`, each argument is shrunk by its arbitrary.
+
+        :param inputs: list
+            The list of arguments in the last execution.
+
+        :return: PropResult
+            The result for the execution of a property, whose `choices`
+            are the bytes of the shrunk arguments if they were shrunk
+            with choices.
+        """
+
+        self._shrinking_choices = self.choices if self._inputs is not None and inputs is self._inputs else None
+        try:
+            result = super().execute_shrinker(inputs)
+            if result.has_finished():
+                result.choices = self._shrinking_choices
+            return result
+        finally:
+            self._shrinking_choices = None
+
+
 class Prop:
     """A class representing a property."""
 
-    def __init__(self, arbs, func, executor_type):
-        self.executor = executor_type(arbs, func, 100)
+    DEFAULT_MAX_SHRINKS = 100
+
+    def __init__(self, arbs, func, executor_type, max_shrinks=DEFAULT_MAX_SHRINKS, max_evaluations=None,
+                 shrink_timeout=None, shrink_workers=1, shrink_pool=PropExecutor.THREAD_POOL):
+        """
+        Initialize a Prop instance.
+
+        :param arbs: list
+            The Arbitrary list for arguments.
+        :param func: function
+            The function representing a property.
+        :param executor_type: type
+            The type of PropExecutor to execute the property.
+        :param max_shrinks: int
+            The maximum number of times to shrink arguments. Defaults to
+            `DEFAULT_MAX_SHRINKS`.
+        :param max_evaluations: int
+            The maximum number of times to execute the property while
+            shrinking. Defaults to None, which means no limit.
+        :param shrink_timeout: float
+            The maximum seconds to spend shrinking. Defaults to None,
+            which means no limit.
+        :param shrink_workers: int
+            The number of shrunk arguments to execute the property with
+            at the same time. Defaults to 1.
+        :param shrink_pool: str
+            The pool to execute the property on while shrinking, which
+            is 'thread' or 'process'. Defaults to 'thread'.
+        """
+
+        self.func = func
+        self.executor = executor_type(arbs, func, max_shrinks, max_evaluations=max_evaluations,
+                                      shrink_timeout=shrink_timeout, shrink_workers=shrink_workers,
+                                      shrink_pool=shrink_pool)
 
-    def execute(self):
+    def execute(self, shrink=True):
         """
         Execute the property.
 
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
         :return: PropResult
             The result for the execution of a property.
         """
 
-        return self.executor.execute()
+        return self.executor.execute(shrink)
+
+    def execute_with(self, inputs, shrink=True):
+        """
+        Execute the property with given arguments.
+
+        :param inputs: list
+            The list of arguments to execute the property with.
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
+        :return: PropResult
+            The result for the execution of a property.
+        """
 
+        return self.executor.execute_with(inputs, shrink)
 
-def for_all_shrink(arbs, func):
+    def execute_choices(self, choices, shrink=True):
+        """
+        Execute the property with arguments made from recorded choices.
+
+        :param choices: bytes
+            The bytes of choices recorded by a `ChoiceSequence`, such as
+            `choices` of a failed result.
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
+        :return: PropResult
+            The result for the execution of a property.
+        """
+
+        return self.executor.execute_choices(choices, shrink)
+
+    def set_random(self, rng):
+        """
+        Make arguments of the property with a given random source.
+
+        :param rng: random.Random | int
+            The random source or its seed.
+        """
+
+        self.executor.set_random(rng)
+
+    def set_timer(self, timer):
+        """
+        Make the property measure the time of its phases.
+
+        :param timer: PropTimer
+            The timer to add the time to, or None not to measure it.
+        """
+
+        self.executor.timer = timer
+
+    def rejections(self):
+        """
+        Return the numbers of values drawn and rejected by predicates of
+        the Gen of each argument.
+
+        :return: list
+            The list of (draws, rejections) tuples.
+        """
+
+        return self.executor.rejections()
+
+    @property
+    def vectorized(self):
+        """
+        Whether the property is executed on blocks of arguments at once
+        with `execute_block`.
+        """
+
+        return hasattr(self.executor, 'execute_block')
+
+    def execute_block(self, n, shrink=True):
+        """
+        Execute the vectorized property for the next `n` arguments at
+        once.
+
+        :param n: int
+            The number of arguments to execute the property with.
+        :param shrink: bool
+            Whether to shrink arguments if the property fails. Defaults
+            to True.
+
+        :return: tuple
+            A tuple of the number of arguments which satisfied the
+            property before the first which didn't, and the PropResult
+            of that one, which is None if all of them satisfied it.
+        """
+
+        return self.executor.execute_block(n, shrink)
+
+    def prefetch(self, n, start=0, size=None):
+        """
+        Make arguments of the property for the next executions in bulk.
+
+        :param n: int
+            The number of arguments in the block.
+        :param start: int
+            The index of the first arguments to hand out. Defaults to 0.
+        :param size: int
+            The size of arguments, which is passed to sized arbitraries.
+            Defaults to None, which means their own maximum sizes.
+        """
+
+        self.executor.prefetch(n, start, size)
+
+    def shrink(self, inputs):
+        """
+        Shrink the counter-example of the property.
+
+        :param inputs: list
+            The list of arguments which falsified the property.
+
+        :return: PropResult
+            The result for the execution of a property with shrinking.
+        """
+
+        return self.executor.execute_shrinker(inputs)
+
+
+def for_all_shrink(arbs, func, max_shrinks=Prop.DEFAULT_MAX_SHRINKS, max_evaluations=None, shrink_timeout=None,
+                   shrink_workers=1, shrink_pool=PropExecutor.THREAD_POOL):
     """
     Create a property which shrinks arguments if fails.
 
@@ -250,13 +1178,64 @@ def for_all_shrink(arbs, func):
         The Arbitrary list for arguments.
     :param func: function
         The function representing a property.
+    :param max_shrinks: int
+        The maximum number of times to shrink arguments. Defaults to 100.
+    :param max_evaluations: int
+        The maximum number of times to execute the property while
+        shrinking. Defaults to None, which means no limit.
+    :param shrink_timeout: float
+        The maximum seconds to spend shrinking. Defaults to None, which
+        means no limit.
+    :param shrink_workers: int
+        The number of shrunk arguments to execute the property with at
+        the same time. Defaults to 1.
+    :param shrink_pool: str
+        The pool to execute the property on while shrinking, which is
+        'thread' or 'process'. Defaults to 'thread'.
 
     :return: Prop
         The Prop instance whose executor_type is
         PropExecutorWithShrink.
     """
 
-    return Prop(arbs, func, executor_type=PropExecutorWithShrink)
+    return Prop(arbs, func, executor_type=PropExecutorWithShrink, max_shrinks=max_shrinks,
+                max_evaluations=max_evaluations, shrink_timeout=shrink_timeout,
+                shrink_workers=shrink_workers, shrink_pool=shrink_pool)
+
+
+def for_all_choices(arbs, func, max_shrinks=Prop.DEFAULT_MAX_SHRINKS, max_evaluations=None, shrink_timeout=None,
+                    shrink_workers=1, shrink_pool=PropExecutor.THREAD_POOL):
+    """
+    Create a property which records the choices of its arguments, and
+    shrinks the choices if fails.
+
+    :param arbs: list
+        The Arbitrary list for arguments.
+    :param func: function
+        The function representing a property.
+    :param max_shrinks: int
+        The maximum number of times to shrink arguments. Defaults to 100.
+    :param max_evaluations: int
+        The maximum number of times to execute the property while
+        shrinking. Defaults to None, which means no limit.
+    :param shrink_timeout: float
+        The maximum seconds to spend shrinking. Defaults to None, which
+        means no limit.
+    :param shrink_workers: int
+        The number of shrunk arguments to execute the property with at
+        the same time. Defaults to 1.
+    :param shrink_pool: str
+        The pool to execute the property on while shrinking, which is
+        'thread' or 'process'. Defaults to 'thread'.
+
+    :return: Prop
+        The Prop instance whose executor_type is
+        PropExecutorWithChoices.
+    """
+
+    return Prop(arbs, func, executor_type=PropExecutorWithChoices, max_shrinks=max_shrinks,
+                max_evaluations=max_evaluations, shrink_timeout=shrink_timeout,
+                shrink_workers=shrink_workers, shrink_pool=shrink_pool)
 
 
 def for_all_no_shrink(arbs, func):
@@ -276,7 +1255,8 @@ def for_all_no_shrink(arbs, func):
     return Prop(arbs, func, executor_type=PropExecutorWithoutShrink)
 
 
-def for_all(arbs, func):
+def for_all(arbs, func, max_shrinks=Prop.DEFAULT_MAX_SHRINKS, max_evaluations=None, shrink_timeout=None,
+            shrink_workers=1, shrink_pool=PropExecutor.THREAD_POOL):
     """
     Create a property.
 
@@ -284,12 +1264,62 @@ def for_all(arbs, func):
         The Arbitrary list for arguments.
     :param func: function
         The function representing a property.
+    :param max_shrinks: int
+        The maximum number of times to shrink arguments. Defaults to 100.
+    :param max_evaluations: int
+        The maximum number of times to execute the property while
+        shrinking. Defaults to None, which means no limit.
+    :param shrink_timeout: float
+        The maximum seconds to spend shrinking. Defaults to None, which
+        means no limit.
+    :param shrink_workers: int
+        The number of shrunk arguments to execute the property with at
+        the same time. Defaults to 1.
+    :param shrink_pool: str
+        The pool to execute the property on while shrinking, which is
+        'thread' or 'process'. Defaults to 'thread'.
 
     :return: Prop
         The Prop instance which is created by for_all_shrink.
     """
 
-    return for_all_shrink(arbs, func)
+    return for_all_shrink(arbs, func, max_shrinks=max_shrinks, max_evaluations=max_evaluations,
+                          shrink_timeout=shrink_timeout, shrink_workers=shrink_workers, shrink_pool=shrink_pool)
+
+
+def for_all_vectorized(arbs, func, max_shrinks=Prop.DEFAULT_MAX_SHRINKS, max_evaluations=None, shrink_timeout=None,
+                       shrink_workers=1, shrink_pool=PropExecutor.THREAD_POOL):
+    """
+    Create a vectorized property which shrinks arguments if fails.
+
+    :param arbs: list
+        The Arbitrary list for arguments.
+    :param func: function
+        The function representing a property, which takes a column of
+        arguments for each Arbitrary and returns a boolean mask.
+    :param max_shrinks: int
+        The maximum number of times to shrink arguments. Defaults to 100.
+    :param max_evaluations: int
+        The maximum number of times to execute the property while
+        shrinking. Defaults to None, which means no limit.
+    :param shrink_timeout: float
+        The maximum seconds to spend shrinking. Defaults to None, which
+        means no limit.
+    :param shrink_workers: int
+        The number of shrunk arguments to execute the property with at
+        the same time. Defaults to 1.
+    :param shrink_pool: str
+        The pool to execute the property on while shrinking, which is
+        'thread' or 'process'. Defaults to 'thread'.
+
+    :return: Prop
+        The Prop instance whose executor_type is
+        PropExecutorVectorized.
+    """
+
+    return Prop(arbs, func, executor_type=PropExecutorVectorized, max_shrinks=max_shrinks,
+                max_evaluations=max_evaluations, shrink_timeout=shrink_timeout,
+                shrink_workers=shrink_workers, shrink_pool=shrink_pool)
 
 
 class Properties:
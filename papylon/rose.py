@@ -0,0 +1,91 @@
+"""Classes of lazy rose trees to shrink generated values."""
+
+
+def _no_children():
+    return iter([])
+
+
+class Rose:
+    """
+    A tree of a generated value whose children are its shrunk values.
+
+    The children are computed only when they are visited, so a tree as
+    large as the shrinking space of a value costs nothing until a
+    counter-example is shrunk along one of its paths.
+    """
+
+    def __init__(self, value, children=None):
+        """
+        Initialize a Rose instance.
+
+        :param value:
+            The value at the root of the tree.
+        :param children: function
+            The function which takes no argument and returns an iterable
+            of Rose instances of the shrunk values, the most shrunk
+            first. Defaults to None, which means no children.
+        """
+
+        self.value = value
+        self._children = _no_children if children is None else children
+
+    def children(self):
+        """
+        Return an iterator of the trees of the shrunk values.
+
+        :return:
+            The iterator of Rose instances, computed lazily.
+        """
+
+        return iter(self._children())
+
+    def map(self, f):
+        """
+        Return a tree whose values are mapped with `f`.
+
+        :param f: function
+            The function to apply to every value of the tree.
+
+        :return: Rose
+            The mapped tree. Its children are mapped when visited.
+        """
+
+        return Rose(f(self.value), lambda: (child.map(f) for child in self.children()))
+
+    def filter(self, predicate):
+        """
+        Return a tree without the subtrees whose values don't satisfy
+        `predicate`.
+
+        The value at the root is kept as it is, so it should satisfy
+        `predicate` itself.
+
+        :param predicate: function
+            The function to filter every value of the tree.
+
+        :return: Rose
+            The filtered tree. Its children are filtered when visited.
+        """
+
+        return Rose(self.value, lambda: (child.filter(predicate) for child in self.children()
+                                         if predicate(child.value)))
+
+    @staticmethod
+    def unfold(value, shrink):
+        """
+        Return a tree of `value` expanded with a shrinking function.
+
+        :param value:
+            The value at the root of the tree.
+        :param shrink: function
+            The function which takes a value and returns an iterable of
+            its shrunk values. None means the tree has no children.
+
+        :return: Rose
+            The tree whose children are unfolded from `shrink(value)`
+            when visited.
+        """
+
+        if shrink is None:
+            return Rose(value)
+        return Rose(value, lambda: (Rose.unfold(shrunk, shrink) for shrunk in shrink(value)))
@@ -1,5 +1,6 @@
 """Classes to shrink results with their counter-examples."""
 
+import array
 import itertools
 import math
 import datetime
@@ -21,21 +22,42 @@ class AbstractShrinker:
         raise NotImplementedError("AbstractShrinker#shrink")
 
 
-def _interleave(xs, ys):
-    _xs = xs
-    _ys = ys
-    result = []
-    while True:
-        if len(_xs) == 0:
-            return itertools.chain(result, _ys)
-        if len(_ys) == 0:
-            return itertools.chain(result, _xs)
-        x = _xs[0]
-        _xs = _xs[1:]
-        y = _ys[0]
-        _ys = _ys[1:]
-        result.append(x)
-        result.append(y)
+def _towards(value, halfs):
+    """
+    Yield values between `value` and 0 lazily, closer to `value` later.
+
+    Each value of `halfs` is subtracted from `value`, and the result is
+    yielded followed by its negation.
+    """
+
+    for n in halfs:
+        shrunk = value - n
+        yield shrunk
+        yield -shrunk
+
+
+def _deletions(value):
+    """
+    Yield copies of a sequence with a chunk deleted, larger chunks first.
+
+    Like delta debugging (ddmin), the chunk size starts from the whole
+    length and is halved down to 1, so a long counter-example is shrunk
+    in O(log n) steps when large chunks of it can go. Each copy is made
+    by slicing, so this works on both lists and strs.
+    """
+
+    length = len(value)
+    deleted = set()
+    size = length
+    while size > 0:
+        for start in range(0, length, size):
+            end = min(start + size, length)
+            if (start, end) not in deleted:
+                deleted.add((start, end))
+                yield value[:start] + value[end:]
+        if size == 1:
+            break
+        size = (size + 1) // 2
 
 
 def _empty_iterable():
@@ -56,20 +78,19 @@ class IntShrinker(AbstractShrinker):
             The int iterator which is shrunk with a given value.
         """
 
+        def half(n):
+            # truncate toward zero without going through float
+            return -(-n // 2) if n < 0 else n // 2
+
         def halfs(n):
-            result = []
-            if n != 0:
-                v = n
-                while v != 0:
-                    result.append(v)
-                    v = int(v / 2)
-            return result
+            while n != 0:
+                yield n
+                n = half(n)
 
         if value == 0:
             return _empty_iterable()
         else:
-            ns = list(map(lambda n: value - n, halfs(int(value / 2))))
-            return itertools.chain([0], _interleave(ns, list(map(lambda n: (-1) * n, ns))))
+            return itertools.chain([0], _towards(value, halfs(half(value))))
 
 
 class FloatShrinker(AbstractShrinker):
@@ -87,23 +108,16 @@ class FloatShrinker(AbstractShrinker):
         """
 
         def halfs(n):
-            result = []
-            if n != 0:
-                v = n
-                # TODO: precision problem.
-                # given too large float number, shrink treats too large iterable.
-                while v < -0.001 or 0.001 < v:
-                    result.append(v)
-                    v /= 2
-            return result
+            while n < -0.001 or 0.001 < n:
+                yield n
+                n /= 2
 
         if value == 0:
             return _empty_iterable()
         elif (abs(value) == float('inf')) or (math.isnan(value)):
             return iter([0.0])
         else:
-            ns = list(map(lambda n: value - n, halfs(value / 2)))
-            return itertools.chain([0], _interleave(ns, list(map(lambda n: (-1) * n, ns))))
+            return itertools.chain([0.0], _towards(value, halfs(value / 2)))
 
 
 class CharShrinker(AbstractShrinker):
@@ -166,22 +180,7 @@ class ListShrinker(AbstractShrinker):
             The list iterator which is shrunk with a given value.
         """
 
-        def shrink_list(l):
-            if not l:
-                return []
-            elif len(l) == 1:
-                yield []
-            else:
-                x = l[0]
-                xs = l[1:]
-                yield xs
-                for _xs in shrink_list(xs):
-                    yield list(itertools.chain([x], _xs))
-                # should elements be shrunk?
-                # for _x in shrink_by_type(x):
-                #     yield itertools.chain([_x], xs)
-
-        return iter(shrink_list(value))
+        return _deletions(value)
 
 
 class StrShrinker(AbstractShrinker):
@@ -198,5 +197,109 @@ class StrShrinker(AbstractShrinker):
             The str iterator which is shrunk with a given value.
         """
 
-        shrinker = ListShrinker()
-        return iter(map(lambda s: str.join("", s), shrinker.shrink(value)))
+        return _deletions(value)
+
+
+class ChoiceShrinker(AbstractShrinker):
+    """A shrinker of bytes of recorded choices."""
+
+    def shrink(self, value):
+        """
+        Return a bytes iterator of shrunk result.
+
+        Chunks are deleted first, then zeroed, and then each byte is
+        lowered towards 0, or by 1 borrowing from the next byte set to
+        0xff, so every shrunk value is shorter, or as long and
+        lexicographically smaller.
+
+        :param value: bytes
+            The bytes of choices of counter-example.
+
+        :return:
+            The bytes iterator which is shrunk with a given value.
+        """
+
+        def zeroings():
+            length = len(value)
+            size = length
+            while size > 0:
+                for start in range(0, length, size):
+                    end = min(start + size, length)
+                    if any(value[start:end]):
+                        yield value[:start] + bytes(end - start) + value[end:]
+                if size == 1:
+                    break
+                size = (size + 1) // 2
+
+        def lowerings():
+            for i, byte in enumerate(value):
+                n = byte // 2
+                while n > 0:
+                    yield value[:i] + bytes([byte - n]) + value[i + 1:]
+                    n //= 2
+                if byte > 0 and i + 1 < len(value) and value[i + 1] != 0xff:
+                    yield value[:i] + bytes([byte - 1, 0xff]) + value[i + 2:]
+
+        return itertools.chain(_deletions(value), zeroings(), lowerings())
+
+
+class ArrayShrinker(AbstractShrinker):
+    """A shrinker of array.array."""
+
+    def __init__(self, min_value=None, max_value=None):
+        """
+        Initialize an ArrayShrinker instance.
+
+        :param min_value: int | float
+            The minimum number of the arrays. Defaults to None, which
+            means no bound.
+        :param max_value: int | float
+            The maximum number of the arrays. Defaults to None, which
+            means no bound.
+        """
+
+        target = 0
+        if min_value is not None and min_value > target:
+            target = min_value
+        if max_value is not None and max_value < target:
+            target = max_value
+        self.target = target
+
+    def shrink(self, value):
+        """
+        Return an array iterator of shrunk result.
+
+        Chunks are deleted first, like `ListShrinker`, and then zeroed,
+        halves first, or filled with the number in the bounds closest to
+        0 if 0 is out of them. Both are made by slicing and
+        concatenating arrays, so the memory of the elements is copied at
+        once rather than element by element.
+
+        :param value: array.array
+            The array value of counter-example.
+
+        :return:
+            The array iterator which is shrunk with a given value.
+        """
+
+        target = self.target
+
+        def fill(n):
+            if target == 0:
+                return array.array(value.typecode, bytes(value.itemsize * n))
+            return array.array(value.typecode, [target]) * n
+
+        def zeroings():
+            length = len(value)
+            size = length
+            while size > 0:
+                for start in range(0, length, size):
+                    end = min(start + size, length)
+                    zeros = fill(end - start)
+                    if value[start:end] != zeros:
+                        yield value[:start] + zeros + value[end:]
+                if size == 1:
+                    break
+                size = (size + 1) // 2
+
+        return itertools.chain(_deletions(value), zeroings())
@@ -2,6 +2,24 @@
 
 import sys
 import traceback
+import multiprocessing
+
+
+def multiprocessing_context():
+    """
+    Return the multiprocessing context to run properties on.
+
+    The 'fork' start method is preferred where it is available, because
+    forked workers inherit properties, so their functions don't have to
+    be pickled and lambdas can be used.
+
+    :return: multiprocessing.context.BaseContext
+        The multiprocessing context.
+    """
+
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
 
 
 def pluralize(singular, plural, number):
@@ -39,10 +57,29 @@ def pluralize_test(number):
     return pluralize("test", "tests", number)
 
 
+def format_timing(timing):
+    """
+    Format the time of the phases of checking.
+
+    :param timing:
+        A CheckTiming instance.
+
+    :return: str
+        A string of formatted time.
+    """
+
+    return ("Took {0:.3f} s ({1:.1f} tests/s): p50 {2:.3f} ms, p99 {3:.3f} ms per test, "
+            "generation {4:.3f} s, property {5:.3f} s, shrinking {6:.3f} s.").format(
+        timing.total_ns / 1e9, timing.tests_per_second, timing.p50_ns / 1e6, timing.p99_ns / 1e6,
+        timing.generation_ns / 1e9, timing.property_ns / 1e9, timing.shrink_ns / 1e9)
+
+
 def convert_to_outputs(result):
     """
     Convert result to suitable formatted string.
 
+    The time of the phases of checking is appended if it was measured.
+
     :param result:
         A CheckResult instance.
 
@@ -50,13 +87,23 @@ def convert_to_outputs(result):
         A string of formatted result.
     """
 
+    text, is_proved, file_object = _convert_result(result)
+    timing = getattr(result, 'timing', None)
+    if timing is not None:
+        text += "\n" + format_timing(timing)
+    return text, is_proved, file_object
+
+
+def _convert_result(result):
     if result.has_passed():
         (count,) = result.get()
         return "OK, passed {0}.".format(pluralize_test(count)), True, sys.stdout
     elif result.has_falsified():
         run_count, inputs, shrunk_number = result.get()
-        text = "Falsified after {0} ({1}):\n> {2}".format(
-            pluralize_test(run_count), pluralize("shrink", "shrinks", shrunk_number), inputs)
+        shrinks = pluralize("shrink", "shrinks", shrunk_number)
+        if result.exhausted_budget is not None:
+            shrinks += ", stopped by {0}".format(result.exhausted_budget)
+        text = "Falsified after {0} ({1}):\n> {2}".format(pluralize_test(run_count), shrinks, inputs)
         return text, False, sys.stdout
     elif result.has_error_occurred():
         run_count, inputs, error = result.get()
@@ -71,7 +118,10 @@ def convert_to_outputs(result):
     elif result.has_troubled():
         error, ex_traceback = result.get()
         text = "[Papylon] Some exception is raised:\n{0}".format(error.args[0])
-        texts = traceback.format_tb(ex_traceback, limit=10)
+        if isinstance(ex_traceback, list):
+            texts = ex_traceback
+        else:
+            texts = traceback.format_tb(ex_traceback, limit=10)
         for t in texts:
             text = text + t
         return text, False, sys.stderr
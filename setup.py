@@ -16,6 +16,10 @@ install_requires = [
     'setuptools'
 ]
 
+extras_require = {
+    'numpy': ['numpy >= 1.17']
+}
+
 tests_require = [
     'pytest >= 2.6.4'
 ]
@@ -29,9 +33,12 @@ setup(name='papylon',
           "Intended Audience :: Developers",
           "License :: OSI Approved :: MIT License",
           "Programming Language :: Python",
-          "Programming Language :: Python :: 3.3",
-          "Programming Language :: Python :: 3.4",
-          "Programming Language :: Python :: 3.5",
+          "Programming Language :: Python :: 3",
+          "Programming Language :: Python :: 3 :: Only",
+          "Programming Language :: Python :: 3.9",
+          "Programming Language :: Python :: 3.10",
+          "Programming Language :: Python :: 3.11",
+          "Programming Language :: Python :: 3.12",
           "Topic :: Software Development :: Libraries",
           "Topic :: Software Development :: Testing",
           "Topic :: Utilities"
@@ -42,7 +49,9 @@ setup(name='papylon',
       license='The MIT License (MIT)',
       url='https://github.com/Gab-km/papylon',
       packages=find_packages(),
+      python_requires='>=3.9',
       include_package_data=True,
       install_requires=install_requires,
+      extras_require=extras_require,
       tests_require=tests_require,
       test_suite='py.test')
@@ -59,6 +59,38 @@ class TestArbChar:
         expected = ['a', 'b', 'c']
         assert actual == expected
 
+    def test_when_arbitrary_batch_is_called_then_draws_each_char_from_both_ranges_of_the_basic_plane(self):
+        from papylon.arbitrary import ArbChar
+
+        sut = ArbChar(rng=2)
+        actual = [ord(c) for c in sut.arbitrary_batch(2000) + [sut.arbitrary() for _ in range(2000)]]
+        assert all(0 <= c < 0xD800 or 0xDFFF < c <= 0xFFFF for c in actual)
+        assert any(c < 0xD800 for c in actual)
+        assert any(c > 0xDFFF for c in actual)
+
+    def test_given_categories_when_arbitrary_is_called_then_returns_chars_of_the_categories(self):
+        from papylon.arbitrary import ArbChar
+        import unicodedata
+
+        sut = ArbChar(categories=['Nd', 'Lu'])
+        actual = sut.arbitrary_batch(200) + [sut.arbitrary() for _ in range(200)]
+        assert all(unicodedata.category(c) in ('Nd', 'Lu') for c in actual)
+
+    def test_given_astral_when_arbitrary_batch_is_called_then_returns_chars_out_of_the_basic_plane(self):
+        from papylon.arbitrary import ArbChar
+
+        sut = ArbChar(rng=3, astral=True)
+        actual = [ord(c) for c in sut.arbitrary_batch(1000)]
+        assert any(c > 0xFFFF for c in actual)
+        assert not any(0xD800 <= c <= 0xDFFF for c in actual)
+
+    def test_given_categories_when_shrink_takes_a_char_then_returns_chars_only_of_the_categories(self):
+        from papylon.arbitrary import ArbChar
+
+        sut = ArbChar(categories=['Ll'])
+        assert list(sut.shrink('p')) == ['a', 'b', 'c']
+        assert list(ArbChar(categories=['Nd']).shrink('7')) == []
+
 
 class TestArbDate:
     def test_arbitrary_should_return_datetime_instance(self):
@@ -96,7 +128,8 @@ class TestArbList:
         arb_type = ArbFloat()
         sut = ArbList(arb_type, max_length=100)
         actual = list(sut.shrink([3, 3.1, 3.14, 3.141]))
-        expected = [[3.1, 3.14, 3.141], [3, 3.14, 3.141], [3, 3.1, 3.141], [3, 3.1, 3.14]]
+        expected = [[], [3.14, 3.141], [3, 3.1],
+                    [3.1, 3.14, 3.141], [3, 3.14, 3.141], [3, 3.1, 3.141], [3, 3.1, 3.14]]
         assert actual == expected
 
 
@@ -114,9 +147,55 @@ class TestArbStr:
 
         sut = ArbStr(max_length=20)
         actual = list(sut.shrink('Python'))
-        expected = ['ython', 'Pthon', 'Pyhon', 'Pyton', 'Pythn', 'Pytho']
+        expected = ['', 'hon', 'Pyt', 'thon', 'Pyon', 'Pyth',
+                    'ython', 'Pthon', 'Pyhon', 'Pyton', 'Pythn', 'Pytho']
         assert actual == expected
 
+    def test_given_an_alphabet_when_arbitrary_batch_is_called_then_returns_strings_of_its_characters(self):
+        from papylon.arbitrary import ArbStr
+
+        sut = ArbStr(max_length=30, rng=1, alphabet='ACGT')
+        actual = sut.arbitrary_batch(100)
+        assert len(actual) == 100
+        assert all(set(s) <= set('ACGT') and len(s) <= 30 for s in actual)
+        assert set(''.join(actual)) == set('ACGT')
+
+    def test_given_a_length_distribution_when_arbitrary_is_called_then_returns_strings_of_its_length(self):
+        from papylon.arbitrary import ArbStr
+
+        sut = ArbStr(max_length=20, length=lambda source: source.choice([3, 1000]))
+        assert all(len(s) in (3, 1000) for s in sut.arbitrary_batch(20))
+        assert len(sut.arbitrary()) in (3, 1000)
+
+    def test_given_the_same_seed_when_arbitrary_batch_is_called_then_returns_the_same_strings(self):
+        from papylon.arbitrary import ArbStr
+
+        expected = ArbStr(max_length=200, rng=7).arbitrary_batch(50)
+        actual = ArbStr(max_length=200, rng=7).arbitrary_batch(50)
+        assert actual == expected
+        assert not any(0xD800 <= ord(c) <= 0xDFFF for c in ''.join(actual))
+
+    def test_given_categories_when_arbitrary_batch_is_called_then_returns_strings_of_the_categories(self):
+        from papylon.arbitrary import ArbStr
+
+        sut = ArbStr(max_length=30, categories=['Nd'])
+        assert all(s.isdecimal() or s == '' for s in sut.arbitrary_batch(50))
+
+    def test_given_a_size_when_arbitrary_batch_is_called_then_returns_strings_no_longer_than_the_size(self):
+        from papylon.arbitrary import ArbStr
+
+        sut = ArbStr(max_length=100, rng=4)
+        assert all(len(s) <= 3 for s in sut.arbitrary_batch(100, 3))
+        assert len(sut.arbitrary(0)) == 0
+        assert max(len(s) for s in sut.arbitrary_batch(100)) > 3
+
+    def test_given_an_empty_alphabet_when_arb_str_is_instantiated_then_occurs_value_error(self):
+        from papylon.arbitrary import ArbStr
+        import pytest
+
+        with pytest.raises(ValueError):
+            ArbStr(max_length=20, alphabet='')
+
 
 def test_arb_int_returns_arb_integer_instance():
     from papylon.arbitrary import arb_int, ArbInteger
@@ -195,3 +274,116 @@ def test_from_gen_shrink_returns_abstract_arbitrary_instance_with_given_gen_inst
     assert 0 <= generated <= 9
     shrunk = list(sut.shrink(5))
     assert shrunk == [0, 1, -1]
+
+
+def test_given_the_same_random_source_when_arbitraries_are_generated_then_they_are_the_same():
+    from papylon.arbitrary import arb_int, arb_float, arb_date, arb_list, arb_str
+    import random
+
+    def make():
+        return [arb_int(), arb_float(), arb_date(), arb_list(arb_int(), max_length=10), arb_str()]
+
+    arbs1, arbs2 = make(), make()
+    for arb1, arb2 in zip(arbs1, arbs2):
+        arb1.set_random(random.Random(99))
+        arb2.set_random(random.Random(99))
+        assert repr(arb1.arbitrary()) == repr(arb2.arbitrary())
+
+
+def test_when_arbitrary_batch_is_called_then_returns_a_list_of_n_arbitraries():
+    from papylon.arbitrary import arb_int, arb_float, arb_date, arb_list, arb_str
+    import datetime
+    import math
+    import sys
+
+    ints = arb_int().arbitrary_batch(100)
+    assert len(ints) == 100
+    assert all((-1 - sys.maxsize) <= v <= sys.maxsize for v in ints)
+    floats = arb_float().arbitrary_batch(100)
+    assert all(type(v) == float for v in floats)
+    assert any(not math.isnan(v) for v in floats)
+    dates = arb_date().arbitrary_batch(100)
+    assert all(type(v) == datetime.datetime for v in dates)
+    lists = arb_list(arb_int(), max_length=5).arbitrary_batch(10)
+    assert all(type(v) == list and len(v) <= 5 for v in lists)
+    strs = arb_str(max_length=5).arbitrary_batch(10)
+    assert all(type(v) == str and len(v) <= 5 for v in strs)
+
+
+def test_given_a_size_when_arb_list_of_strings_is_generated_then_both_the_list_and_its_strings_are_sized():
+    from papylon.arbitrary import arb_list, arb_str
+
+    sut = arb_list(arb_str(max_length=100), max_length=100, rng=5)
+    actual = sut.arbitrary_batch(50, 4) + [sut.arbitrary(4)]
+    assert all(len(xs) <= 4 and all(len(s) <= 4 for s in xs) for xs in actual)
+    assert any(len(xs) == 4 for xs in actual)
+
+
+def test_from_gen_integrated_shrinks_mapped_values_to_values_the_gen_could_generate():
+    from papylon.gen import choose
+    from papylon.arbitrary import from_gen_integrated, AbstractArbitrary
+
+    sut = from_gen_integrated(choose(0, 1000, rng=3).map(lambda x: x * 2 + 1))
+    assert isinstance(sut, AbstractArbitrary)
+    value = sut.arbitrary()
+    shrunk = list(sut.shrink(value))
+    assert shrunk[0] == 1
+    assert all(x % 2 == 1 and x < value for x in shrunk)
+    assert all(x % 2 == 1 for x in sut.shrink(shrunk[-1]))
+
+
+def test_given_a_value_not_generated_when_from_gen_integrated_shrinks_it_then_unfolds_it_with_the_gen():
+    from papylon.gen import choose
+    from papylon.arbitrary import from_gen_integrated
+
+    sut = from_gen_integrated(choose(0, 100))
+    assert list(sut.shrink(8)) == [0, 4, 6, 7]
+    assert list(from_gen_integrated(choose(0, 100).map(str)).shrink('8')) == []
+
+
+def test_arb_array_returns_arrays_of_the_type_up_to_max_length():
+    from papylon.arbitrary import arb_array, ArbArray
+    import array
+
+    sut = arb_array('q', max_length=1000, rng=3, min_value=-5, max_value=5)
+    assert isinstance(sut, ArbArray)
+    values = [sut.arbitrary()] + sut.arbitrary_batch(20)
+    for value in values:
+        assert isinstance(value, array.array) and value.typecode == 'q'
+        assert len(value) <= 1000
+        assert all(-5 <= v <= 5 for v in value)
+    assert all(len(value) <= 10 for value in sut.arbitrary_batch(20, size=10))
+
+
+def test_given_the_same_seed_when_arb_array_generates_arrays_then_they_are_the_same():
+    from papylon.arbitrary import arb_array
+
+    assert [a.tobytes() for a in arb_array('d', rng=7).arbitrary_batch(5)] == \
+        [a.tobytes() for a in arb_array('d', rng=7).arbitrary_batch(5)]
+
+
+def test_given_an_unknown_typecode_when_arb_array_is_called_then_raises_value_error():
+    from papylon.arbitrary import arb_array
+    import pytest
+
+    with pytest.raises(ValueError):
+        arb_array('u')
+
+
+def test_given_a_custom_arbitrary_without_gen_when_set_random_is_called_then_it_is_still_usable():
+    from papylon.arbitrary import AbstractArbitrary, arb_list
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+
+    class ArbOne(AbstractArbitrary):
+        def arbitrary(self):
+            return 1
+
+        def shrink(self, value):
+            return iter([])
+
+    arb = ArbOne()
+    arb.set_random(3)
+    result = PropChecker(20, seed=1).check(for_all([arb, arb_list(ArbOne(), max_length=5, rng=2)],
+                                                   lambda x, xs: x == 1 and all(v == 1 for v in xs)))
+    assert result.has_passed()
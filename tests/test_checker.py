@@ -143,3 +143,625 @@ def test_when_check_all_properties_then_checks_it_not_in_lexical_order_but_of_re
     assert len(out_lines) == 2
     assert out_lines[0] == "List propositions.reverse cyclic proposition -> OK, passed 100 tests."
     assert out_lines[1] == "List propositions.length proposition -> OK, passed 100 tests."
+
+
+def test_given_workers_as_4_when_prop_checker_check_a_property_then_the_property_runs_100_times_in_total():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    sut = PropChecker(100, workers=4)
+    result = sut.check(for_all([arb_int()], lambda x: x + x == x * 2))
+    assert result.has_passed()
+    (count,) = result.get()
+    assert count == 100
+
+
+def test_given_workers_as_2_when_prop_checker_check_a_falsifiable_property_then_returns_shrunk_falsified_report():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    sut = PropChecker(1000, workers=2)
+    result = sut.check(for_all([arb_int()], lambda x: x < 100))
+    assert result.has_falsified()
+    run_count, inputs, shrunk_number = result.get()
+    assert 1 <= run_count <= 1000
+    assert inputs == [100]
+    assert shrunk_number >= 1
+
+
+def test_given_workers_as_0_when_prop_checker_is_instantiated_then_occurs_value_error():
+    from papylon.checker import PropChecker
+
+    try:
+        PropChecker(100, workers=0)
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_given_the_same_seed_when_prop_checker_check_a_falsifiable_property_then_the_results_are_the_same():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all_no_shrink
+    from papylon.arbitrary import arb_int
+
+    prop = for_all_no_shrink([arb_int()], lambda x: x % 7 != 0)
+    result1 = PropChecker(1000, seed=42).check(prop)
+    result2 = PropChecker(1000, seed=42).check(prop)
+    assert result1.has_falsified()
+    assert result1.get() == result2.get()
+    assert result1.seed == result2.seed == 42
+    assert result1.run_seed == result2.run_seed
+
+
+def test_given_run_seed_of_falsified_result_when_prop_checker_replay_the_property_then_falsifies_it_at_once():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all_no_shrink
+    from papylon.arbitrary import arb_int, arb_list
+
+    prop = for_all_no_shrink([arb_list(arb_int(), max_length=20)], lambda xs: len(xs) < 15)
+    sut = PropChecker(1000)
+    result = sut.check(prop)
+    assert result.has_falsified()
+    _, inputs, _ = result.get()
+    replayed = sut.replay(prop, result.run_seed, result.run_offset, result.run_size)
+    assert replayed.has_falsified()
+    assert replayed.get() == (1, inputs, 0)
+
+
+def test_when_prop_checker_check_a_falsifiable_vectorized_property_then_returns_first_failing_run_count():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all_vectorized
+    from papylon.arbitrary import from_gen
+    from papylon.gen import choose
+
+    arb = from_gen(choose(0, 999))
+    sut = PropChecker(10000, seed=0, batch_size=1000)
+    result = sut.check(for_all_vectorized([arb], lambda xs: [x != 500 for x in xs]))
+    assert result.has_falsified()
+    run_count, inputs, _ = result.get()
+    assert inputs == [500]
+    replayed = sut.replay(for_all_vectorized([arb], lambda xs: [x != 500 for x in xs]),
+                          result.run_seed, result.run_offset)
+    assert replayed.has_falsified()
+    assert (run_count - 1) % 1000 == result.run_offset
+
+
+def test_given_a_vectorized_property_when_prop_checker_check_it_then_calls_it_once_per_block_of_default_size():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all_vectorized
+    from papylon.arbitrary import arb_int
+
+    sizes = []
+
+    def prop(xs):
+        sizes.append(len(xs))
+        return [True] * len(xs)
+
+    result = PropChecker(25000, seed=0).check(for_all_vectorized([arb_int()], prop))
+    assert result.get() == (25000,)
+    assert sizes == [10000, 10000, 10000]
+
+
+def test_given_a_vectorized_property_failing_at_a_row_when_prop_checker_check_it_then_counts_the_rows_before_it():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all_vectorized
+    from papylon.arbitrary import from_gen
+    from papylon.gen import choose
+
+    prop = for_all_vectorized([from_gen(choose(0, 999))], lambda xs: [x != 500 for x in xs])
+    sut = PropChecker(10000, seed=0)
+    result = sut.check(prop)
+    run_count, inputs, _ = result.get()
+    assert inputs == [500]
+    assert run_count == result.run_offset + 1
+    assert sut.replay(prop, result.run_seed, result.run_offset).get() == (1, [500], 0)
+
+
+def test_given_a_database_when_prop_checker_falsifies_a_property_then_it_replays_the_counter_example_first(tmp_path):
+    from papylon.checker import PropChecker
+    from papylon.database import ExampleDatabase, prop_key
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    database = ExampleDatabase(str(tmp_path / 'examples.db'))
+    prop = for_all([arb_int()], lambda x: x < 100)
+    sut = PropChecker(1000, database=database)
+    first = sut.check(prop)
+    assert first.has_falsified()
+    _, inputs, _ = first.get()
+    assert database.fetch(prop_key(prop)) == [inputs]
+
+    second = sut.check(prop)
+    assert second.has_falsified()
+    run_count, replayed, _ = second.get()
+    assert run_count == 1
+    assert replayed == inputs
+
+
+def test_given_a_database_when_its_counter_example_passes_now_then_prop_checker_deletes_it(tmp_path):
+    from papylon.checker import PropChecker
+    from papylon.database import ExampleDatabase
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    database = ExampleDatabase(str(tmp_path / 'examples.db'))
+    database.save('fixed', [100])
+    sut = PropChecker(10, database=database)
+    result = sut.check(for_all([arb_int()], lambda x: True), 'fixed')
+    assert result.has_passed()
+    assert database.fetch('fixed') == []
+
+
+def test_given_duration_when_prop_checker_check_a_property_then_runs_until_it_passes_and_reports_the_run_count(
+        monkeypatch):
+    from papylon import checker
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+    import time
+
+    class Clock:
+        now = 0.0
+        perf_counter_ns = staticmethod(time.perf_counter_ns)
+
+        @classmethod
+        def monotonic(cls):
+            return cls.now
+
+    def prop(x):
+        Clock.now += 1 / 128
+        return True
+
+    monkeypatch.setattr(checker, 'time', Clock)
+    sut = PropChecker(None, duration=0.25)
+    result = sut.check(for_all([arb_int()], prop))
+    assert result.has_passed()
+    # each run costs 1/128 seconds, so the 33rd would end after 0.25 seconds
+    assert result.get() == (32,)
+    assert Clock.now == 0.25
+
+
+def test_given_duration_and_count_when_prop_checker_check_a_fast_property_then_stops_at_the_count():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    sut = PropChecker(50, duration=10)
+    result = sut.check(for_all([arb_int()], lambda x: True))
+    assert result.get() == (50,)
+
+
+def test_given_min_count_when_prop_checker_check_a_slow_property_then_runs_it_at_least_min_count_times():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+    import time
+
+    def prop(x):
+        time.sleep(0.01)
+        return True
+
+    sut = PropChecker(None, duration=0.001, min_count=5)
+    result = sut.check(for_all([arb_int()], prop))
+    assert result.get() == (5,)
+
+
+def test_given_duration_and_workers_as_2_when_prop_checker_check_a_property_then_both_workers_run_it():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    sut = PropChecker(None, workers=2, duration=0.2, min_count=30)
+    result = sut.check(for_all([arb_int()], lambda x: True))
+    assert result.has_passed()
+    (count,) = result.get()
+    assert count >= 30
+
+
+def test_given_neither_count_nor_duration_when_prop_checker_is_instantiated_then_occurs_value_error():
+    from papylon.checker import PropChecker
+    import pytest
+
+    with pytest.raises(ValueError):
+        PropChecker(None)
+
+
+def test_given_timing_when_prop_checker_check_a_falsifiable_property_then_the_result_has_time_of_phases():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+    import time
+
+    def prop(x):
+        time.sleep(0.001)
+        return x < 100
+
+    sut = PropChecker(1000, seed=1, timing=True)
+    result = sut.check(for_all([arb_int()], prop))
+    assert result.has_falsified()
+    run_count, _, _ = result.get()
+    timing = result.timing
+    assert timing.run_count == run_count
+    assert 10 ** 6 <= timing.p50_ns <= timing.p99_ns
+    assert 0 < timing.generation_ns < timing.total_ns
+    assert 0 < timing.shrink_ns < timing.total_ns
+    assert timing.tests_per_second > 0
+
+
+def test_given_timing_and_workers_as_2_when_prop_checker_check_a_property_then_the_result_has_time_of_all_runs():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    sut = PropChecker(100, workers=2, timing=True)
+    result = sut.check(for_all([arb_int()], lambda x: True))
+    assert result.get() == (100,)
+    assert result.timing.run_count == 100
+    assert result.timing.generation_ns > 0
+
+
+def test_given_no_timing_when_prop_checker_check_a_property_then_the_result_has_no_time_of_phases():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    result = PropChecker(10).check(for_all([arb_int()], lambda x: True))
+    assert result.timing is None
+
+
+def test_given_profile_when_check_a_property_then_dumps_its_profile_and_prints_the_time_of_phases(tmp_path, capsys):
+    from papylon.checker import check
+    from papylon.profiler import CProfiler
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    def prop(x):
+        return x < 100
+
+    check(for_all([arb_int()], prop), profiler=CProfiler(str(tmp_path), top=3))
+    assert len(list(tmp_path.glob('*prop*.prof'))) == 1
+    output = capsys.readouterr().out
+    assert 'Falsified' in output
+    assert 'property' in output and 'shrinking' in output
+
+
+def test_given_prop_workers_when_check_all_properties_then_prints_results_in_completion_order(capsys):
+    from papylon.checker import check_all
+    from papylon.prop import for_all, Properties
+    from papylon.arbitrary import arb_int
+    import time
+
+    def slow(x):
+        time.sleep(0.002)
+        return True
+
+    props = Properties("Group")
+    props.add("slow", for_all([arb_int()], slow))
+    props.add("fast", for_all([arb_int()], lambda x: True))
+    check_all(props, prop_workers=2)
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == ["Group.fast -> OK, passed 100 tests.", "Group.slow -> OK, passed 100 tests."]
+
+
+def test_given_prop_workers_and_ordered_when_check_all_properties_then_prints_results_in_registration_order(capsys):
+    from papylon.checker import check_all
+    from papylon.prop import for_all, Properties
+    from papylon.arbitrary import arb_int
+    import time
+
+    def slow(x):
+        time.sleep(0.002)
+        return True
+
+    props = Properties("Group")
+    props.add("slow", for_all([arb_int()], slow))
+    props.add("fast", for_all([arb_int()], lambda x: True))
+    check_all(props, prop_workers=2, ordered=True)
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == ["Group.slow -> OK, passed 100 tests.", "Group.fast -> OK, passed 100 tests."]
+
+
+def test_given_durations_when_check_all_properties_then_starts_the_longest_first_and_saves_their_durations(tmp_path):
+    from papylon.checker import check_all
+    from papylon.prop import for_all, Properties
+    from papylon.arbitrary import arb_int
+    import json
+
+    path = tmp_path / 'durations.json'
+    path.write_text(json.dumps({"Group.short": 0.1, "Group.long": 5.0, "Other.prop": 1.0}))
+
+    props = Properties("Group")
+    props.add("short", for_all([arb_int()], lambda x: True))
+    props.add("long", for_all([arb_int()], lambda x: True))
+    printed = []
+    check_all(props, count=5, printer=lambda result, group, name: printed.append(name), prop_workers=2,
+              durations=str(path))
+    assert sorted(printed) == ["long", "short"]
+    saved = json.loads(path.read_text())
+    assert set(saved) == {"Group.short", "Group.long", "Other.prop"}
+    assert saved["Other.prop"] == 1.0
+    assert saved["Group.long"] < 5.0
+
+
+def test_given_durations_when_properties_are_scheduled_then_the_unknown_and_longest_ones_come_first():
+    from papylon.checker import _schedule
+
+    actual = _schedule(["short", "unknown", "long", "middle"], {"short": 0.1, "long": 5.0, "middle": 1.0})
+    assert actual == [1, 2, 3, 0]
+
+
+def test_given_a_troubled_property_when_check_all_on_prop_workers_then_prints_its_formatted_traceback(capsys):
+    from papylon.checker import check_all
+    from papylon.prop import Properties
+
+    class DummyProp:
+        def execute(self, shrink=True):
+            raise Exception("broken")
+
+    props = Properties("Group")
+    props.add("broken", DummyProp())
+    props.add("another", DummyProp())
+    check_all(props, prop_workers=2, ordered=True)
+    _, err = capsys.readouterr()
+    assert "Group.broken -> [Papylon] Some exception is raised:\nbroken" in err
+    assert "in execute" in err
+
+
+def test_given_workers_and_prop_workers_when_check_all_then_occurs_value_error():
+    from papylon.checker import check_all
+    from papylon.prop import Properties
+    import pytest
+
+    with pytest.raises(ValueError):
+        check_all(Properties("Group"), workers=2, prop_workers=2)
+
+
+def test_given_max_size_when_prop_checker_check_a_property_then_list_lengths_grow_over_runs():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int, arb_list
+
+    lengths = []
+
+    def prop(xs):
+        lengths.append(len(xs))
+        return True
+
+    PropChecker(100, seed=3, batch_size=10, max_size=50).check(for_all([arb_list(arb_int(), max_length=1000)], prop))
+    assert len(lengths) == 100
+    assert max(lengths[:10]) <= 5
+    assert all(length <= 5 * (i // 10 + 1) for i, length in enumerate(lengths))
+    assert max(lengths[50:]) > max(lengths[:50])
+    assert max(lengths[90:]) > 40
+
+
+def test_given_a_few_runs_and_max_size_when_prop_checker_check_a_property_then_the_last_block_reaches_max_size():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int, arb_list
+
+    lengths = []
+
+    def prop(xs):
+        lengths.append(len(xs))
+        return True
+
+    PropChecker(5, seed=3, max_size=50).check(for_all([arb_list(arb_int(), max_length=1000)], prop))
+    assert max(lengths) > 0
+
+
+def test_given_no_max_size_when_prop_checker_check_a_property_then_lists_have_their_own_max_length():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int, arb_list
+
+    lengths = []
+
+    def prop(xs):
+        lengths.append(len(xs))
+        return True
+
+    PropChecker(100, seed=3).check(for_all([arb_list(arb_int(), max_length=1000)], prop))
+    assert max(lengths[:10]) > 100
+
+
+def test_given_max_size_as_none_when_prop_checker_check_a_property_then_lists_have_their_own_max_length():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int, arb_list
+
+    lengths = []
+
+    def prop(xs):
+        lengths.append(len(xs))
+        return True
+
+    PropChecker(100, seed=3, max_size=None).check(for_all([arb_list(arb_int(), max_length=1000)], prop))
+    assert max(lengths[:10]) > 100
+
+
+def test_given_a_falsified_result_of_a_sized_run_when_prop_checker_replay_it_then_uses_its_size():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all_no_shrink
+    from papylon.arbitrary import arb_str
+
+    prop = for_all_no_shrink([arb_str(max_length=100)], lambda s: len(s) < 40)
+    sut = PropChecker(1000, max_size=60)
+    result = sut.check(prop)
+    assert result.has_falsified()
+    assert 40 <= result.run_size <= 60
+    _, inputs, _ = result.get()
+    assert sut.replay(prop, result.run_seed, result.run_offset, result.run_size).get() == (1, inputs, 0)
+
+
+def test_given_a_database_when_a_property_records_choices_then_its_counter_example_is_saved_as_bytes(tmp_path):
+    from papylon.checker import PropChecker
+    from papylon.database import ExampleDatabase, prop_key
+    from papylon.prop import for_all_choices
+    from papylon.gen import choose
+    from papylon.arbitrary import from_gen
+
+    database = ExampleDatabase(str(tmp_path / 'examples.db'))
+    prop = for_all_choices([from_gen(choose(0, 10000))], lambda x: x < 100)
+    sut = PropChecker(1000, seed=5, database=database)
+    first = sut.check(prop)
+    assert first.has_falsified()
+    assert first.get()[1] == [100]
+    assert database.fetch(prop_key(prop)) == [first.choices]
+
+    second = sut.check(prop)
+    run_count, replayed, _ = second.get()
+    assert run_count == 1
+    assert replayed == [100]
+
+
+def test_given_workers_when_a_property_records_choices_then_the_counter_example_is_shrunk_with_them():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all_choices
+    from papylon.gen import choose
+    from papylon.arbitrary import from_gen
+
+    prop = for_all_choices([from_gen(choose(0, 10000))], lambda x: x < 100)
+    result = PropChecker(1000, workers=2, seed=5).check(prop)
+    assert result.has_falsified()
+    assert result.get()[1] == [100]
+    assert result.choices == b'\x00d'
+
+
+def test_given_such_that_rejecting_most_values_when_prop_checker_checks_it_then_warns_with_the_acceptance_rates():
+    from papylon.checker import PropChecker, LowAcceptanceWarning
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int, from_gen
+    from papylon.gen import choose
+    import pytest
+
+    prop = for_all([arb_int(), from_gen(choose(0, 1000).such_that(lambda x: x < 20, trial=1000))],
+                   lambda x, y: True)
+    with pytest.warns(LowAcceptanceWarning):
+        result = PropChecker(100, seed=3).check(prop)
+    assert result.has_passed()
+    none_rate, rate = result.acceptance_rates
+    assert none_rate is None
+    assert 0.0 < rate < 0.05
+
+
+def test_given_workers_when_prop_checker_checks_such_that_then_counts_the_acceptance_of_all_of_them():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import from_gen
+    from papylon.gen import choose
+    import warnings
+
+    prop = for_all([from_gen(choose(0, 1000).such_that(lambda x: x < 500))], lambda x: True)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = PropChecker(200, workers=2, seed=3, min_acceptance=None).check(prop)
+    assert result.has_passed()
+    assert 0.4 < result.acceptance_rates[0] < 0.6
+
+
+def test_given_a_saved_example_of_another_arity_when_prop_checker_checks_a_property_then_it_skips_the_example(tmp_path):
+    from papylon.checker import PropChecker
+    from papylon.database import ExampleDatabase
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    database = ExampleDatabase(str(tmp_path / 'examples.db'))
+    database.save('prop', [1, 2])
+    prop = for_all([arb_int()], lambda x: x == x)
+    result = PropChecker(10, database=database).check(prop, 'prop')
+    assert result.has_passed()
+    assert database.fetch('prop') == []
+
+
+def test_given_an_integrated_arbitrary_and_workers_as_2_when_prop_checker_falsifies_a_property_then_shrinks_it():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.gen import choose
+    from papylon.arbitrary import from_gen_integrated
+
+    prop = for_all([from_gen_integrated(choose(0, 1000).map(lambda x: x * 2))], lambda x: x < 100)
+    result = PropChecker(1000, workers=2, seed=5).check(prop)
+    assert result.has_falsified()
+    _, inputs, _ = result.get()
+    assert inputs == [100]
+
+
+def test_given_property_which_fails_to_generate_when_prop_checker_check_it_then_does_not_warn_low_acceptance():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import from_gen
+    from papylon.gen import choose
+    import warnings
+
+    prop = for_all([from_gen(choose(-10, 20).such_that(lambda x: x < -10))], lambda x: True)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = PropChecker(100).check(prop)
+    assert result.has_failed_to_generate()
+
+
+def test_given_an_adaptive_gen_when_prop_checker_checks_a_property_then_the_result_is_not_replayable():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int, from_gen
+    from papylon.gen import choose
+
+    adaptive = from_gen(choose(0, 1000).such_that(lambda x: x < 100, adaptive=True).map(str))
+    sut = PropChecker(100, seed=3, min_acceptance=None)
+    assert not sut.check(for_all([arb_int(), adaptive], lambda x, y: True)).replayable
+    assert sut.check(for_all([arb_int()], lambda x: True)).replayable
+
+
+def test_given_a_bounded_arb_array_when_prop_checker_falsifies_a_property_then_shrinks_it_within_the_bounds():
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_array
+    import array
+
+    prop = for_all([arb_array('q', 10, min_value=1, max_value=10)], lambda a: len(a) < 5)
+    result = PropChecker(1000, seed=3).check(prop)
+    assert result.has_falsified()
+    _, inputs, _ = result.get()
+    assert inputs == [array.array('q', [1, 1, 1, 1, 1])]
+
+
+def test_given_a_database_and_a_property_without_a_key_when_check_it_then_warns_and_saves_with_the_given_key(tmp_path):
+    from papylon.checker import check, PropChecker, DatabaseKeyWarning
+    from papylon.database import ExampleDatabase
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+    import pytest
+
+    database = ExampleDatabase(str(tmp_path / 'examples.db'))
+    helper = object()
+    prop = for_all([arb_int()], lambda x: helper is None)
+    with pytest.warns(DatabaseKeyWarning):
+        PropChecker(10, database=database).check(prop)
+    check(prop, database=database, key='prop', printer=lambda result: None)
+    assert len(database.fetch('prop')) == 1
+
+
+def test_given_numpy_when_prop_checker_check_a_property_by_default_then_draws_its_columns_with_numpy(monkeypatch):
+    from papylon import engine
+    from papylon.checker import PropChecker
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+    import pytest
+
+    if engine.numpy is None:
+        pytest.skip("NumPy isn't installed.")
+    sizes = []
+    numpy_generator = engine._numpy_generator
+
+    def spy(source, n):
+        generator = numpy_generator(source, n)
+        if generator is not None:
+            sizes.append(n)
+        return generator
+
+    monkeypatch.setattr(engine, '_numpy_generator', spy)
+    assert PropChecker(100).check(for_all([arb_int()], lambda x: True)).has_passed()
+    assert sizes == [100]
@@ -0,0 +1,40 @@
+def test_when_choice_sequence_records_arguments_then_replaying_the_record_makes_the_same_arguments():
+    from papylon.choice import ChoiceSequence
+    from papylon.arbitrary import arb_int, arb_float, arb_date, arb_list, arb_str
+    import random
+
+    arbs = [arb_int(), arb_float(), arb_date(), arb_list(arb_int(), max_length=10), arb_str()]
+    recorder = ChoiceSequence(7)
+    for arb in arbs:
+        arb.set_random(recorder)
+    expected = [arb.arbitrary() for arb in arbs]
+
+    random.seed(1)
+    replayer = ChoiceSequence(buffer=recorder.choices_made())
+    for arb in arbs:
+        arb.set_random(replayer)
+    actual = [arb.arbitrary() for arb in arbs]
+    assert repr(actual) == repr(expected)
+    assert replayer.choices_made() == recorder.choices_made()
+
+
+def test_given_a_short_buffer_when_choice_sequence_replays_it_then_reads_zeros_after_its_end():
+    from papylon.choice import ChoiceSequence
+
+    sut = ChoiceSequence(buffer=b'\x01')
+    assert sut.getrandbits(16) == 256
+    assert sut.getrandbits(8) == 0
+    assert sut.randint(10, 20) == 10
+    assert sut.choices_made() == b'\x01\x00\x00\x00'
+
+
+def test_when_engine_draws_in_bulk_from_choice_sequence_then_each_number_is_recorded():
+    from papylon import engine
+    from papylon.choice import ChoiceSequence
+
+    recorder = ChoiceSequence(3)
+    expected = engine.integers(recorder, 0, 1000, 200)
+    # 2 bytes per number, and more for rejected ones, rather than a seed of NumPy
+    assert len(recorder.choices_made()) >= 2 * 200
+    replayer = ChoiceSequence(buffer=recorder.choices_made())
+    assert engine.integers(replayer, 0, 1000, 200) == expected
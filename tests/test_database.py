@@ -0,0 +1,91 @@
+def test_given_saved_inputs_when_example_database_fetches_them_then_returns_the_newest_first(tmp_path):
+    from papylon.database import ExampleDatabase
+
+    sut = ExampleDatabase(str(tmp_path / 'examples.db'))
+    sut.save('prop', [1, 'a'])
+    sut.save('prop', [2, 'b'])
+    sut.save('other', [3, 'c'])
+    assert sut.fetch('prop') == [[2, 'b'], [1, 'a']]
+    assert sut.fetch('unknown') == []
+
+
+def test_given_max_examples_when_example_database_saves_more_then_evicts_the_oldest(tmp_path):
+    from papylon.database import ExampleDatabase
+
+    sut = ExampleDatabase(str(tmp_path / 'examples.db'), max_examples=2)
+    for i in range(5):
+        sut.save('prop', [i])
+    assert sut.fetch('prop') == [[4], [3]]
+
+
+def test_given_max_age_when_example_database_fetches_stale_inputs_then_they_are_evicted(tmp_path):
+    from papylon.database import ExampleDatabase
+    import time
+
+    sut = ExampleDatabase(str(tmp_path / 'examples.db'), max_age=0.05)
+    sut.save('prop', [1])
+    time.sleep(0.1)
+    assert sut.fetch('prop') == []
+    sut.save('prop', [2])
+    assert sut.fetch('prop') == [[2]]
+
+
+def test_given_saved_inputs_when_example_database_deletes_them_then_they_are_not_fetched(tmp_path):
+    from papylon.database import ExampleDatabase
+
+    sut = ExampleDatabase(str(tmp_path / 'examples.db'))
+    sut.save('prop', [1])
+    sut.save('prop', [2])
+    sut.delete('prop', [1])
+    assert sut.fetch('prop') == [[2]]
+
+
+def test_given_unpicklable_inputs_when_example_database_saves_them_then_ignores_them(tmp_path):
+    from papylon.database import ExampleDatabase
+
+    sut = ExampleDatabase(str(tmp_path / 'examples.db'))
+    sut.save('prop', [lambda x: x])
+    assert sut.fetch('prop') == []
+
+
+def test_given_two_lambdas_when_prop_key_is_made_then_they_have_different_keys():
+    from papylon.database import prop_key
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    p1 = for_all([arb_int()], lambda x: x == x)
+    p2 = for_all([arb_int()], lambda x: x != x)
+    assert prop_key(p1) != prop_key(p2)
+    assert prop_key(p1) == prop_key(p1)
+
+
+def test_given_properties_made_by_a_factory_when_prop_key_is_made_then_they_have_different_keys():
+    from papylon.database import prop_key
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    def less_than(n):
+        return for_all([arb_int()], lambda x: x < n)
+
+    assert prop_key(less_than(1)) != prop_key(less_than(2))
+    assert prop_key(less_than(1)) == prop_key(less_than(1))
+
+
+def test_given_a_property_closing_over_an_object_when_prop_key_is_made_then_it_is_none():
+    from papylon.database import prop_key
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    box = object()
+    assert prop_key(for_all([arb_int()], lambda x: box is not None)) is None
+
+
+def test_given_an_example_fetched_with_its_blob_when_delete_blob_is_called_then_deletes_it(tmp_path):
+    from papylon.database import ExampleDatabase
+
+    sut = ExampleDatabase(str(tmp_path / 'examples.db'))
+    sut.save('prop', [{'a', 'b', 'c'}])
+    [(blob, inputs)] = sut.fetch_blobs('prop')
+    assert inputs == [{'a', 'b', 'c'}]
+    sut.delete_blob('prop', blob)
+    assert sut.fetch('prop') == []
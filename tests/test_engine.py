@@ -0,0 +1,97 @@
+import pytest
+
+
+@pytest.fixture(params=[False, True], ids=["pure", "numpy"])
+def use_numpy(request):
+    from papylon import engine
+
+    if request.param and engine.numpy is None:
+        pytest.skip("NumPy is not installed.")
+    original = engine.USE_NUMPY
+    engine.USE_NUMPY = request.param
+    yield request.param
+    engine.USE_NUMPY = original
+
+
+def test_when_integers_draws_values_then_they_are_ints_in_range(use_numpy):
+    from papylon.engine import integers
+    import random
+
+    actual = integers(random.Random(1), -3, 3, 1000)
+    assert len(actual) == 1000
+    assert all(type(v) == int and -3 <= v <= 3 for v in actual)
+    assert set(actual) == set(range(-3, 4))
+
+
+def test_when_integers_draws_values_out_of_int64_then_they_are_drawn_in_pure_python(use_numpy):
+    from papylon.engine import integers
+    import random
+
+    actual = integers(random.Random(2), 0, 1 << 100, 100)
+    assert all(0 <= v <= 1 << 100 for v in actual)
+    assert max(actual) > 1 << 64
+
+
+def test_when_uniforms_draws_values_then_they_are_floats_in_range(use_numpy):
+    from papylon.engine import uniforms
+    import random
+
+    actual = uniforms(random.Random(3), -2, 5.0, 1000)
+    assert all(type(v) == float and -2.0 <= v <= 5.0 for v in actual)
+
+
+def test_when_float64s_draws_values_then_their_signs_are_balanced(use_numpy):
+    from papylon.engine import float64s
+    import math
+    import random
+
+    actual = float64s(random.Random(4), 1000)
+    assert all(type(v) == float for v in actual)
+    negatives = sum(1 for v in actual if math.copysign(1.0, v) < 0)
+    assert 400 <= negatives <= 600
+
+
+def test_given_the_same_seed_when_engine_draws_values_then_they_are_the_same(use_numpy):
+    from papylon.engine import integers, float64s
+    import random
+
+    assert integers(random.Random(5), 0, 100, 500) == integers(random.Random(5), 0, 100, 500)
+    assert repr(float64s(random.Random(6), 500)) == repr(float64s(random.Random(6), 500))
+
+
+def test_when_text_is_drawn_then_it_has_n_characters_of_code_points(use_numpy):
+    from papylon.engine import text, CODE_POINT_TYPE
+    import array
+    import random
+
+    code_points = array.array(CODE_POINT_TYPE, [ord('a'), 0x3042, 0x1F600])
+    actual = text(random.Random(3), code_points, 500)
+    assert len(actual) == 500
+    assert set(actual) == {'a', '\u3042', '\U0001F600'}
+    assert text(random.Random(3), code_points, 0) == ''
+
+
+def test_when_arrays_draws_numbers_then_returns_an_array_of_the_type_in_range(use_numpy):
+    from papylon.engine import arrays
+    import random
+    import array
+
+    rng = random.Random(5)
+    ints = arrays(rng, 'q', 1000)
+    assert isinstance(ints, array.array) and ints.typecode == 'q' and len(ints) == 1000
+    bytes_ = arrays(rng, 'B', 1000, 10, 12)
+    assert set(bytes_) == {10, 11, 12}
+    floats = arrays(rng, 'd', 1000, -1.0, 1.0)
+    assert all(-1.0 <= v <= 1.0 for v in floats)
+    assert len(arrays(rng, 'f', 0)) == 0
+
+
+def test_given_an_unknown_typecode_or_a_float_bound_alone_when_arrays_draws_numbers_then_raises_value_error():
+    from papylon.engine import arrays
+    import random
+    import pytest
+
+    with pytest.raises(ValueError):
+        arrays(random.Random(1), 'u', 10)
+    with pytest.raises(ValueError):
+        arrays(random.Random(1), 'd', 10, min_value=0.0)
@@ -163,3 +163,243 @@ def test_given_a_value_v_when_constant_v_then_returns_gen_instance_which_generat
             count += 1
 
     assert count == trial
+
+
+def test_given_the_same_seed_when_gens_generate_values_then_the_values_are_the_same():
+    from papylon.gen import choose
+
+    gen1 = choose(-1000, 1000, rng=123)
+    gen2 = choose(-1000, 1000, rng=123)
+    assert [gen1.generate() for _ in range(10)] == [gen2.generate() for _ in range(10)]
+
+
+def test_when_set_random_is_called_then_gen_draws_values_from_the_given_random_source():
+    from papylon.gen import choose
+    import random
+
+    sut = choose(0.0, 1.0).map(lambda x: x * 2)
+    sut.set_random(random.Random(7))
+    actual = [sut.generate() for _ in range(5)]
+    rng = random.Random(7)
+    expected = [rng.uniform(0.0, 1.0) * 2 for _ in range(5)]
+    assert actual == expected
+
+
+def test_when_generate_batch_is_called_then_returns_a_list_of_n_values_in_range():
+    from papylon.gen import choose
+
+    ints = choose(-50, 50).generate_batch(1000)
+    assert len(ints) == 1000
+    assert all(type(v) == int and -50 <= v <= 50 for v in ints)
+    floats = choose(-1.0, 1.0).generate_batch(1000)
+    assert len(floats) == 1000
+    assert all(type(v) == float and -1.0 <= v <= 1.0 for v in floats)
+    bytes_ = choose(0, 255).generate_batch(1000)
+    assert all(0 <= v <= 255 for v in bytes_)
+
+
+def test_when_generate_batch_is_called_on_mapped_and_filtered_gens_then_values_are_mapped_and_filtered():
+    from papylon.gen import choose, constant
+
+    assert constant(3).generate_batch(4) == [3, 3, 3, 3]
+    mapped = choose(1, 10).map(lambda x: x * 2).generate_batch(100)
+    assert all(v in range(2, 21, 2) for v in mapped)
+    filtered = choose(-20, 20).such_that(lambda x: x > 15).generate_batch(100)
+    assert len(filtered) == 100
+    assert all(15 < v <= 20 for v in filtered)
+
+
+def test_given_no_hit_gen_when_generate_batch_is_called_then_raise_stop_generation():
+    from papylon.gen import choose, StopGeneration
+
+    try:
+        choose(-30, 30).such_that(lambda x: 31 <= x).generate_batch(10)
+    except StopGeneration as e:
+        assert e.trial_to_generate == 100
+        return
+    assert False
+
+
+def test_when_gen_one_of_generates_values_then_chooses_a_gen_for_every_value():
+    from papylon.gen import Gen, constant
+
+    sut = Gen.one_of(list(map(constant, [1, 4, 9])), rng=1)
+    assert set(sut.generate() for _ in range(100)) == {1, 4, 9}
+    assert set(sut.generate_batch(100)) == {1, 4, 9}
+
+
+def test_when_gen_frequency_generates_a_batch_then_its_choices_follow_the_weights():
+    from papylon.gen import Gen, constant
+
+    weighted_gens = [(5, constant(1)), (3, constant(10)), (2, constant(100)), (0, constant(1000))]
+    actual = Gen.frequency(weighted_gens, rng=2).generate_batch(20000)
+    assert abs(actual.count(1) / 20000 - 0.5) < 0.02
+    assert abs(actual.count(10) / 20000 - 0.3) < 0.02
+    assert abs(actual.count(100) / 20000 - 0.2) < 0.02
+    assert actual.count(1000) == 0
+
+
+def test_when_alias_table_is_built_from_weights_then_its_probabilities_add_up_to_them():
+    from papylon.gen import _AliasTable
+    from fractions import Fraction
+
+    weights = [Fraction(1), Fraction(7), Fraction(2), Fraction(0), Fraction(6)]
+    sut = _AliasTable(weights)
+    n = len(weights)
+    for i, weight in enumerate(weights):
+        mass = sut.probabilities[i] + sum(1 - sut.probabilities[j] for j in range(n) if sut.aliases[j] == i and j != i)
+        assert mass / n == weight / sum(weights)
+
+
+def test_given_the_same_seed_when_gen_frequency_generates_values_then_they_are_the_same():
+    from papylon.gen import Gen, choose
+
+    def make():
+        return Gen.frequency([(1, choose(0, 10)), (2, choose(100, 200)), (3, choose(-1.0, 1.0))], rng=5)
+
+    assert make().generate_batch(50) == make().generate_batch(50)
+    expected, actual = make(), make()
+    assert [expected.generate() for _ in range(50)] == [actual.generate() for _ in range(50)]
+
+
+def test_given_negative_weights_when_gen_frequency_is_called_then_raises_value_error():
+    from papylon.gen import Gen, constant
+    import pytest
+
+    with pytest.raises(ValueError):
+        Gen.frequency([(-1, constant(1)), (2, constant(2))])
+    with pytest.raises(ValueError):
+        Gen.frequency([(0, constant(1))])
+
+
+def test_when_choose_generates_a_tree_then_its_children_shrink_towards_the_bound_closest_to_0():
+    from papylon.gen import choose
+
+    sut = choose(10, 1000, rng=5)
+    tree = sut.generate_tree()
+    assert 10 <= tree.value <= 1000
+    children = [child.value for child in tree.children()]
+    assert children[0] == 10
+    assert all(10 <= value < tree.value for value in children)
+
+    negative = choose(-1000, -10, rng=5).generate_tree()
+    assert all(negative.value < value <= -10 for value in (child.value for child in negative.children()))
+
+
+def test_when_mapped_and_filtered_gens_generate_trees_then_shrunk_values_are_mapped_and_filtered():
+    from papylon.gen import choose
+
+    mapped = choose(1, 1000, rng=7).map(lambda x: x * 2).generate_tree()
+    assert mapped.value % 2 == 0
+    assert all(child.value % 2 == 0 for child in mapped.children())
+
+    filtered = choose(1, 1000, rng=7).such_that(lambda x: x % 3 == 0).generate_tree()
+    assert filtered.value % 3 == 0
+    assert all(child.value % 3 == 0 for child in filtered.children())
+
+
+def test_when_gen_frequency_generates_a_tree_then_it_shrinks_within_the_chosen_gen():
+    from papylon.gen import Gen, choose
+
+    sut = Gen.frequency([(1, choose(-100, -10)), (1, choose(10, 100).map(str))], rng=11)
+    for _ in range(20):
+        tree = sut.generate_tree()
+        children = [child.value for child in tree.children()]
+        if isinstance(tree.value, str):
+            assert children[0] == '10'
+            assert all(isinstance(value, str) for value in children)
+        else:
+            assert children[0] == -10
+            assert all(isinstance(value, int) for value in children)
+
+
+def test_when_tree_of_takes_a_value_then_it_is_unfolded_only_if_the_gen_does_not_map_values():
+    from papylon.gen import choose
+
+    sut = choose(0, 100)
+    assert [child.value for child in sut.tree_of(4).children()] == [0, 2, 3]
+    assert list(sut.map(lambda x: x + 1).tree_of(4).children()) == []
+
+
+def test_when_maps_and_such_thats_are_chained_then_every_stage_is_applied_in_order():
+    from papylon.gen import choose
+
+    sut = choose(1, 100, rng=3).map(lambda x: x * 2).such_that(lambda x: x % 3 == 0).map(lambda x: x + 1)
+    assert len(sut.stages) == 3
+    for value in [sut.generate() for _ in range(100)] + sut.generate_batch(100):
+        assert value % 2 == 1
+        assert (value - 1) % 3 == 0
+        assert 3 <= value <= 201
+
+
+def test_given_the_same_seed_when_a_pipeline_generates_values_one_by_one_or_in_batch_then_they_are_the_same():
+    from papylon.gen import choose
+
+    def make():
+        return choose(0, 1000, rng=9).such_that(lambda x: x % 2 == 0).map(str).such_that(lambda s: '7' not in s)
+
+    sut1, sut2 = make(), make()
+    tree = make().generate_tree()
+    assert [sut1.generate() for _ in range(50)] == [sut2.generate() for _ in range(50)]
+    assert '7' not in tree.value
+    assert all('7' not in child.value and int(child.value) % 2 == 0 for child in tree.children())
+
+
+def test_when_a_chained_such_that_rejects_every_value_then_raise_stop_generation_with_its_trial():
+    from papylon.gen import choose, StopGeneration
+
+    sut = choose(1, 10).map(lambda x: x * 2).such_that(lambda x: x % 2 == 1, trial=5)
+    try:
+        sut.generate()
+        assert False
+    except StopGeneration as e:
+        assert e.trial_to_generate == 5
+
+
+def test_when_a_gen_with_such_that_generates_values_then_counts_its_draws_and_rejections():
+    from papylon.gen import choose
+
+    sut = choose(1, 100, rng=4).such_that(lambda x: x % 4 == 0)
+    assert sut.acceptance_rate is None
+    [sut.generate() for _ in range(200)]
+    sut.generate_batch(200)
+    assert sut.draws - sut.rejections == 400
+    assert 0.15 <= sut.acceptance_rate <= 0.35
+    assert choose(1, 100).map(str).draws == 0
+
+
+def test_given_adaptive_such_that_when_few_values_are_accepted_then_narrows_the_range_to_the_accepted_ones():
+    from papylon.gen import choose
+
+    plain = choose(0, 10 ** 6, rng=1).such_that(lambda x: 500000 < x < 510000, trial=1000)
+    sut = choose(0, 10 ** 6, rng=1).such_that(lambda x: 500000 < x < 510000, trial=1000, adaptive=True)
+    for gen in [plain, sut]:
+        values = [gen.generate() for _ in range(300)] + gen.generate_batch(1000)
+        assert all(500000 < value < 510000 for value in values)
+    assert plain.acceptance_rate < 0.05
+    assert sut.acceptance_rate > 0.3
+    assert max(values) - min(values) > 9000
+
+
+def test_given_adaptive_such_that_when_the_gen_maps_values_then_it_filters_them_as_usual():
+    from papylon.gen import choose
+
+    sut = choose(0, 1000, rng=1).map(lambda x: x * 2).such_that(lambda x: x < 100, adaptive=True)
+    assert all(value < 100 and value % 2 == 0 for value in sut.generate_batch(100))
+
+
+def test_given_a_pipeline_when_gen_mapper_and_predicate_are_read_then_they_are_its_last_stages():
+    from papylon.gen import choose
+
+    def double(x):
+        return x * 2
+
+    def is_even(x):
+        return x % 2 == 0
+
+    sut = choose(0, 10).such_that(is_even).map(double)
+    assert sut.mapper is double
+    assert sut.predicate(1)
+    assert sut.map(str).such_that(is_even).predicate is is_even
+    assert sut.such_that(is_even).mapper is double
+    assert choose(0, 10).mapper(3) == 3
@@ -0,0 +1,31 @@
+def test_when_cprofiler_profiles_a_function_then_dumps_prof_file_and_prints_the_hottest_functions(tmp_path):
+    from papylon.profiler import CProfiler
+    import io
+    import pstats
+
+    output = io.StringIO()
+    sut = CProfiler(str(tmp_path), top=5, file=output)
+    actual = sut.profile('group.prop:1', sum, range(1000))
+    assert actual == sum(range(1000))
+    path = tmp_path / 'group.prop_1.prof'
+    assert path.exists()
+    assert pstats.Stats(str(path)).total_calls > 0
+    assert str(path) in output.getvalue()
+    assert 'tottime' in output.getvalue()
+
+
+def test_when_sampling_profiler_profiles_a_function_then_passes_sampled_frames_to_the_callback():
+    from papylon.profiler import SamplingProfiler
+    import time
+
+    samples = []
+
+    def busy():
+        time.sleep(0.05)
+        return 42
+
+    sut = SamplingProfiler(lambda name, frame: samples.append((name, frame.f_code.co_name)), interval=0.005)
+    actual = sut.profile('prop', busy)
+    assert actual == 42
+    assert samples
+    assert ('prop', 'busy') in samples
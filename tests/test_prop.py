@@ -104,3 +104,355 @@ def test_when_prop_takes_arbitrary_instance_with_from_gen_then_prop_can_execute_
     _, _, is_valid, _ = actual.get()
     assert is_valid
     assert not actual.has_stopped()
+
+
+def test_when_prop_prefetches_arguments_then_execute_hands_them_out_one_at_a_time():
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+    import random
+
+    seen = []
+    sut = for_all([arb_int(), arb_int()], lambda x, y: seen.append((x, y)) is None)
+    sut.set_random(random.Random(5))
+    sut.prefetch(3)
+    for _ in range(3):
+        assert sut.execute().has_finished()
+    sut.set_random(random.Random(5))
+    sut.prefetch(3, start=2)
+    sut.execute()
+    assert len(seen) == 4
+    assert len(set(seen[:3])) == 3
+    assert seen[3] == seen[2]
+
+
+def test_when_vectorized_prop_executes_a_block_then_the_function_is_called_once_with_columns():
+    from papylon.prop import for_all_vectorized
+    from papylon.arbitrary import arb_int
+
+    calls = []
+
+    def prop(xs, ys):
+        calls.append(len(xs))
+        return [x == x and y == y for x, y in zip(xs, ys)]
+    sut = for_all_vectorized([arb_int(), arb_int()], prop)
+    sut.prefetch(50)
+    for _ in range(50):
+        actual = sut.execute()
+        assert actual.has_finished()
+        _, inputs, is_valid, _ = actual.get()
+        assert is_valid
+        assert len(inputs) == 2
+    assert calls == [50]
+
+
+def test_when_vectorized_prop_is_falsified_then_its_counter_example_is_shrunk_with_scalar_columns():
+    from papylon.prop import for_all_vectorized
+    from papylon.arbitrary import arb_int
+
+    sut = for_all_vectorized([arb_int()], lambda xs: [x < 100 for x in xs])
+    sut.prefetch(100)
+    for _ in range(100):
+        actual = sut.execute()
+        _, inputs, is_valid, shrunk_number = actual.get()
+        if not is_valid:
+            assert inputs == [100]
+            assert shrunk_number >= 1
+            return
+    assert False
+
+
+def test_given_prop_executor_with_shrink_when_execute_shrink_takes_a_long_list_then_shrinks_it_in_a_few_steps():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import arb_int, arb_list
+
+    evaluated = []
+
+    def prop(xs):
+        evaluated.append(len(xs))
+        return 1234 not in xs
+
+    sut = PropExecutorWithShrink([arb_list(arb_int())], prop, 100)
+    actual = sut.execute_shrinker([list(range(5000))])
+    _, inputs, is_valid, shrunk_number = actual.get()
+    assert not is_valid
+    assert inputs == [[1234]]
+    assert shrunk_number <= 20
+    assert len(evaluated) <= 100
+
+
+def test_given_prop_executor_with_shrink_when_shrinkers_offer_the_same_inputs_then_the_property_runs_once_for_them():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import arb_int
+
+    evaluated = []
+
+    def prop(x):
+        evaluated.append(x)
+        return x < 100
+
+    sut = PropExecutorWithShrink([arb_int()], prop, 100)
+    actual = sut.execute_shrinker([12345])
+    _, inputs, is_valid, _ = actual.get()
+    assert not is_valid
+    assert inputs == [100]
+    assert len(evaluated) == len(set(evaluated))
+    assert actual.cache_hits > 0
+
+
+def test_given_unhashable_inputs_when_execute_shrinker_runs_then_it_shrinks_them_without_cache():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import from_gen_shrink
+    from papylon.gen import constant
+    from papylon.shrinker import AbstractShrinker
+
+    class Box:
+        __hash__ = None
+
+        def __init__(self, n):
+            self.n = n
+
+    class BoxShrinker(AbstractShrinker):
+        def shrink(self, value):
+            return iter([Box(value.n - 1)] if value.n > 0 else [])
+
+    arb = from_gen_shrink(constant(Box(5)), BoxShrinker())
+    sut = PropExecutorWithShrink([arb], lambda box: box.n < 3, 100)
+    actual = sut.execute_shrinker([Box(5)])
+    _, inputs, is_valid, shrunk_number = actual.get()
+    assert not is_valid
+    assert inputs[0].n == 3
+    assert shrunk_number == 2
+    assert actual.cache_hits == 0
+
+
+def test_given_cache_size_as_0_when_execute_shrinker_runs_then_nothing_is_cached():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import arb_int
+
+    sut = PropExecutorWithShrink([arb_int()], lambda x: x < 100, 100, cache_size=0)
+    actual = sut.execute_shrinker([12345])
+    _, inputs, _, _ = actual.get()
+    assert inputs == [100]
+    assert actual.cache_hits == 0
+
+
+def test_given_two_arguments_when_execute_shrinker_runs_then_shrinks_each_of_them_with_the_other_fixed():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import arb_int
+
+    sut = PropExecutorWithShrink([arb_int(), arb_int()], lambda x, y: x < 10 or y < 20, 100)
+    actual = sut.execute_shrinker([123456, 654321])
+    _, inputs, is_valid, _ = actual.get()
+    assert not is_valid
+    assert inputs == [10, 20]
+
+
+def test_given_an_argument_which_runs_out_of_shrinking_when_execute_shrinker_runs_then_shrinks_the_others():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import arb_date, arb_int
+    import datetime
+
+    sut = PropExecutorWithShrink([arb_date(), arb_int()], lambda d, x: x < 100, 100)
+    actual = sut.execute_shrinker([datetime.datetime(2000, 1, 2, 3, 4, 5), 98765])
+    _, inputs, is_valid, _ = actual.get()
+    assert not is_valid
+    assert inputs == [datetime.datetime(2000, 1, 2), 100]
+
+
+def test_given_max_evaluations_when_execute_shrinker_runs_out_of_it_then_returns_the_smallest_inputs_so_far():
+    from papylon.prop import PropExecutorWithShrink, PropResult
+    from papylon.arbitrary import arb_int
+
+    evaluated = []
+
+    def prop(x):
+        evaluated.append(x)
+        return x < 100
+
+    sut = PropExecutorWithShrink([arb_int()], prop, 100, max_evaluations=5)
+    actual = sut.execute_shrinker([1000000])
+    assert actual.has_finished()
+    _, inputs, is_valid, _ = actual.get()
+    assert not is_valid
+    assert len(evaluated) == 5
+    assert 100 <= inputs[0] < 1000000
+    assert actual.exhausted_budget == PropResult.EVALUATIONS_BUDGET
+
+
+def test_given_shrink_timeout_when_execute_shrinker_runs_out_of_it_then_stops_gracefully():
+    from papylon.prop import PropExecutorWithShrink, PropResult
+    from papylon.arbitrary import arb_int
+    import time
+
+    def prop(x):
+        time.sleep(0.01)
+        return x < 100
+
+    sut = PropExecutorWithShrink([arb_int()], prop, 100, shrink_timeout=0.05)
+    start = time.time()
+    actual = sut.execute_shrinker([10 ** 18])
+    elapsed = time.time() - start
+    _, inputs, is_valid, _ = actual.get()
+    assert not is_valid
+    assert inputs[0] >= 100
+    assert elapsed < 0.5
+    assert actual.exhausted_budget == PropResult.TIME_BUDGET
+
+
+def test_given_max_shrinks_when_for_all_creates_a_property_then_shrinking_stops_at_it():
+    from papylon.prop import for_all, PropResult
+    from papylon.arbitrary import arb_int
+
+    sut = for_all([arb_int()], lambda x: x >= 2000 or x == 0, max_shrinks=3)
+    actual = sut.shrink([1000])
+    _, _, is_valid, shrunk_number = actual.get()
+    assert not is_valid
+    assert shrunk_number == 3
+    assert actual.exhausted_budget == PropResult.SHRINKS_BUDGET
+
+
+def test_given_max_shrinks_as_the_shrinks_it_takes_when_a_property_fails_then_no_budget_is_exhausted():
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    sut = for_all([arb_int()], lambda x: x < 5, max_shrinks=9)
+    actual = sut.shrink([1000])
+    assert actual.get()[1:] == ([5], False, 9)
+    assert actual.exhausted_budget is None
+
+
+def test_given_shrink_workers_when_execute_shrinker_runs_on_threads_then_returns_the_same_inputs_as_sequential():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import arb_int, arb_list
+    import time
+
+    def prop(x, xs):
+        time.sleep(0.001)
+        return x < 10 or len(xs) < 3
+
+    sequential = PropExecutorWithShrink([arb_int(), arb_list(arb_int())], prop, 100)
+    sut = PropExecutorWithShrink([arb_int(), arb_list(arb_int())], prop, 100, shrink_workers=4)
+    expected = sequential.execute_shrinker([123456, [5, 4, 3, 2, 1]])
+    actual = sut.execute_shrinker([123456, [5, 4, 3, 2, 1]])
+    assert actual.get() == expected.get()
+    _, inputs, is_valid, _ = actual.get()
+    assert not is_valid
+    assert inputs == [10, [5, 4, 3]]
+
+
+def test_given_shrink_workers_on_processes_when_execute_shrinker_runs_then_shrinks_the_counter_example():
+    from papylon.prop import for_all, PropExecutor
+    from papylon.arbitrary import arb_int
+
+    sut = for_all([arb_int(), arb_int()], lambda x, y: x < 10 or y < 20,
+                  shrink_workers=2, shrink_pool=PropExecutor.PROCESS_POOL)
+    actual = sut.shrink([123456, 654321])
+    _, inputs, is_valid, _ = actual.get()
+    assert not is_valid
+    assert inputs == [10, 20]
+
+
+def test_given_shrink_workers_when_the_property_raises_an_exception_then_stops_with_the_inputs_raising_it():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import arb_int
+
+    def prop(x):
+        if x < 100:
+            raise ValueError(x)
+        return False
+
+    sut = PropExecutorWithShrink([arb_int()], prop, 100, shrink_workers=3)
+    actual = sut.execute_shrinker([1000])
+    assert actual.has_stopped()
+    _, inputs, error = actual.get()
+    assert isinstance(error, ValueError)
+    assert inputs[0] < 100
+
+
+def test_given_an_unknown_shrink_pool_when_prop_executor_is_created_then_raises_value_error():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import arb_int
+    import pytest
+
+    with pytest.raises(ValueError):
+        PropExecutorWithShrink([arb_int()], lambda x: True, 100, shrink_pool="fiber")
+
+
+def test_given_an_integrated_arbitrary_when_a_property_fails_then_shrinks_to_the_smallest_mapped_value():
+    from papylon.prop import for_all
+    from papylon.gen import choose
+    from papylon.arbitrary import from_gen_integrated
+
+    arb = from_gen_integrated(choose(0, 1000, rng=1).map(lambda x: x * 2))
+    sut = for_all([arb], lambda x: x < 100)
+    _, inputs, is_valid, _ = sut.execute().get()
+    assert not is_valid
+    assert inputs == [100]
+
+
+def test_given_for_all_choices_when_a_property_fails_then_shrinks_the_choices_of_arguments_without_shrinkers():
+    from papylon.prop import for_all_choices
+    from papylon.gen import choose
+    from papylon.arbitrary import from_gen
+    import random
+
+    sut = for_all_choices([from_gen(choose(0, 10000))], lambda x: x < 100)
+    sut.set_random(random.Random(3))
+    actual = sut.execute()
+    while actual.get()[2]:
+        actual = sut.execute()
+    _, inputs, _, shrunk_number = actual.get()
+    assert inputs == [100]
+    assert shrunk_number >= 1
+    assert len(actual.choices) == 2
+
+    replayed = sut.execute_choices(actual.choices, shrink=False)
+    assert replayed.get()[1] == [100]
+
+
+def test_when_a_property_executes_choices_then_makes_the_arguments_from_them():
+    from papylon.prop import for_all
+    from papylon.arbitrary import arb_int
+
+    sut = for_all([arb_int()], lambda x: x != 0)
+    actual = sut.execute_choices(b'')
+    _, inputs, is_valid, _ = actual.get()
+    assert inputs == [0]
+    assert not is_valid
+
+
+def test_given_for_all_choices_when_a_property_of_ints_fails_then_shrinks_them_towards_0():
+    from papylon.prop import for_all_choices
+    from papylon.arbitrary import arb_int
+    from papylon.checker import PropChecker
+
+    result = PropChecker(100, seed=1).check(for_all_choices([arb_int()], lambda x: abs(x) < 100))
+    assert result.has_falsified()
+    _, inputs, _ = result.get()
+    assert abs(inputs[0]) == 100
+
+
+def test_given_a_large_array_when_execute_shrinker_runs_then_shrinks_it_to_the_failing_element():
+    from papylon.prop import PropExecutorWithShrink
+    from papylon.arbitrary import arb_array
+    import array
+
+    value = array.array('q', range(100000))
+    sut = PropExecutorWithShrink([arb_array('q')], lambda a: 77777 not in a, 1000)
+    actual = sut.execute_shrinker([value])
+    _, inputs, is_valid, _ = actual.get()
+    assert not is_valid
+    assert inputs == [array.array('q', [77777])]
+
+
+def test_given_an_integrated_arbitrary_for_two_arguments_when_a_property_fails_then_shrinks_both_of_them():
+    from papylon.prop import for_all
+    from papylon.gen import choose
+    from papylon.arbitrary import from_gen_integrated
+
+    arb = from_gen_integrated(choose(0, 10 ** 9, rng=1).map(lambda x: x * 2))
+    sut = for_all([arb, arb], lambda x, y: x < 1000)
+    sut.prefetch(10)
+    _, inputs, is_valid, _ = sut.execute().get()
+    assert not is_valid
+    assert inputs == [1000, 0]
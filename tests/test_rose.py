@@ -0,0 +1,42 @@
+def test_when_rose_is_unfolded_with_a_shrinker_then_its_children_are_the_shrunk_values():
+    from papylon.rose import Rose
+    from papylon.shrinker import IntShrinker
+
+    sut = Rose.unfold(8, IntShrinker().shrink)
+    assert sut.value == 8
+    assert [child.value for child in sut.children()] == list(IntShrinker().shrink(8))
+    grandchildren = [child.value for child in next(sut.children()).children()]
+    assert grandchildren == []
+
+
+def test_when_rose_is_unfolded_then_children_are_computed_only_when_visited():
+    from papylon.rose import Rose
+
+    visited = []
+
+    def shrink(value):
+        visited.append(value)
+        return [value // 2] if value > 0 else []
+
+    sut = Rose.unfold(100, shrink)
+    assert visited == []
+    child = next(sut.children())
+    assert child.value == 50
+    assert visited == [100]
+
+
+def test_when_rose_is_mapped_and_filtered_then_its_descendants_are_mapped_and_filtered():
+    from papylon.rose import Rose
+
+    sut = Rose.unfold(10, lambda x: range(x)).map(lambda x: x * 3).filter(lambda x: x % 2 == 0)
+    assert sut.value == 30
+    children = list(sut.children())
+    assert [child.value for child in children] == [0, 6, 12, 18, 24]
+    assert [child.value for child in children[2].children()] == [0, 6]
+
+
+def test_when_rose_has_no_children_then_children_returns_an_empty_iterator():
+    from papylon.rose import Rose
+
+    sut = Rose(1)
+    assert list(sut.children()) == []
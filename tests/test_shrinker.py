@@ -22,6 +22,15 @@ class TestIntShrinker:
         actual = list(sut.shrink(0))
         assert actual == []
 
+    def test_when_shrink_takes_a_large_value_then_halves_it_exactly(self):
+        from papylon.shrinker import IntShrinker
+        import itertools
+
+        sut = IntShrinker()
+        actual = list(itertools.islice(sut.shrink(2 ** 62 + 1), 5))
+        expected = [0, 2 ** 61 + 1, -(2 ** 61 + 1), 2 ** 61 + 2 ** 60 + 1, -(2 ** 61 + 2 ** 60 + 1)]
+        assert actual == expected
+
 
 class TestFloatShrinker:
     def test_when_shrink_takes_positive_value_then_returns_a_iterable_with_values_smaller_than_arg(self):
@@ -72,6 +81,17 @@ class TestFloatShrinker:
         actual = list(sut.shrink(float('nan')))
         assert actual == [0.0]
 
+    def test_when_shrink_takes_a_huge_value_then_returns_candidates_lazily(self):
+        from papylon.shrinker import FloatShrinker
+        import itertools
+
+        sut = FloatShrinker()
+        shrunk = sut.shrink(1e308)
+        assert not isinstance(shrunk, list)
+        actual = list(itertools.islice(shrunk, 3))
+        assert actual == [0.0, 5e307, -5e307]
+        assert len(list(shrunk)) > 2000
+
 
 class TestCharShrinker:
     def test_when_shrink_takes_upper_character_then_returns_a_list_with_a_b_c(self):
@@ -146,7 +166,7 @@ class TestListShrinker:
 
         sut = ListShrinker()
         actual = list(sut.shrink([1, 2, 3]))
-        expected = [[2, 3], [1, 3], [1, 2]]
+        expected = [[], [3], [1, 2], [2, 3], [1, 3]]
         assert actual == expected
 
     def test_when_shrink_takes_a_1_element_list_then_returns_a_list_contains_an_empty_list(self):
@@ -163,6 +183,15 @@ class TestListShrinker:
         actual = list(sut.shrink([]))
         assert actual == []
 
+    def test_when_shrink_takes_a_long_list_then_deletes_halves_before_single_elements(self):
+        from papylon.shrinker import ListShrinker
+        import itertools
+
+        sut = ListShrinker()
+        value = list(range(5000))
+        actual = list(itertools.islice(sut.shrink(value), 3))
+        assert actual == [[], value[2500:], value[:2500]]
+
 
 class TestStrShrinker:
     def test_when_shrink_takes_a_string_then_returns_a_iterable_with_new_smaller_strings(self):
@@ -170,7 +199,7 @@ class TestStrShrinker:
 
         sut = StrShrinker()
         actual = list(sut.shrink('Spam'))
-        expected = ['pam', 'Sam', 'Spm', 'Spa']
+        expected = ['', 'am', 'Sp', 'pam', 'Sam', 'Spm', 'Spa']
         assert actual == expected
 
     def test_when_shrink_takes_a_empty_string_then_returns_a_empty_list(self):
@@ -179,3 +208,55 @@ class TestStrShrinker:
         sut = StrShrinker()
         actual = list(sut.shrink(''))
         assert actual == []
+
+
+class TestChoiceShrinker:
+    def test_when_shrink_takes_bytes_then_every_shrunk_bytes_is_shorter_or_lexicographically_smaller(self):
+        from papylon.shrinker import ChoiceShrinker
+
+        sut = ChoiceShrinker()
+        value = b'\x05\x00\xff'
+        actual = list(sut.shrink(value))
+        assert actual[0] == b''
+        assert b'\x00\x00\xff' in actual
+        assert b'\x04\xff\xff' in actual
+        assert all((len(shrunk), shrunk) < (len(value), value) for shrunk in actual)
+
+    def test_when_shrink_takes_empty_bytes_then_returns_a_empty_list(self):
+        from papylon.shrinker import ChoiceShrinker
+
+        sut = ChoiceShrinker()
+        actual = list(sut.shrink(b''))
+        assert actual == []
+
+
+class TestArrayShrinker:
+    def test_when_shrink_takes_an_array_then_deletes_chunks_and_then_zeroes_them(self):
+        from papylon.shrinker import ArrayShrinker
+        import array
+
+        sut = ArrayShrinker()
+        value = array.array('q', [5, 0, 7])
+        actual = list(sut.shrink(value))
+        assert all(isinstance(shrunk, array.array) and shrunk.typecode == 'q' for shrunk in actual)
+        assert actual[0] == array.array('q')
+        assert array.array('q', [0, 0, 0]) in actual
+        assert array.array('q', [5, 0, 0]) in actual
+        assert value not in actual
+
+    def test_when_shrink_takes_an_empty_array_then_returns_a_empty_list(self):
+        from papylon.shrinker import ArrayShrinker
+        import array
+
+        sut = ArrayShrinker()
+        actual = list(sut.shrink(array.array('d')))
+        assert actual == []
+
+    def test_given_bounds_without_0_when_shrink_takes_an_array_then_fills_chunks_with_the_bound_closest_to_0(self):
+        from papylon.shrinker import ArrayShrinker
+        import array
+
+        sut = ArrayShrinker(min_value=1, max_value=10)
+        actual = list(sut.shrink(array.array('q', [5, 1, 7])))
+        assert array.array('q', [1, 1, 1]) in actual
+        assert all(1 <= number <= 10 for shrunk in actual for number in shrunk)
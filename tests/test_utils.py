@@ -214,3 +214,28 @@ def test_given_unknown_result_when_assert_result_then_raise_assertion_error():
         assert False
     except AssertionError as aes:
         assert str(aes) == "[Papylon] CheckResult doesn't have any known result types."
+
+
+def test_given_falsified_result_with_exhausted_budget_when_convert_to_output_then_return_message_with_the_budget():
+    from papylon.utils import convert_to_outputs
+    from papylon.checker import CheckResult
+
+    result = CheckResult.falsify(3, [42], 100)
+    result.exhausted_budget = "max_shrinks"
+    message, is_ok, _ = convert_to_outputs(result)
+    expected = "Falsified after 3 tests (100 shrinks, stopped by max_shrinks):\n> [42]"
+    assert message == expected
+    assert not is_ok
+
+
+def test_given_passed_result_with_timing_when_convert_to_output_then_appends_the_time_of_phases():
+    from papylon.utils import convert_to_outputs
+    from papylon.checker import CheckResult, CheckTiming
+
+    result = CheckResult.pass_all(4)
+    result.timing = CheckTiming(2 * 10 ** 9, [1000000, 2000000, 3000000, 4000000], 5 * 10 ** 8, 10 ** 9, 0)
+    text, is_proved, _ = convert_to_outputs(result)
+    assert is_proved
+    assert text == ("OK, passed 4 tests.\n"
+                    "Took 2.000 s (2.0 tests/s): p50 2.000 ms, p99 4.000 ms per test, "
+                    "generation 0.500 s, property 1.000 s, shrinking 0.000 s.")